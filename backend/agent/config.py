@@ -2,6 +2,8 @@
 Configuration management for MCP Blog Server.
 """
 
+from typing import Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -25,16 +27,82 @@ class Settings(BaseSettings):
     # Gemini API settings
     gemini_api_key: str = Field(..., description="Google Gemini API key")
     gemini_model: str = "gemini-2.0-flash"
+    gemini_max_concurrency: int = Field(default=8, ge=1, description="Maximum in-flight Gemini calls")
+    gemini_requests_per_minute: float = Field(default=60.0, gt=0, description="Gemini request quota")
+    gemini_tokens_per_minute: Optional[float] = Field(default=1_000_000.0, description="Gemini input token quota")
+    gemini_max_output_tokens: int = Field(default=4000, ge=1, description="Output-token budget for the quality tier")
+    gemini_fast_model: str = "gemini-2.0-flash-lite"
+    gemini_fast_max_output_tokens: int = Field(default=2048, ge=1, description="Output-token budget for the fast tier")
+    routing_enabled: bool = Field(default=True, description="Route short requests to the fast tier")
+    routing_short_notes_chars: int = Field(default=1500, ge=0, description="Longest notes routed to the fast tier")
+    routing_max_fast_tags: int = Field(default=3, ge=0, description="Most tags routed to the fast tier")
+    gemini_fallback_model: Optional[str] = Field(default=None, description="Model raced against slow primary calls")
+    gemini_hedge_percentile: float = Field(default=0.95, gt=0, lt=1, description="Primary latency quantile that triggers a hedge")
+    gemini_hedge_delay_seconds: float = Field(default=10.0, ge=0, description="Hedge delay used until enough latencies are seen")
     
     # Hashnode API settings
     hashnode_api_url: str = "https://gql.hashnode.com/"
     hashnode_token: str = Field(..., description="Hashnode API token")
     hashnode_publication_id: str = Field(..., description="Hashnode publication ID")
+    hashnode_http2: bool = True
+    hashnode_max_connections: int = 20
+    hashnode_max_keepalive_connections: int = 10
+    hashnode_keepalive_expiry: float = 30.0
+    hashnode_connect_timeout: float = 5.0
+    hashnode_read_timeout: float = 30.0
+    hashnode_requests_per_minute: float = Field(default=120.0, gt=0, description="Hashnode request quota")
+    publication_cache_ttl_seconds: float = 300.0
+    publication_cache_max_stale_seconds: float = 86400.0
+    hashnode_publish_chunk_size: int = Field(default=10, ge=1, description="Posts per batched publish request")
+    hashnode_tag_cache_ttl_seconds: float = Field(default=3600.0, gt=0, description="How long resolved Hashnode tag IDs are reused")
     
     # Blog generation settings
     max_title_length: int = 200
     max_notes_length: int = 5000
-    generation_timeout: int = 30
+    generation_timeout: float = Field(default=30.0, gt=0, description="Deadline in seconds for a single generation")
+    max_longform_notes_length: int = 50000
+    reading_words_per_minute: int = Field(default=200, ge=1, description="Reading speed used for reading-time estimates")
+    longform_max_sections: int = Field(default=8, ge=1, description="Maximum sections in a long-form post")
+    longform_section_concurrency: int = Field(default=4, ge=1, description="Sections drafted concurrently per long-form post")
+    longform_outline_max_output_tokens: int = Field(default=2048, ge=1, description="Output-token budget for long-form outlines")
+    batch_max_items: int = Field(default=50, ge=1, description="Maximum posts per batch request")
+    batch_max_concurrency: int = Field(default=5, ge=1, description="Concurrent generations per batch request")
+    
+    # Retry settings for upstream calls
+    retry_max_attempts: int = Field(default=4, ge=1, description="Total attempts per upstream call")
+    retry_base_delay_seconds: float = 0.5
+    retry_max_delay_seconds: float = 30.0
+    
+    # Health probe settings
+    health_probe_interval_seconds: float = 30.0
+    health_probe_timeout_seconds: float = 5.0
+    
+    # Storage settings
+    data_dir: str = "data"
+    
+    # Idempotency settings for publish endpoints
+    idempotency_ttl_seconds: float = Field(default=86400.0, gt=0, description="How long publish results are replayed")
+    
+    # Draft store settings
+    drafts_page_size: int = Field(default=20, ge=1, description="Drafts returned per page by default")
+    drafts_max_page_size: int = Field(default=100, ge=1, description="Maximum drafts a client may request per page")
+    
+    # Generation cache settings
+    generation_cache_enabled: bool = True
+    generation_cache_max_entries: int = 256
+    generation_cache_ttl_seconds: int = 3600
+    generation_cache_persistent: bool = False
+    
+    # Publish outbox settings
+    outbox_workers: int = Field(default=2, ge=1, description="Concurrent outbox publishing workers")
+    outbox_max_attempts: int = Field(default=8, ge=1, description="Publish attempts before an outbox entry fails")
+    outbox_base_delay_seconds: float = 5.0
+    outbox_max_delay_seconds: float = 600.0
+    
+    # Background job settings
+    job_workers: int = Field(default=4, ge=1, description="Number of job worker tasks")
+    job_queue_size: int = Field(default=100, ge=1, description="Maximum queued jobs")
+    job_retention: int = Field(default=1000, ge=1, description="Maximum jobs kept for status lookups")
 
 
 # Global settings instance
@@ -0,0 +1,86 @@
+"""
+FastAPI dependency providers for MCP Blog Server.
+
+Services are built once in the application lifespan and stored on
+``app.state``; routes receive them through these providers so tests can
+swap them out with ``app.dependency_overrides``.
+
+Background components (the publish outbox, job workers, long-form service
+and health prober) are built at startup, outside any request, and take
+their Gemini and Hashnode services from ``resolve_startup_dependency``.
+An override installed before startup therefore reaches them too.
+"""
+
+from typing import Callable, Optional, TypeVar
+
+from fastapi import FastAPI, Request
+
+from .services.draft_store import DraftStore
+from .services.gemini_service import GeminiService
+from .services.generation_cache import GenerationCache
+from .services.hashnode_service import HashnodeService
+from .services.health_prober import HealthProber
+from .services.job_service import JobManager
+from .services.longform_service import LongformService
+from .services.publish_outbox import PublishOutbox
+
+T = TypeVar("T")
+
+
+def resolve_startup_dependency(app: FastAPI, provider: Callable[..., T], default: T) -> T:
+    """
+    Return the service supplied by an override of ``provider``, or ``default``.
+
+    Used in the lifespan to wire background components, so overrides used
+    there must not take arguments (no ``Request`` exists at startup).
+
+    Args:
+        app: The application whose ``dependency_overrides`` are consulted
+        provider: Dependency provider, e.g. ``get_hashnode_service``
+        default: Service to use when the provider is not overridden
+
+    Returns:
+        The overriding service, or ``default``
+    """
+    override = app.dependency_overrides.get(provider)
+    return override() if override is not None else default
+
+
+def get_gemini_service(request: Request) -> GeminiService:
+    """Return the shared Gemini service."""
+    return request.app.state.gemini_service
+
+
+def get_hashnode_service(request: Request) -> HashnodeService:
+    """Return the shared Hashnode service."""
+    return request.app.state.hashnode_service
+
+
+def get_longform_service(request: Request) -> LongformService:
+    """Return the shared long-form generation service."""
+    return request.app.state.longform_service
+
+
+def get_generation_cache(request: Request) -> Optional[GenerationCache]:
+    """Return the shared generation cache, or None when caching is disabled."""
+    return request.app.state.generation_cache
+
+
+def get_job_manager(request: Request) -> JobManager:
+    """Return the shared background job manager."""
+    return request.app.state.job_manager
+
+
+def get_draft_store(request: Request) -> DraftStore:
+    """Return the store of generated drafts."""
+    return request.app.state.draft_store
+
+
+def get_publish_outbox(request: Request) -> PublishOutbox:
+    """Return the durable publish outbox."""
+    return request.app.state.publish_outbox
+
+
+def get_health_prober(request: Request) -> HealthProber:
+    """Return the background dependency prober."""
+    return request.app.state.health_prober
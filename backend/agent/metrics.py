@@ -0,0 +1,120 @@
+"""
+Prometheus metrics for MCP Blog Server.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from fastapi.responses import JSONResponse
+from prometheus_client import Counter, Gauge, Histogram
+
+from .timing import current_timings
+
+# Buckets sized for LLM-backed requests, from cache hits up to long generations
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests handled, by route and status code",
+    ["method", "route", "status"]
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency, by route",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS
+)
+
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled, by route",
+    ["method", "route"]
+)
+
+STAGE_DURATION = Histogram(
+    "blog_stage_duration_seconds",
+    "Latency of individual pipeline stages",
+    ["stage"],
+    buckets=LATENCY_BUCKETS
+)
+
+UPSTREAM_REQUESTS_IN_FLIGHT = Gauge(
+    "upstream_requests_in_flight",
+    "Outbound requests currently in flight, by upstream",
+    ["upstream"]
+)
+
+UPSTREAM_ERRORS = Counter(
+    "upstream_errors_total",
+    "Failed upstream calls, by upstream and error code",
+    ["upstream", "error_code"]
+)
+
+GEMINI_ROUTES = Counter(
+    "gemini_route_selections_total",
+    "Generation requests by model tier and model",
+    ["route", "model"]
+)
+
+GEMINI_REQUEST_DURATION = Histogram(
+    "gemini_request_duration_seconds",
+    "Latency of individual Gemini generate calls, by model",
+    ["model"],
+    buckets=LATENCY_BUCKETS
+)
+
+GEMINI_HEDGES = Counter(
+    "gemini_hedged_requests_total",
+    "Generations that raced the fallback model, by which model won",
+    ["winner"]
+)
+
+GEMINI_TOKENS = Counter(
+    "gemini_tokens_total",
+    "Gemini tokens reported in response usage metadata",
+    ["kind"]
+)
+
+
+@contextmanager
+def observe_stage(stage: str) -> Iterator[None]:
+    """
+    Record how long the enclosed block takes as a pipeline stage.
+
+    The duration goes to the stage histogram and, when a request is being
+    handled, to that request's timings.
+    """
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start_time
+        STAGE_DURATION.labels(stage=stage).observe(duration)
+
+        timings = current_timings()
+        if timings is not None:
+            timings.record(stage, duration)
+
+
+def record_gemini_usage(response: Any) -> None:
+    """Count prompt and output tokens from a Gemini response's usage metadata."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+
+    prompt_tokens = getattr(usage, "prompt_token_count", 0) or 0
+    output_tokens = getattr(usage, "candidates_token_count", 0) or 0
+    if prompt_tokens:
+        GEMINI_TOKENS.labels(kind="prompt").inc(prompt_tokens)
+    if output_tokens:
+        GEMINI_TOKENS.labels(kind="output").inc(output_tokens)
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse that records serialization time as a pipeline stage."""
+
+    def render(self, content: Any) -> bytes:
+        with observe_stage("json_serialization"):
+            return super().render(content)
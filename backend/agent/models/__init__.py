@@ -2,13 +2,44 @@
 Pydantic models for MCP Blog Server.
 """
 
-from .blog import BlogRequest, BlogResponse, BlogPost
-from .hashnode import HashnodePublishRequest, HashnodePublishResponse
+from .blog import (
+    BlogRequest,
+    BlogResponse,
+    BlogPost,
+    BatchBlogRequest,
+    BatchBlogResponse,
+    BatchPublishRequest,
+    HeadingEntry,
+    LongformBlogRequest,
+    PostMetadata,
+)
+from .hashnode import HashnodePublishRequest, HashnodePublishResponse, BatchPublishResponse
+from .draft import Draft, DraftListResponse, DraftSummary, PublishDraftRequest
+from .health import DependencyHealth
+from .job import Job, JobStatus, JobSubmitResponse
+from .outbox import OutboxEntry, OutboxStatus
 
 __all__ = [
     "BlogRequest",
     "BlogResponse", 
     "BlogPost",
+    "BatchBlogRequest",
+    "BatchBlogResponse",
+    "BatchPublishRequest",
+    "HeadingEntry",
+    "LongformBlogRequest",
+    "PostMetadata",
     "HashnodePublishRequest",
-    "HashnodePublishResponse"
+    "HashnodePublishResponse",
+    "BatchPublishResponse",
+    "Draft",
+    "DraftListResponse",
+    "DraftSummary",
+    "PublishDraftRequest",
+    "DependencyHealth",
+    "Job",
+    "JobStatus",
+    "JobSubmitResponse",
+    "OutboxEntry",
+    "OutboxStatus"
 ] 
\ No newline at end of file
@@ -3,9 +3,11 @@ Blog-related Pydantic models.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 from pydantic import BaseModel, Field, validator
 
+from ..config import settings
+
 
 class BlogRequest(BaseModel):
     """Request model for blog generation."""
@@ -14,6 +16,11 @@ class BlogRequest(BaseModel):
     notes: str = Field(..., min_length=1, max_length=5000, description="Rough notes for the blog post")
     tags: Optional[List[str]] = Field(default=None, description="Optional tags for the blog post")
     publish_immediately: bool = Field(default=False, description="Whether to publish immediately to Hashnode")
+    use_cache: bool = Field(default=True, description="Whether an identical cached generation may be reused")
+    optimize_for: Optional[Literal["quality", "latency"]] = Field(
+        default=None,
+        description="Prefer the quality or the fast model tier instead of choosing by notes size"
+    )
     
     @validator('title')
     def validate_title(cls, v):
@@ -34,6 +41,41 @@ class BlogRequest(BaseModel):
         return v
 
 
+class LongformBlogRequest(BlogRequest):
+    """
+    Request model for long-form generation from extensive notes.
+    
+    Same fields and validation as BlogRequest, with a longer notes limit.
+    Long-form drafts are not cached, so ``use_cache`` has no effect.
+    """
+    
+    notes: str = Field(
+        ...,
+        min_length=1,
+        max_length=settings.max_longform_notes_length,
+        description="Research notes for the blog post"
+    )
+
+
+class HeadingEntry(BaseModel):
+    """A heading in a post's outline."""
+    
+    level: int = Field(..., ge=1, le=6, description="Heading level (1 for #, 2 for ##, ...)")
+    text: str = Field(..., description="Heading text")
+    anchor: str = Field(..., description="Fragment identifier for linking to the heading")
+
+
+class PostMetadata(BaseModel):
+    """Structure and statistics derived from a post's markdown."""
+    
+    word_count: int = Field(default=0, description="Words outside code blocks")
+    reading_time_minutes: int = Field(default=0, description="Estimated reading time")
+    headings: List[HeadingEntry] = Field(default_factory=list, description="Headings in document order")
+    table_of_contents: str = Field(default="", description="Markdown table of contents built from the section headings")
+    code_languages: List[str] = Field(default_factory=list, description="Distinct code block languages, in order of first use")
+    code_blocks: int = Field(default=0, description="Number of fenced code blocks")
+
+
 class BlogPost(BaseModel):
     """Generated blog post model."""
     
@@ -41,6 +83,9 @@ class BlogPost(BaseModel):
     content: str = Field(..., description="Generated markdown content")
     tags: Optional[List[str]] = Field(default=None, description="Blog post tags")
     summary: Optional[str] = Field(default=None, description="Blog post summary")
+    model: Optional[str] = Field(default=None, description="Gemini model that generated the post")
+    route: Optional[str] = Field(default=None, description="Model tier the request was routed to")
+    metadata: Optional[PostMetadata] = Field(default=None, description="Outline and statistics of the content")
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
 
 
@@ -50,10 +95,36 @@ class BlogResponse(BaseModel):
     success: bool = Field(..., description="Whether the generation was successful")
     blog_post: Optional[BlogPost] = Field(default=None, description="Generated blog post")
     hashnode_url: Optional[str] = Field(default=None, description="Published Hashnode URL")
+    draft_id: Optional[int] = Field(default=None, description="Draft the generated post was stored as")
+    outbox_id: Optional[int] = Field(default=None, description="Outbox entry tracking the queued publish")
+    publish_status: Optional[str] = Field(default=None, description="Status of the queued publish")
     message: str = Field(..., description="Response message")
     generation_time_seconds: Optional[float] = Field(default=None, description="Time taken to generate content")
+    timings: Optional[Dict[str, float]] = Field(default=None, description="Per-stage durations in milliseconds")
     
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
-        } 
\ No newline at end of file
+        } 
+
+
+class BatchBlogRequest(BaseModel):
+    """Request model for generating several blog posts at once."""
+    
+    items: List[BlogRequest] = Field(..., min_length=1, description="Blog generation requests")
+
+
+class BatchPublishRequest(BaseModel):
+    """Request model for publishing several blog posts at once."""
+    
+    posts: List[BlogPost] = Field(..., min_length=1, description="Blog posts to publish")
+
+
+class BatchBlogResponse(BaseModel):
+    """Response model for batch blog generation."""
+    
+    success: bool = Field(..., description="Whether every item was generated successfully")
+    results: List[BlogResponse] = Field(..., description="Per-item responses, in request order")
+    succeeded: int = Field(..., description="Number of items generated successfully")
+    failed: int = Field(..., description="Number of items that failed")
+    total_time_seconds: float = Field(..., description="Wall time for the whole batch")
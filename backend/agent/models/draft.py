@@ -0,0 +1,39 @@
+"""
+Draft store Pydantic models.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class DraftSummary(BaseModel):
+    """A stored generation, without its body."""
+
+    id: int = Field(..., description="Draft ID")
+    title: str = Field(..., description="Blog post title")
+    tags: Optional[List[str]] = Field(default=None, description="Blog post tags")
+    summary: Optional[str] = Field(default=None, description="Blog post summary")
+    model: Optional[str] = Field(default=None, description="Gemini model that generated the post")
+    route: Optional[str] = Field(default=None, description="Model tier the request was routed to")
+    created_at: datetime = Field(..., description="When the post was generated")
+
+
+class Draft(DraftSummary):
+    """A stored generation with its markdown body and stage timings."""
+
+    content: str = Field(..., description="Generated markdown content")
+    timings: Optional[Dict[str, float]] = Field(default=None, description="Per-stage durations of the generation in milliseconds")
+
+
+class DraftListResponse(BaseModel):
+    """One page of drafts, newest first."""
+
+    drafts: List[DraftSummary] = Field(..., description="Drafts on this page")
+    next_cursor: Optional[int] = Field(default=None, description="Cursor for the next page, or null on the last page")
+
+
+class PublishDraftRequest(BaseModel):
+    """Request to publish a stored draft."""
+
+    draft_id: int = Field(..., description="ID of the draft to publish")
@@ -24,6 +24,17 @@ class HashnodePublishResponse(BaseModel):
     post_url: Optional[str] = Field(default=None, description="Published post URL")
     message: str = Field(..., description="Response message")
     error_code: Optional[str] = Field(default=None, description="Error code if failed")
+    retryable: bool = Field(default=False, description="Whether publishing again may succeed (rate limiting, server or network errors)")
+    replayed: bool = Field(default=False, description="Whether this is a stored result for a repeated idempotency key")
+
+
+class BatchPublishResponse(BaseModel):
+    """Response model for publishing several posts at once."""
+    
+    success: bool = Field(..., description="Whether every post was published")
+    results: List[HashnodePublishResponse] = Field(..., description="Per-post responses, in request order")
+    succeeded: int = Field(..., description="Number of posts published")
+    failed: int = Field(..., description="Number of posts that failed")
 
 
 class HashnodeTag(BaseModel):
@@ -0,0 +1,18 @@
+"""
+Health check Pydantic models.
+"""
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class DependencyHealth(BaseModel):
+    """Last probe result for an upstream dependency."""
+    
+    status: str = Field(default="unknown", description="unknown, connected or error")
+    latency_ms: Optional[float] = Field(default=None, description="Latency of the last probe")
+    last_error: Optional[str] = Field(default=None, description="Error from the last failed probe")
+    checked_at: Optional[datetime] = Field(default=None, description="When the last probe finished")
+    last_success_at: Optional[datetime] = Field(default=None, description="When the last successful probe finished")
+    detail: Optional[str] = Field(default=None, description="Extra information, e.g. the publication title")
@@ -0,0 +1,49 @@
+"""
+Background job Pydantic models.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel, Field
+
+from .blog import BlogRequest, BlogResponse
+
+
+class JobStatus(str, Enum):
+    """Lifecycle stages of a generation job."""
+    
+    QUEUED = "queued"
+    GENERATING = "generating"
+    PUBLISHING = "publishing"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class JobTimestamps(BaseModel):
+    """Time each stage of a job was entered."""
+    
+    queued_at: datetime = Field(default_factory=datetime.now, description="When the job was accepted")
+    generating_at: Optional[datetime] = Field(default=None, description="When generation started")
+    publishing_at: Optional[datetime] = Field(default=None, description="When queueing for publishing started")
+    done_at: Optional[datetime] = Field(default=None, description="When the job finished")
+
+
+class Job(BaseModel):
+    """A queued generation (and optional publish) job."""
+    
+    id: str = Field(..., description="Job ID")
+    status: JobStatus = Field(default=JobStatus.QUEUED, description="Current job status")
+    request: BlogRequest = Field(..., description="Original generation request")
+    timestamps: JobTimestamps = Field(default_factory=JobTimestamps, description="Per-stage timestamps")
+    result: Optional[BlogResponse] = Field(default=None, description="Generation result once done")
+    error: Optional[str] = Field(default=None, description="Error message if the job failed")
+
+
+class JobSubmitResponse(BaseModel):
+    """Response model for job submission."""
+    
+    success: bool = Field(..., description="Whether the job was accepted")
+    job_id: str = Field(..., description="Job ID to poll")
+    status: JobStatus = Field(..., description="Initial job status")
+    message: str = Field(..., description="Response message")
@@ -0,0 +1,32 @@
+"""
+Publish outbox Pydantic models.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class OutboxStatus(str, Enum):
+    """Lifecycle of a queued publish."""
+
+    PENDING = "pending"
+    PUBLISHING = "publishing"
+    PUBLISHED = "published"
+    FAILED = "failed"
+
+
+class OutboxEntry(BaseModel):
+    """A post waiting to be, or already, published to Hashnode."""
+
+    id: int = Field(..., description="Outbox entry ID")
+    status: OutboxStatus = Field(..., description="Current publish status")
+    title: str = Field(..., description="Post title")
+    attempts: int = Field(default=0, description="Publish attempts made so far")
+    last_error: Optional[str] = Field(default=None, description="Error from the last failed attempt")
+    post_id: Optional[str] = Field(default=None, description="Hashnode post ID once published")
+    post_url: Optional[str] = Field(default=None, description="Published post URL")
+    created_at: datetime = Field(..., description="When the post was queued")
+    updated_at: datetime = Field(..., description="When the entry last changed")
+    next_attempt_at: Optional[datetime] = Field(default=None, description="When a pending entry will next be tried")
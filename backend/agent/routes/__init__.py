@@ -4,8 +4,10 @@ API routes for MCP Blog Server.
 
 from .blog_routes import router as blog_router
 from .health_routes import router as health_router
+from .metrics_routes import router as metrics_router
 
 __all__ = [
     "blog_router",
-    "health_router"
+    "health_router",
+    "metrics_router"
 ]
\ No newline at end of file
@@ -2,17 +2,46 @@
 Blog-related API routes for MCP Blog Server.
 """
 
+import asyncio
+import json
 import logging
 import time
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional, Union
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
-from ..models.blog import BlogRequest, BlogResponse, BlogPost
-from ..models.hashnode import HashnodePublishRequest
+from ..config import settings
+from ..dependencies import (
+    get_draft_store,
+    get_gemini_service,
+    get_hashnode_service,
+    get_job_manager,
+    get_longform_service,
+    get_publish_outbox,
+)
+from ..models.blog import (
+    BlogRequest,
+    BlogResponse,
+    BlogPost,
+    BatchBlogRequest,
+    BatchBlogResponse,
+    BatchPublishRequest,
+    LongformBlogRequest,
+)
+from ..models.draft import Draft, DraftListResponse, PublishDraftRequest
+from ..models.hashnode import HashnodePublishRequest, BatchPublishResponse
+from ..models.job import Job, JobSubmitResponse
+from ..models.outbox import OutboxEntry
+from ..services.draft_store import DraftStore
 from ..services.gemini_service import GeminiService
 from ..services.hashnode_service import HashnodeService
+from ..services.idempotency_store import content_idempotency_key
+from ..services.job_service import JobManager, JobQueueFullError
+from ..services.longform_service import LongformService
+from ..services.markdown_processor import MarkdownProcessor
+from ..services.publish_outbox import PublishOutbox
+from ..timing import mark_stage, timing_context, timings_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -20,88 +49,239 @@ router = APIRouter(prefix="/blog", tags=["blog"])
 
 
 @router.post("/generate", response_model=BlogResponse)
-async def generate_blog_post(request: BlogRequest) -> BlogResponse:
+async def generate_blog_post(
+    request: BlogRequest,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    publish_outbox: PublishOutbox = Depends(get_publish_outbox),
+    draft_store: DraftStore = Depends(get_draft_store)
+) -> BlogResponse:
     """
     Generate a blog post from title and notes using Gemini AI.
     
     Args:
         request: Blog generation request
+        gemini_service: Shared Gemini service
+        publish_outbox: Durable publish outbox
+        draft_store: Store generated posts are saved to
         
     Returns:
         BlogResponse: Generated blog post response
     """
+    mark_stage("validation")
+    return await _generate_response(request, gemini_service, publish_outbox, draft_store)
+
+
+async def _generate_response(
+    request: BlogRequest,
+    gemini_service: GeminiService,
+    publish_outbox: PublishOutbox,
+    draft_store: DraftStore,
+    idempotency_key: Optional[str] = None
+) -> BlogResponse:
+    """Generate (and optionally publish) a post, reporting failures in the response."""
     start_time = time.time()
     
     try:
         logger.info(f"Generating blog post: {request.title}")
         
-        # Initialize Gemini service
-        gemini_service = GeminiService()
-        
         # Generate blog post
-        blog_post = gemini_service.generate_blog_post(
+        blog_post = await gemini_service.generate_blog_post(
             title=request.title,
             notes=request.notes,
-            tags=request.tags
+            tags=request.tags,
+            use_cache=request.use_cache,
+            optimize_for=request.optimize_for
         )
         
         generation_time = time.time() - start_time
         
         # If publish_immediately is True, publish to Hashnode
-        hashnode_url = None
+        draft_id = await _save_draft(blog_post, draft_store)
+        
+        publish_entry = None
         if request.publish_immediately:
-            try:
-                hashnode_service = HashnodeService()
-                publish_request = HashnodePublishRequest(
-                    title=blog_post.title,
-                    content_markdown=blog_post.content,
-                    tags=blog_post.tags
-                )
-                
-                publish_response = await hashnode_service.publish_post(publish_request)
-                
-                if publish_response.success:
-                    hashnode_url = publish_response.post_url
-                    logger.info(f"Blog post published to Hashnode: {hashnode_url}")
-                else:
-                    logger.warning(f"Failed to publish to Hashnode: {publish_response.message}")
-                    
-            except Exception as e:
-                logger.error(f"Error publishing to Hashnode: {str(e)}")
-                # Don't fail the entire request if publishing fails
+            publish_entry = await _enqueue_publish(blog_post, publish_outbox, idempotency_key)
         
+        return _generated_response(blog_post, generation_time, draft_id, request.publish_immediately, publish_entry)
+        
+    except Exception as e:
+        logger.error(f"Error generating blog post: {str(e)}")
         return BlogResponse(
-            success=True,
-            blog_post=blog_post,
-            hashnode_url=hashnode_url,
-            message="Blog post generated successfully" + (" and published to Hashnode" if hashnode_url else ""),
-            generation_time_seconds=generation_time
+            success=False,
+            message=f"Failed to generate blog post: {str(e)}",
+            generation_time_seconds=time.time() - start_time,
+            timings=timings_snapshot()
         )
+
+
+@router.post("/generate/stream")
+async def generate_blog_post_stream(
+    request: BlogRequest,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    publish_outbox: PublishOutbox = Depends(get_publish_outbox),
+    draft_store: DraftStore = Depends(get_draft_store)
+) -> StreamingResponse:
+    """
+    Generate a blog post and stream it as Server-Sent Events.
+    
+    Emits a ``chunk`` event for every piece of markdown Gemini produces,
+    followed by a single ``done`` event carrying the full BlogResponse,
+    or an ``error`` event if generation fails.
+    
+    Args:
+        request: Blog generation request
+        gemini_service: Shared Gemini service
+        publish_outbox: Durable publish outbox
+        draft_store: Store generated posts are saved to
+        
+    Returns:
+        StreamingResponse: ``text/event-stream`` response
+    """
+    mark_stage("validation")
+    return StreamingResponse(
+        _stream_generation(request, gemini_service, publish_outbox, draft_store),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+@router.post("/generate/longform", response_model=BlogResponse)
+async def generate_longform_blog_post(
+    request: LongformBlogRequest,
+    longform_service: LongformService = Depends(get_longform_service),
+    publish_outbox: PublishOutbox = Depends(get_publish_outbox),
+    draft_store: DraftStore = Depends(get_draft_store)
+) -> BlogResponse:
+    """
+    Generate a long-form blog post from extensive notes.
+    
+    The notes are outlined by a fast model, sections are drafted
+    concurrently and the result is stitched with an introduction and
+    conclusion.
+    
+    Args:
+        request: Long-form generation request
+        longform_service: Shared long-form generation service
+        publish_outbox: Durable publish outbox
+        draft_store: Store generated posts are saved to
+        
+    Returns:
+        BlogResponse: Generated blog post response
+    """
+    mark_stage("validation")
+    start_time = time.time()
+    
+    try:
+        logger.info(f"Generating long-form blog post: {request.title}")
+        
+        blog_post = await longform_service.generate_blog_post(
+            title=request.title,
+            notes=request.notes,
+            tags=request.tags,
+            optimize_for=request.optimize_for
+        )
+        
+        generation_time = time.time() - start_time
+        
+        draft_id = await _save_draft(blog_post, draft_store)
+        
+        publish_entry = None
+        if request.publish_immediately:
+            publish_entry = await _enqueue_publish(blog_post, publish_outbox)
+        
+        return _generated_response(blog_post, generation_time, draft_id, request.publish_immediately, publish_entry)
         
     except Exception as e:
-        logger.error(f"Error generating blog post: {str(e)}")
+        logger.error(f"Error generating long-form blog post: {str(e)}")
         return BlogResponse(
             success=False,
             message=f"Failed to generate blog post: {str(e)}",
-            generation_time_seconds=time.time() - start_time
+            generation_time_seconds=time.time() - start_time,
+            timings=timings_snapshot()
         )
 
 
+@router.post("/generate/batch", response_model=BatchBlogResponse)
+async def generate_blog_post_batch(
+    batch: BatchBlogRequest,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    publish_outbox: PublishOutbox = Depends(get_publish_outbox),
+    draft_store: DraftStore = Depends(get_draft_store)
+) -> BatchBlogResponse:
+    """
+    Generate several blog posts concurrently.
+    
+    Items run in parallel up to ``batch_max_concurrency``; a failing item
+    is reported in its own BlogResponse and does not fail the batch.
+    
+    Args:
+        batch: Batch of blog generation requests
+        gemini_service: Shared Gemini service
+        publish_outbox: Durable publish outbox
+        draft_store: Store generated posts are saved to
+        
+    Returns:
+        BatchBlogResponse: Per-item responses in request order
+    """
+    _check_batch_size(len(batch.items))
+    mark_stage("validation")
+    start_time = time.time()
+    semaphore = asyncio.Semaphore(settings.batch_max_concurrency)
+    
+    async def run_item(item: BlogRequest) -> BlogResponse:
+        async with semaphore:
+            # Each item reports its own stage timings
+            with timing_context():
+                return await _generate_response(item, gemini_service, publish_outbox, draft_store)
+    
+    logger.info(f"Generating batch of {len(batch.items)} blog posts")
+    results = await asyncio.gather(*(run_item(item) for item in batch.items))
+    
+    succeeded = sum(1 for result in results if result.success)
+    
+    return BatchBlogResponse(
+        success=succeeded == len(results),
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        total_time_seconds=time.time() - start_time
+    )
+
+
 @router.post("/publish")
-async def publish_to_hashnode(blog_post: BlogPost) -> Dict[str, Any]:
+async def publish_to_hashnode(
+    blog_post: Union[PublishDraftRequest, BlogPost],
+    hashnode_service: HashnodeService = Depends(get_hashnode_service),
+    draft_store: DraftStore = Depends(get_draft_store),
+    idempotency_key: Optional[str] = Header(default=None, description="Key that makes retries of this publish safe")
+) -> Dict[str, Any]:
     """
     Publish an existing blog post to Hashnode.
     
+    The body is either a full blog post or ``{"draft_id": ...}`` naming a
+    stored draft. Repeating a request with the same ``Idempotency-Key`` (or,
+    without the header, the same title and content) returns the first
+    successful result instead of publishing a duplicate.
+    
     Args:
-        blog_post: Blog post to publish
+        blog_post: Blog post to publish, or a reference to a stored draft
+        hashnode_service: Shared Hashnode service
+        draft_store: Store of generated drafts
+        idempotency_key: Optional ``Idempotency-Key`` header
         
     Returns:
         Dict: Publishing response
     """
+    mark_stage("validation")
+    
     try:
-        logger.info(f"Publishing blog post to Hashnode: {blog_post.title}")
+        if isinstance(blog_post, PublishDraftRequest):
+            blog_post = await _load_draft(blog_post.draft_id, draft_store)
         
-        hashnode_service = HashnodeService()
+        logger.info(f"Publishing blog post to Hashnode: {blog_post.title}")
         
         publish_request = HashnodePublishRequest(
             title=blog_post.title,
@@ -109,14 +289,19 @@ async def publish_to_hashnode(blog_post: BlogPost) -> Dict[str, Any]:
             tags=blog_post.tags
         )
         
-        response = await hashnode_service.publish_post(publish_request)
+        response = await hashnode_service.publish_post(
+            publish_request,
+            idempotency_key=_publish_idempotency_key(idempotency_key, publish_request)
+        )
         
         if response.success:
             return {
                 "success": True,
                 "message": response.message,
                 "post_id": response.post_id,
-                "post_url": response.post_url
+                "post_url": response.post_url,
+                "replayed": response.replayed,
+                "timings": timings_snapshot()
             }
         else:
             raise HTTPException(
@@ -142,38 +327,252 @@ async def publish_to_hashnode(blog_post: BlogPost) -> Dict[str, Any]:
         )
 
 
+@router.post("/publish/batch", response_model=BatchPublishResponse)
+async def publish_batch_to_hashnode(
+    batch: BatchPublishRequest,
+    hashnode_service: HashnodeService = Depends(get_hashnode_service)
+) -> BatchPublishResponse:
+    """
+    Publish several existing blog posts to Hashnode.
+    
+    Posts are packed into aliased GraphQL mutations so each chunk costs a
+    single round-trip; failures are reported per post. Each post is keyed
+    by its title and content, so retrying a batch replays the posts that
+    were already published instead of publishing them again.
+    
+    Args:
+        batch: Blog posts to publish
+        hashnode_service: Shared Hashnode service
+        
+    Returns:
+        BatchPublishResponse: Per-post publishing responses in request order
+    """
+    _check_batch_size(len(batch.posts))
+    
+    logger.info(f"Publishing batch of {len(batch.posts)} blog posts to Hashnode")
+    
+    publish_requests = [
+        HashnodePublishRequest(
+            title=blog_post.title,
+            content_markdown=blog_post.content,
+            tags=blog_post.tags
+        )
+        for blog_post in batch.posts
+    ]
+    
+    results = await hashnode_service.publish_many(
+        publish_requests,
+        idempotency_keys=[
+            content_idempotency_key(request.title, request.content_markdown)
+            for request in publish_requests
+        ]
+    )
+    
+    succeeded = sum(1 for result in results if result.success)
+    
+    return BatchPublishResponse(
+        success=succeeded == len(results),
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded
+    )
+
+
 @router.post("/generate-and-publish", response_model=BlogResponse)
-async def generate_and_publish_blog_post(request: BlogRequest) -> BlogResponse:
+async def generate_and_publish_blog_post(
+    request: BlogRequest,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    publish_outbox: PublishOutbox = Depends(get_publish_outbox),
+    draft_store: DraftStore = Depends(get_draft_store),
+    idempotency_key: Optional[str] = Header(default=None, description="Key that makes retries of this publish safe")
+) -> BlogResponse:
     """
     Generate and immediately publish a blog post (convenience endpoint).
     
+    The post is written to the publish outbox and published in the
+    background; poll ``GET /blog/outbox/{outbox_id}`` for the result. A
+    repeated ``Idempotency-Key`` (or, without the header, identical generated
+    content) reuses the first outbox entry instead of queueing a duplicate.
+    
     Args:
         request: Blog generation request
+        gemini_service: Shared Gemini service
+        publish_outbox: Durable publish outbox
+        draft_store: Store generated posts are saved to
+        idempotency_key: Optional ``Idempotency-Key`` header
         
     Returns:
         BlogResponse: Generated and published blog post response
     """
+    mark_stage("validation")
+    
     # Force immediate publishing
     request.publish_immediately = True
-    return await generate_blog_post(request)
+    return await _generate_response(request, gemini_service, publish_outbox, draft_store, idempotency_key)
+
+
+@router.post("/jobs", response_model=JobSubmitResponse, status_code=202)
+async def submit_job(
+    request: BlogRequest,
+    job_manager: JobManager = Depends(get_job_manager)
+) -> JobSubmitResponse:
+    """
+    Queue a generation (and optional publish) job and return immediately.
+    
+    Args:
+        request: Blog generation request
+        job_manager: Shared background job manager
+        
+    Returns:
+        JobSubmitResponse: ID of the queued job
+    """
+    try:
+        job = job_manager.submit(request)
+    except JobQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "success": False,
+                "message": str(e),
+                "error_code": "QUEUE_FULL"
+            }
+        )
+    
+    return JobSubmitResponse(
+        success=True,
+        job_id=job.id,
+        status=job.status,
+        message="Job queued"
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=Job)
+async def get_job(
+    job_id: str,
+    job_manager: JobManager = Depends(get_job_manager)
+) -> Job:
+    """
+    Get the status and result of a queued job.
+    
+    Args:
+        job_id: ID returned by POST /blog/jobs
+        job_manager: Shared background job manager
+        
+    Returns:
+        Job: Current job state
+    """
+    job = job_manager.get(job_id)
+    
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "success": False,
+                "message": f"Job not found: {job_id}"
+            }
+        )
+    
+    return job
+
+
+@router.get("/drafts", response_model=DraftListResponse)
+async def list_drafts(
+    q: Optional[str] = Query(default=None, description="Search terms matched against title, content, tags and summary"),
+    cursor: Optional[int] = Query(default=None, description="next_cursor from the previous page"),
+    limit: Optional[int] = Query(default=None, ge=1, description="Drafts per page"),
+    draft_store: DraftStore = Depends(get_draft_store)
+) -> DraftListResponse:
+    """
+    List stored drafts, newest first, optionally filtered by a search.
+    
+    Args:
+        q: Optional full-text search terms
+        cursor: Keyset cursor; only drafts older than it are returned
+        limit: Page size, capped at ``drafts_max_page_size``
+        draft_store: Store of generated drafts
+        
+    Returns:
+        DraftListResponse: One page of drafts and the cursor for the next one
+    """
+    page_size = min(limit or settings.drafts_page_size, settings.drafts_max_page_size)
+    drafts, next_cursor = await draft_store.list(page_size, before=cursor, query=q)
+    return DraftListResponse(drafts=drafts, next_cursor=next_cursor)
+
+
+@router.get("/drafts/{draft_id}", response_model=Draft)
+async def get_draft(
+    draft_id: int,
+    draft_store: DraftStore = Depends(get_draft_store)
+) -> Draft:
+    """
+    Get a stored draft with its full content.
+    
+    Args:
+        draft_id: ID returned as ``draft_id`` by the generation endpoints
+        draft_store: Store of generated drafts
+        
+    Returns:
+        Draft: The stored draft
+    """
+    draft = await draft_store.get(draft_id)
+    
+    if draft is None:
+        raise _draft_not_found(draft_id)
+    
+    return draft
+
+
+@router.get("/outbox/{outbox_id}", response_model=OutboxEntry)
+async def get_outbox_entry(
+    outbox_id: int,
+    publish_outbox: PublishOutbox = Depends(get_publish_outbox)
+) -> OutboxEntry:
+    """
+    Get the publish status of a queued post.
+    
+    Args:
+        outbox_id: ID returned as ``outbox_id`` by the generation endpoints
+        publish_outbox: Durable publish outbox
+        
+    Returns:
+        OutboxEntry: Current outbox entry state
+    """
+    entry = await publish_outbox.get(outbox_id)
+    
+    if entry is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "success": False,
+                "message": f"Outbox entry not found: {outbox_id}"
+            }
+        )
+    
+    return entry
 
 
 @router.get("/publication-info")
-async def get_publication_info() -> Dict[str, Any]:
+async def get_publication_info(
+    hashnode_service: HashnodeService = Depends(get_hashnode_service)
+) -> Dict[str, Any]:
     """
     Get information about the configured Hashnode publication.
     
+    Args:
+        hashnode_service: Shared Hashnode service
+        
     Returns:
         Dict: Publication information
     """
     try:
-        hashnode_service = HashnodeService()
         pub_info = await hashnode_service.get_publication_info()
         
         if pub_info:
+            cache_age = hashnode_service.publication_cache.age()
             return {
                 "success": True,
-                "publication": pub_info
+                "publication": pub_info,
+                "cache_age_seconds": round(cache_age, 3) if cache_age is not None else None
             }
         else:
             raise HTTPException(
@@ -194,6 +593,169 @@ async def get_publication_info() -> Dict[str, Any]:
                 "success": False,
                 "message": f"Failed to fetch publication info: {str(e)}"
             }
-        ) 
+        )
+
+
+async def _enqueue_publish(
+    blog_post: BlogPost,
+    publish_outbox: PublishOutbox,
+    idempotency_key: Optional[str] = None
+) -> Optional[OutboxEntry]:
+    """Queue a freshly generated post for publishing, returning its outbox entry or None on failure."""
+    try:
+        publish_request = HashnodePublishRequest(
+            title=blog_post.title,
+            content_markdown=blog_post.content,
+            tags=blog_post.tags
+        )
+        
+        entry = await publish_outbox.enqueue(
+            publish_request,
+            idempotency_key=_publish_idempotency_key(idempotency_key, publish_request)
+        )
+        logger.info(f"Blog post queued for publishing as outbox entry {entry.id}")
+        return entry
+        
+    except Exception as e:
+        logger.error(f"Error queueing blog post for publishing: {str(e)}")
+        # Don't fail the entire request if queueing fails
+    
+    return None
+
+
+async def _load_draft(draft_id: int, draft_store: DraftStore) -> BlogPost:
+    """Load a stored draft as a BlogPost, raising 404 if it does not exist."""
+    draft = await draft_store.get(draft_id)
+    if draft is None:
+        raise _draft_not_found(draft_id)
     
+    return BlogPost(
+        title=draft.title,
+        content=draft.content,
+        tags=draft.tags,
+        summary=draft.summary,
+        model=draft.model,
+        route=draft.route,
+        created_at=draft.created_at
+    )
+
+
+def _draft_not_found(draft_id: int) -> HTTPException:
+    """Build the 404 raised for an unknown draft ID."""
+    return HTTPException(
+        status_code=404,
+        detail={
+            "success": False,
+            "message": f"Draft not found: {draft_id}",
+            "error_code": "DRAFT_NOT_FOUND"
+        }
+    )
+
+
+async def _save_draft(blog_post: BlogPost, draft_store: DraftStore) -> Optional[int]:
+    """Store a freshly generated post as a draft, returning its ID or None on failure."""
+    try:
+        return await draft_store.save(blog_post, timings_snapshot())
+    except Exception as e:
+        logger.error(f"Error saving draft: {str(e)}")
+        # Don't fail the entire request if the draft cannot be stored
+        return None
+
+
+def _generated_response(
+    blog_post: BlogPost,
+    generation_time: float,
+    draft_id: Optional[int],
+    publish_requested: bool,
+    publish_entry: Optional[OutboxEntry]
+) -> BlogResponse:
+    """Build the success response for a generation, including any queued publish."""
+    message = "Blog post generated successfully"
+    if publish_entry is not None:
+        message += " and published to Hashnode" if publish_entry.post_url else " and queued for publishing"
+    elif publish_requested:
+        message += " but could not be queued for publishing"
+    
+    return BlogResponse(
+        success=True,
+        blog_post=blog_post,
+        hashnode_url=publish_entry.post_url if publish_entry else None,
+        draft_id=draft_id,
+        outbox_id=publish_entry.id if publish_entry else None,
+        publish_status=publish_entry.status.value if publish_entry else None,
+        message=message,
+        generation_time_seconds=generation_time,
+        timings=timings_snapshot()
+    )
+
+
+def _check_batch_size(count: int) -> None:
+    """Reject batches larger than ``batch_max_items``."""
+    if count > settings.batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "message": f"Batch too large: {count} items (max {settings.batch_max_items})"
+            }
+        )
+
+
+def _publish_idempotency_key(header_key: Optional[str], publish_request: HashnodePublishRequest) -> str:
+    """Use the client's Idempotency-Key, or derive one from the post's content."""
+    if header_key and header_key.strip():
+        return f"client:{header_key.strip()}"
+    return content_idempotency_key(publish_request.title, publish_request.content_markdown)
+
+
+def _sse_event(event: str, data: str) -> str:
+    """Format a single Server-Sent Event frame."""
+    return f"event: {event}\ndata: {data}\n\n"
+
 
+async def _stream_generation(
+    request: BlogRequest,
+    gemini_service: GeminiService,
+    publish_outbox: PublishOutbox,
+    draft_store: DraftStore
+) -> AsyncIterator[str]:
+    """Drive a streamed generation and render it as SSE frames."""
+    start_time = time.time()
+    
+    try:
+        logger.info(f"Streaming blog post: {request.title}")
+        
+        route = gemini_service.select_route(request.notes, request.tags, request.optimize_for)
+        
+        processor = MarkdownProcessor()
+        async for text in gemini_service.stream_blog_post(
+            title=request.title,
+            notes=request.notes,
+            tags=request.tags,
+            route=route
+        ):
+            processor.feed(text)
+            yield _sse_event("chunk", json.dumps({"text": text}))
+        
+        blog_post = gemini_service.build_blog_post(request.title, processor, request.tags, route=route)
+        await gemini_service.cache_blog_post(request.notes, blog_post, route)
+        generation_time = time.time() - start_time
+        
+        draft_id = await _save_draft(blog_post, draft_store)
+        
+        publish_entry = None
+        if request.publish_immediately:
+            publish_entry = await _enqueue_publish(blog_post, publish_outbox)
+        
+        response = _generated_response(blog_post, generation_time, draft_id, request.publish_immediately, publish_entry)
+        yield _sse_event("done", response.model_dump_json())
+        
+    except Exception as e:
+        logger.error(f"Error streaming blog post: {str(e)}")
+        response = BlogResponse(
+            success=False,
+            message=f"Failed to generate blog post: {str(e)}",
+            generation_time_seconds=time.time() - start_time,
+            timings=timings_snapshot()
+        )
+        yield _sse_event("error", response.model_dump_json())
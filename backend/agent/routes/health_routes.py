@@ -2,10 +2,13 @@
 Health check routes for MCP Blog Server.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi import APIRouter, Depends
-from ..services.hashnode_service import HashnodeService
+from ..services.gemini_service import PROMPT_TEMPLATE_VERSION, GeminiService
+from ..services.generation_cache import GenerationCache
+from ..services.health_prober import HealthProber
 from ..config import settings
+from ..dependencies import get_gemini_service, get_generation_cache, get_health_prober
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -22,19 +25,19 @@ async def health_check() -> Dict[str, Any]:
 
 
 @router.get("/detailed")
-async def detailed_health_check() -> Dict[str, Any]:
-    """Detailed health check including external services."""
-    hashnode_service = HashnodeService()
+async def detailed_health_check(
+    health_prober: HealthProber = Depends(get_health_prober),
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    generation_cache: Optional[GenerationCache] = Depends(get_generation_cache)
+) -> Dict[str, Any]:
+    """
+    Detailed health check including external services.
     
-    # Check Hashnode connection
-    hashnode_status = "unknown"
-    hashnode_info = None
-    
-    try:
-        hashnode_info = await hashnode_service.get_publication_info()
-        hashnode_status = "connected" if hashnode_info else "error"
-    except Exception:
-        hashnode_status = "error"
+    Upstream status comes from the background prober's latest snapshot,
+    so this endpoint never waits on Hashnode or Gemini.
+    """
+    snapshot = health_prober.snapshot()
+    hashnode = snapshot["hashnode"]
     
     return {
         "status": "healthy",
@@ -42,13 +45,20 @@ async def detailed_health_check() -> Dict[str, Any]:
         "version": settings.app_version,
         "services": {
             "hashnode": {
-                "status": hashnode_status,
-                "publication": hashnode_info.get("title") if hashnode_info else None
-            }
+                **hashnode.model_dump(mode="json"),
+                "publication": hashnode.detail
+            },
+            "gemini": snapshot["gemini"].model_dump(mode="json")
         },
+        "generation_cache": generation_cache.stats() if generation_cache else None,
+        "generation_coalescing": gemini_service.coalescing_stats(),
         "config": {
             "gemini_model": settings.gemini_model,
+            "gemini_fast_model": settings.gemini_fast_model,
+            "routing_enabled": settings.routing_enabled,
+            "prompt_template_version": PROMPT_TEMPLATE_VERSION,
             "max_title_length": settings.max_title_length,
-            "max_notes_length": settings.max_notes_length
+            "max_notes_length": settings.max_notes_length,
+            "max_longform_notes_length": settings.max_longform_notes_length
         }
-    } 
\ No newline at end of file
+    }
@@ -2,10 +2,23 @@
 Service classes for MCP Blog Server.
 """
 
+from .draft_store import DraftStore
 from .gemini_service import GeminiService
+from .generation_cache import GenerationCache
 from .hashnode_service import HashnodeService
+from .health_prober import HealthProber
+from .job_service import JobManager, JobQueueFullError
+from .longform_service import LongformService
+from .publish_outbox import PublishOutbox
 
 __all__ = [
+    "DraftStore",
     "GeminiService",
-    "HashnodeService"
+    "GenerationCache",
+    "HashnodeService",
+    "HealthProber",
+    "JobManager",
+    "JobQueueFullError",
+    "LongformService",
+    "PublishOutbox"
 ] 
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""
+SQLite store of generated posts with an FTS5 search index.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from ..models.blog import BlogPost
+from ..models.draft import Draft, DraftSummary
+
+logger = logging.getLogger(__name__)
+
+_SUMMARY_COLUMNS = "drafts.id, drafts.title, drafts.tags, drafts.summary, drafts.model, drafts.route, drafts.created_at"
+
+_SEARCH_TERM = re.compile(r"\w+")
+
+
+class DraftStore:
+    """
+    Every generated post, kept so it can be listed, searched and published later.
+
+    Drafts are deduplicated by title and content, so a cached generation
+    returns the ID of the draft it was first stored as. An external-content
+    FTS5 table, kept in sync by triggers, indexes title, content, tags and
+    summary. Listings are newest first and paginated by ID (keyset), so a
+    page costs the same however deep it is.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the store.
+
+        Args:
+            db_path: SQLite file path
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db: Optional[sqlite3.Connection] = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS drafts ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "content_hash TEXT NOT NULL UNIQUE, "
+                "title TEXT NOT NULL, "
+                "content TEXT NOT NULL, "
+                "tags TEXT, "
+                "summary TEXT, "
+                "model TEXT, "
+                "route TEXT, "
+                "timings TEXT, "
+                "created_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS drafts_fts USING fts5("
+                "title, content, tags, summary, content='drafts', content_rowid='id')"
+            )
+            self._db.execute(
+                "CREATE TRIGGER IF NOT EXISTS drafts_ai AFTER INSERT ON drafts BEGIN "
+                "INSERT INTO drafts_fts (rowid, title, content, tags, summary) "
+                "VALUES (new.id, new.title, new.content, new.tags, new.summary); END"
+            )
+            self._db.execute(
+                "CREATE TRIGGER IF NOT EXISTS drafts_ad AFTER DELETE ON drafts BEGIN "
+                "INSERT INTO drafts_fts (drafts_fts, rowid, title, content, tags, summary) "
+                "VALUES ('delete', old.id, old.title, old.content, old.tags, old.summary); END"
+            )
+
+    async def save(self, blog_post: BlogPost, timings: Optional[Dict[str, float]] = None) -> int:
+        """
+        Store a generated post.
+
+        Args:
+            blog_post: Generated blog post
+            timings: Per-stage durations of the generation
+
+        Returns:
+            int: ID of the new draft, or of the existing draft with the same title and content
+        """
+        return await asyncio.to_thread(self._db_save, blog_post, timings)
+
+    async def get(self, draft_id: int) -> Optional[Draft]:
+        """Return a draft by ID, or None if unknown."""
+        return await asyncio.to_thread(self._db_get, draft_id)
+
+    async def list(
+        self,
+        limit: int,
+        before: Optional[int] = None,
+        query: Optional[str] = None
+    ) -> Tuple[List[DraftSummary], Optional[int]]:
+        """
+        List drafts newest first.
+
+        Args:
+            limit: Maximum drafts to return
+            before: Cursor from the previous page; only older drafts are returned
+            query: Optional search terms, all of which must match (as word prefixes)
+
+        Returns:
+            Tuple of the page of drafts and the cursor for the next page (None on the last page)
+        """
+        match = _fts_query(query) if query else None
+        rows = await asyncio.to_thread(self._db_list, limit + 1, before, match)
+
+        drafts = [_to_summary(row) for row in rows[:limit]]
+        next_cursor = drafts[-1].id if len(rows) > limit else None
+        return drafts, next_cursor
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
+            self._db = None
+
+    def _db_save(self, blog_post: BlogPost, timings: Optional[Dict[str, float]]) -> int:
+        content_hash = hashlib.sha256(f"{blog_post.title}\0{blog_post.content}".encode("utf-8")).hexdigest()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR IGNORE INTO drafts "
+                "(content_hash, title, content, tags, summary, model, route, timings, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    content_hash,
+                    blog_post.title,
+                    blog_post.content,
+                    json.dumps(blog_post.tags) if blog_post.tags is not None else None,
+                    blog_post.summary,
+                    blog_post.model,
+                    blog_post.route,
+                    json.dumps(timings) if timings is not None else None,
+                    blog_post.created_at.timestamp()
+                )
+            )
+            return self._db.execute(
+                "SELECT id FROM drafts WHERE content_hash = ?", (content_hash,)
+            ).fetchone()[0]
+
+    def _db_get(self, draft_id: int) -> Optional[Draft]:
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_SUMMARY_COLUMNS}, drafts.content, drafts.timings FROM drafts WHERE id = ?",
+                (draft_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        summary = _to_summary(row[:7])
+        return Draft(
+            **summary.model_dump(),
+            content=row[7],
+            timings=json.loads(row[8]) if row[8] is not None else None
+        )
+
+    def _db_list(self, limit: int, before: Optional[int], match: Optional[str]) -> List[tuple]:
+        sql = f"SELECT {_SUMMARY_COLUMNS} FROM drafts"
+        conditions, params = [], []
+
+        if match is not None:
+            sql += " JOIN drafts_fts ON drafts_fts.rowid = drafts.id"
+            conditions.append("drafts_fts MATCH ?")
+            params.append(match)
+        if before is not None:
+            conditions.append("drafts.id < ?")
+            params.append(before)
+
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY drafts.id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+
+def _fts_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 query that cannot be a syntax error.
+
+    Each word becomes a quoted prefix term, so ``fast api`` matches
+    ``FastAPI apis`` and operators or quotes typed by the user are ignored.
+    A query without any word characters matches nothing.
+    """
+    terms = _SEARCH_TERM.findall(query)
+    if not terms:
+        return '""'
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _to_summary(row: tuple) -> DraftSummary:
+    """Convert a row (in _SUMMARY_COLUMNS order) to a DraftSummary."""
+    draft_id, title, tags, summary, model, route, created_at = row
+    return DraftSummary(
+        id=draft_id,
+        title=title,
+        tags=json.loads(tags) if tags is not None else None,
+        summary=summary,
+        model=model,
+        route=route,
+        created_at=datetime.fromtimestamp(created_at)
+    )
@@ -2,36 +2,169 @@
 Gemini AI service for blog content generation.
 """
 
+import asyncio
+import dataclasses
 import logging
 import time
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
 import google.generativeai as genai
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 from ..config import settings
+from ..metrics import (
+    GEMINI_HEDGES,
+    GEMINI_REQUEST_DURATION,
+    GEMINI_ROUTES,
+    UPSTREAM_ERRORS,
+    UPSTREAM_REQUESTS_IN_FLIGHT,
+    observe_stage,
+    record_gemini_usage,
+)
 from ..models.blog import BlogPost
+from .generation_cache import GenerationCache, make_cache_key
+from .hedging import LatencyWindow, hedge
+from .markdown_processor import MarkdownProcessor, process_markdown
+from .model_router import ModelRoute, ModelRouter
+from .rate_limiter import RateLimiter
+from .retry import gemini_retry_after, is_retryable_gemini_error, retry_async
+from .singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever SYSTEM_INSTRUCTION (including WRITER_PERSONA) or the request prompt changes so cached generations are invalidated
+PROMPT_TEMPLATE_VERSION = "2"
+
+# Voice shared by every writing call (single-pass and long-form)
+WRITER_PERSONA = (
+    "You are a professional backend python senior engineer writing a technical blog post. "
+    "Be quirky and unhinged like a senior engineer who's tired of LinkedIn influencer bullshit."
+)
+
+# Static part of every blog generation prompt. It is sent as the model's
+# system instruction so the per-request prompt only carries title, notes and
+# tags, and the shared prefix stays byte-identical across requests.
+SYSTEM_INSTRUCTION = WRITER_PERSONA + """
+
+You will be given a title, rough notes and optionally tags to incorporate.
+
+Requirements:
+1. Write in a professional but irreverent tone - like a senior engineer who knows their stuff
+2. Use proper Markdown formatting with headers, lists, code blocks, etc.
+3. Include an engaging introduction and conclusion
+4. Make the content informative and actionable with real examples
+5. Use appropriate technical terminology but explain complex concepts
+6. Structure the content with clear sections using # ## ### headers
+7. Add code examples in proper ```language code blocks where relevant
+8. Keep the content focused and valuable to readers
+9. Be human, funny, and slightly unhinged - capture personality in the writing
+10. Write directly in markdown - do NOT wrap your response in code blocks or add "```markdown" tags
+
+Generate the blog post content directly as markdown text, starting with the main heading."""
+
+# Safety settings applied to every generation
+SAFETY_SETTINGS = {
+    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
+    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
+    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
+    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
+}
+
 
 class GeminiService:
-    """Service for generating blog content using Google Gemini AI."""
+    """Service for generating blog content using Google Gemini AI.
     
-    def __init__(self):
-        """Initialize the Gemini service."""
+    Built once per process in the application lifespan; the models,
+    safety settings and concurrency cap are shared by every request.
+    """
+    
+    def __init__(
+        self,
+        cache: Optional[GenerationCache] = None,
+        model_factory: Optional[Callable[..., Any]] = None
+    ):
+        """
+        Initialize the Gemini service.
+        
+        Args:
+            cache: Optional cache of previously generated posts
+            model_factory: Builds a model client from a model name and ``system_instruction``
+                keyword; defaults to ``genai.GenerativeModel`` (benchmarks pass a local fake)
+        """
+        self.cache = cache
+        self.model_factory = model_factory or genai.GenerativeModel
         genai.configure(api_key=settings.gemini_api_key)
-        self.model = genai.GenerativeModel(settings.gemini_model)
-        
-        # Configure safety settings
-        self.safety_settings = {
-            HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
-            HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
-            HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
-            HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
+        self.safety_settings = SAFETY_SETTINGS
+        
+        # One model client per model name and system instruction, shared by every route that uses it
+        self._models: Dict[Tuple[str, Optional[str]], genai.GenerativeModel] = {}
+        self.model = self.get_model(settings.gemini_model, SYSTEM_INSTRUCTION)
+        
+        # Route requests between the fast and quality tiers, each with its own output budget
+        self.router = ModelRouter.from_settings()
+        self.generation_configs = {
+            name: genai.GenerationConfig(
+                temperature=0.7,
+                top_p=0.8,
+                top_k=40,
+                max_output_tokens=route.max_output_tokens,
+                response_mime_type=route.response_mime_type,
+            )
+            for name, route in self.router.routes.items()
         }
+        
+        # Latencies of each route's model, for the hedge threshold
+        self._latencies: Dict[str, LatencyWindow] = {name: LatencyWindow() for name in self.router.routes}
+        
+        # Cap the number of in-flight Gemini calls and the request/token rate
+        self._semaphore = asyncio.Semaphore(settings.gemini_max_concurrency)
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=settings.gemini_requests_per_minute,
+            tokens_per_minute=settings.gemini_tokens_per_minute
+        )
+        
+        # Coalesce identical generations that are already in flight
+        self._in_flight: SingleFlight[BlogPost] = SingleFlight()
     
-    def generate_blog_post(self, title: str, notes: str, tags: Optional[List[str]] = None) -> BlogPost:
+    def get_model(self, model_name: str, system_instruction: Optional[str] = None) -> genai.GenerativeModel:
+        """Return the shared model client for a model and system instruction, creating it on first use."""
+        key = (model_name, system_instruction)
+        model = self._models.get(key)
+        if model is None:
+            model = self.model_factory(model_name, system_instruction=system_instruction)
+            self._models[key] = model
+        return model
+    
+    def select_route(
+        self,
+        notes: str,
+        tags: Optional[List[str]] = None,
+        optimize_for: Optional[str] = None
+    ) -> ModelRoute:
+        """
+        Choose the model tier for a request and count the choice.
+        
+        Args:
+            notes: Rough notes for the blog post
+            tags: Optional list of tags
+            optimize_for: Optional ``"quality"`` or ``"latency"`` hint
+            
+        Returns:
+            ModelRoute: The chosen model and output-token budget
+        """
+        route = self.router.route(notes, tags, optimize_for)
+        GEMINI_ROUTES.labels(route=route.name, model=route.model_name).inc()
+        return route
+    
+    async def generate_blog_post(
+        self,
+        title: str,
+        notes: str,
+        tags: Optional[List[str]] = None,
+        use_cache: bool = True,
+        optimize_for: Optional[str] = None
+    ) -> BlogPost:
         """
         Generate a blog post from title and notes.
         
@@ -39,6 +172,8 @@ class GeminiService:
             title: The blog post title
             notes: Rough notes for the blog post
             tags: Optional list of tags
+            use_cache: Whether a cached generation may be returned
+            optimize_for: Optional ``"quality"`` or ``"latency"`` routing hint
             
         Returns:
             BlogPost: Generated blog post
@@ -47,97 +182,383 @@ class GeminiService:
             Exception: If generation fails
         """
         try:
-            start_time = time.time()
+            route = self.select_route(notes, tags, optimize_for)
+            cache_key = self.cache_key(title, notes, tags, route)
             
-            # Create the prompt
-            prompt = self._create_prompt(title, notes, tags)
+            if self.cache is not None:
+                if use_cache:
+                    with observe_stage("cache_lookup"):
+                        cached_post = await self.cache.get(cache_key)
+                    if cached_post is not None:
+                        logger.info(f"Serving cached blog post for title: {title}")
+                        # A hit is served as a new post; its draft keeps the original creation time
+                        return cached_post.model_copy(update={
+                            "title": title,
+                            "tags": tags,
+                            "created_at": datetime.now()
+                        })
+                else:
+                    self.cache.record_bypass()
             
-            logger.info(f"Generating blog post for title: {title}")
-            
-            # Generate content
-            response = self.model.generate_content(
-                prompt,
-                safety_settings=self.safety_settings,
-                generation_config=genai.GenerationConfig(
-                    temperature=0.7,
-                    top_p=0.8,
-                    top_k=40,
-                    max_output_tokens=4000,
-                )
+            if not use_cache:
+                return await self._generate(title, notes, tags, route, cache_key)
+            
+            # Identical requests already in flight share one Gemini call
+            blog_post = await self._in_flight.do(
+                cache_key,
+                lambda: self._generate(title, notes, tags, route, cache_key)
             )
+            return blog_post.model_copy(update={"title": title, "tags": tags})
+            
+        except Exception as e:
+            logger.error(f"Error generating blog post: {str(e)}")
+            raise Exception(f"Failed to generate blog post: {str(e)}")
+    
+    async def _generate(
+        self,
+        title: str,
+        notes: str,
+        tags: Optional[List[str]],
+        route: ModelRoute,
+        cache_key: str
+    ) -> BlogPost:
+        """Call Gemini for a new post and store it in the cache."""
+        start_time = time.time()
+        
+        # Create the prompt
+        with observe_stage("prompt_build"):
+            prompt = self._create_prompt(title, notes, tags)
+        
+        logger.info(f"Generating blog post for title: {title} (route: {route.name})")
+        
+        # Generate content without blocking the event loop
+        with observe_stage("gemini"):
+            response, model_name = await self._call_with_deadline(prompt, route, SYSTEM_INSTRUCTION)
+        record_gemini_usage(response)
+        
+        if not response.text:
+            raise Exception("No content generated by Gemini")
+        
+        blog_post = self.build_blog_post(title, response.text, tags, route=route, model_name=model_name)
+        
+        if self.cache is not None:
+            await self.cache.set(cache_key, blog_post)
+        
+        generation_time = time.time() - start_time
+        logger.info(f"Blog post generated in {generation_time:.2f} seconds")
+        
+        return blog_post
+    
+    async def stream_blog_post(
+        self,
+        title: str,
+        notes: str,
+        tags: Optional[List[str]] = None,
+        route: Optional[ModelRoute] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream blog post content from Gemini as it is generated.
+        
+        Args:
+            title: The blog post title
+            notes: Rough notes for the blog post
+            tags: Optional list of tags
+            route: Model tier to use; chosen from the notes and tags if omitted
             
-            if not response.text:
-                raise Exception("No content generated by Gemini")
+        Yields:
+            str: Markdown text chunks in generation order
             
-            # Parse the response
-            content = response.text.strip()
+        Raises:
+            Exception: If generation fails
+        """
+        try:
+            route = route or self.select_route(notes, tags)
             
-            # Extract summary (first paragraph or first 200 chars)
-            summary = self._extract_summary(content)
+            with observe_stage("prompt_build"):
+                prompt = self._create_prompt(title, notes, tags)
             
-            generation_time = time.time() - start_time
-            logger.info(f"Blog post generated in {generation_time:.2f} seconds")
+            logger.info(f"Streaming blog post for title: {title} (route: {route.name})")
             
-            return BlogPost(
-                title=title,
-                content=content,
-                tags=tags,
-                summary=summary
-            )
+            async def open_stream():
+                # Wait for rate-limit tokens before taking a slot, then hold the slot for the whole stream
+                await self._acquire_rate_limit(prompt, SYSTEM_INSTRUCTION)
+                await self._semaphore.acquire()
+                try:
+                    return await self._send(prompt, route, SYSTEM_INSTRUCTION, stream=True)
+                except BaseException:
+                    self._semaphore.release()
+                    raise
             
+            with UPSTREAM_REQUESTS_IN_FLIGHT.labels(upstream="gemini").track_inprogress(), observe_stage("gemini"):
+                # The deadline covers the whole stream, not each chunk
+                deadline = asyncio.get_running_loop().time() + settings.generation_timeout
+                
+                response = await asyncio.wait_for(
+                    retry_async(
+                        open_stream,
+                        should_retry=is_retryable_gemini_error,
+                        retry_after=gemini_retry_after,
+                        description="Gemini streaming generation"
+                    ),
+                    timeout=settings.generation_timeout
+                )
+                
+                try:
+                    chunks = response.__aiter__()
+                    while True:
+                        remaining = deadline - asyncio.get_running_loop().time()
+                        try:
+                            chunk = await asyncio.wait_for(chunks.__anext__(), timeout=max(remaining, 0))
+                        except StopAsyncIteration:
+                            break
+                        if chunk.text:
+                            yield chunk.text
+                finally:
+                    self._semaphore.release()
+                
+                record_gemini_usage(response)
+                        
+        except asyncio.TimeoutError:
+            UPSTREAM_ERRORS.labels(upstream="gemini", error_code="DeadlineExceeded").inc()
+            logger.error(f"Streaming generation exceeded {settings.generation_timeout}s deadline")
+            raise Exception(f"Generation timed out after {settings.generation_timeout}s")
         except Exception as e:
-            logger.error(f"Error generating blog post: {str(e)}")
+            UPSTREAM_ERRORS.labels(upstream="gemini", error_code=type(e).__name__).inc()
+            logger.error(f"Error streaming blog post: {str(e)}")
             raise Exception(f"Failed to generate blog post: {str(e)}")
     
+    async def complete(self, prompt: str, route: ModelRoute, system_instruction: Optional[str] = None) -> str:
+        """
+        Generate raw text for a prompt on a route.
+        
+        Shares the deadline, hedging, rate limits and retries of regular
+        generations, without caching or post-processing.
+        
+        Args:
+            prompt: Full prompt text
+            route: Model tier to use
+            system_instruction: Optional static instruction sent as the model's system instruction
+            
+        Returns:
+            str: Generated text
+            
+        Raises:
+            Exception: If generation fails or returns no text
+        """
+        response, _ = await self._call_with_deadline(prompt, route, system_instruction)
+        record_gemini_usage(response)
+        
+        if not response.text:
+            raise Exception("No content generated by Gemini")
+        
+        return response.text
+    
+    async def _call_with_deadline(
+        self,
+        prompt: str,
+        route: ModelRoute,
+        system_instruction: Optional[str] = None
+    ) -> Tuple[Any, str]:
+        """
+        Call Gemini within ``generation_timeout``, hedging with the fallback model if configured.
+        
+        Returns the response and the name of the model that produced it.
+        """
+        try:
+            return await asyncio.wait_for(
+                self._call_hedged(prompt, route, system_instruction),
+                timeout=settings.generation_timeout
+            )
+        except asyncio.TimeoutError:
+            UPSTREAM_ERRORS.labels(upstream="gemini", error_code="DeadlineExceeded").inc()
+            logger.error(f"Generation exceeded {settings.generation_timeout}s deadline")
+            raise Exception(f"Generation timed out after {settings.generation_timeout}s")
+    
+    async def _call_hedged(
+        self,
+        prompt: str,
+        route: ModelRoute,
+        system_instruction: Optional[str] = None
+    ) -> Tuple[Any, str]:
+        """Call the route's model, racing the fallback model once it is unusually slow."""
+        fallback_model_name = settings.gemini_fallback_model
+        if fallback_model_name is None or fallback_model_name == route.model_name:
+            return await self._call_primary(prompt, route, system_instruction), route.model_name
+        
+        hedged = False
+        
+        async def call_fallback():
+            nonlocal hedged
+            hedged = True
+            logger.info(f"Primary Gemini call is slow; hedging with {fallback_model_name}")
+            return await self._call_model(prompt, route, system_instruction, model_name=fallback_model_name)
+        
+        response, from_fallback = await hedge(
+            lambda: self._call_primary(prompt, route, system_instruction),
+            call_fallback,
+            delay=self.hedge_delay(route)
+        )
+        
+        if hedged:
+            GEMINI_HEDGES.labels(winner="fallback" if from_fallback else "primary").inc()
+        return response, (fallback_model_name if from_fallback else route.model_name)
+    
+    async def _call_primary(self, prompt: str, route: ModelRoute, system_instruction: Optional[str] = None):
+        """Call the route's model and record its latency for the hedge threshold."""
+        latencies = self._latencies[route.name]
+        start_time = time.perf_counter()
+        try:
+            response = await self._call_model(prompt, route, system_instruction)
+        except asyncio.CancelledError:
+            # A cancelled call still tells us the primary took at least this long
+            latencies.record(time.perf_counter() - start_time)
+            raise
+        latencies.record(time.perf_counter() - start_time)
+        return response
+    
+    def hedge_delay(self, route: ModelRoute) -> float:
+        """Return how long to wait on the route's model before hedging."""
+        threshold = self._latencies[route.name].percentile(settings.gemini_hedge_percentile)
+        return threshold if threshold is not None else settings.gemini_hedge_delay_seconds
+    
+    async def _call_model(
+        self,
+        prompt: str,
+        route: ModelRoute,
+        system_instruction: Optional[str] = None,
+        model_name: Optional[str] = None
+    ):
+        """Send a prompt to Gemini under the rate limiter and concurrency cap, with retries."""
+        model_name = model_name or route.model_name
+        
+        async def attempt():
+            # Wait for rate-limit tokens before taking a slot, so slots never idle on the limiter
+            await self._acquire_rate_limit(prompt, system_instruction)
+            async with self._semaphore:
+                with UPSTREAM_REQUESTS_IN_FLIGHT.labels(upstream="gemini").track_inprogress():
+                    start_time = time.perf_counter()
+                    response = await self._send(prompt, route, system_instruction, model_name=model_name)
+                    GEMINI_REQUEST_DURATION.labels(model=model_name).observe(time.perf_counter() - start_time)
+                    return response
+        
+        try:
+            return await retry_async(
+                attempt,
+                should_retry=is_retryable_gemini_error,
+                retry_after=gemini_retry_after,
+                description="Gemini generation"
+            )
+        except Exception as e:
+            UPSTREAM_ERRORS.labels(upstream="gemini", error_code=type(e).__name__).inc()
+            raise
+    
+    async def _send(
+        self,
+        prompt: str,
+        route: ModelRoute,
+        system_instruction: Optional[str] = None,
+        stream: bool = False,
+        model_name: Optional[str] = None
+    ):
+        """Make a single generate_content call; the caller has already been rate limited."""
+        model = self.get_model(model_name or route.model_name, system_instruction)
+        return await model.generate_content_async(
+            prompt,
+            safety_settings=self.safety_settings,
+            generation_config=self.generation_configs[route.name],
+            stream=stream
+        )
+    
+    async def _acquire_rate_limit(self, prompt: str, system_instruction: Optional[str]) -> None:
+        """Wait until the request and its input tokens fit within the Gemini rate limits."""
+        # Gemini meters input tokens, system instruction included; ~4 characters per token is close enough to pace on
+        await self.rate_limiter.acquire(tokens=(len(prompt) + len(system_instruction or "")) // 4)
+    
+    async def probe(self) -> None:
+        """Make a cheap token-count call to check that Gemini is reachable."""
+        await self.model.count_tokens_async("ping")
+    
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Return counters for single-flight request coalescing."""
+        return {
+            "in_flight": self._in_flight.in_flight(),
+            "leaders": self._in_flight.leaders,
+            "followers": self._in_flight.followers
+        }
+    
+    def cache_key(
+        self,
+        title: str,
+        notes: str,
+        tags: Optional[List[str]] = None,
+        route: Optional[ModelRoute] = None
+    ) -> str:
+        """Return the content-addressed cache key for a generation request on a route."""
+        route = route or self.router.route(notes, tags)
+        return make_cache_key(
+            title=title,
+            notes=notes,
+            tags=tags,
+            model_name=route.model_name,
+            template_version=PROMPT_TEMPLATE_VERSION,
+            generation_config=dataclasses.asdict(self.generation_configs[route.name])
+        )
+    
+    async def cache_blog_post(self, notes: str, blog_post: BlogPost, route: Optional[ModelRoute] = None) -> None:
+        """Store a post generated outside generate_blog_post, e.g. via streaming."""
+        if self.cache is not None:
+            await self.cache.set(self.cache_key(blog_post.title, notes, blog_post.tags, route), blog_post)
+    
+    def build_blog_post(
+        self,
+        title: str,
+        content: Union[str, MarkdownProcessor],
+        tags: Optional[List[str]] = None,
+        route: Optional[ModelRoute] = None,
+        model_name: Optional[str] = None
+    ) -> BlogPost:
+        """
+        Build a BlogPost from generated markdown.
+        
+        Args:
+            title: The blog post title
+            content: Raw markdown, or a processor already fed the streamed chunks
+            tags: Optional list of tags
+            route: Model tier that produced the content
+            model_name: Model that produced the content, if not the route's own
+            
+        Returns:
+            BlogPost: Post with cleaned content, summary and metadata
+        """
+        # Summary, outline and statistics come from one pass over the content
+        with observe_stage("extract_summary"):
+            if isinstance(content, MarkdownProcessor):
+                processed = content.finish()
+            else:
+                processed = process_markdown(content)
+        
+        return BlogPost(
+            title=title,
+            content=processed.content,
+            tags=tags,
+            summary=processed.summary,
+            model=model_name or (route.model_name if route else None),
+            route=route.name if route else None,
+            metadata=processed.metadata
+        )
+    
     def _create_prompt(self, title: str, notes: str, tags: Optional[List[str]] = None) -> str:
-        """Create a prompt for blog post generation."""
+        """Create the per-request part of the prompt; the rest is SYSTEM_INSTRUCTION."""
         
         tags_section = ""
         if tags:
             tags_section = f"\n\nTags to incorporate: {', '.join(tags)}"
         
         prompt = f"""
-You are a professional backend python senior engineer writing a technical blog post. Be quirky and unhinged like a senior engineer who's tired of LinkedIn influencer bullshit.
-
 Title: {title}
 
 Rough Notes:
 {notes}{tags_section}
-
-Requirements:
-1. Write in a professional but irreverent tone - like a senior engineer who knows their stuff
-2. Use proper Markdown formatting with headers, lists, code blocks, etc.
-3. Include an engaging introduction and conclusion
-4. Make the content informative and actionable with real examples
-5. Use appropriate technical terminology but explain complex concepts
-6. Structure the content with clear sections using # ## ### headers
-7. Add code examples in proper ```language code blocks where relevant
-8. Keep the content focused and valuable to readers
-9. Be human, funny, and slightly unhinged - capture personality in the writing
-10. Write directly in markdown - do NOT wrap your response in code blocks or add "```markdown" tags
-
-Generate the blog post content directly as markdown text, starting with the main heading:
 """
         
         return prompt.strip()
-    
-    def _extract_summary(self, content: str) -> str:
-        """Extract a summary from the generated content."""
-        # Remove markdown headers and formatting for summary
-        lines = content.split('\n')
-        summary_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#') and not line.startswith('```'):
-                summary_lines.append(line)
-                if len(' '.join(summary_lines)) > 150:
-                    break
-        
-        summary = ' '.join(summary_lines)
-        
-        # Limit to 200 characters
-        if len(summary) > 200:
-            summary = summary[:197] + "..."
-        
-        return summary 
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+Content-addressed cache for generated blog posts.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.blog import BlogPost
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    title: str,
+    notes: str,
+    tags: Optional[List[str]],
+    model_name: str,
+    template_version: str,
+    generation_config: Dict[str, Any]
+) -> str:
+    """
+    Build a content-addressed key for a generation request.
+
+    Whitespace differences in title and notes, and case, order and
+    duplicates in tags, do not change the key.
+
+    Args:
+        title: The blog post title
+        notes: Rough notes for the blog post
+        tags: Optional list of tags
+        model_name: Gemini model used for generation
+        template_version: Version of the prompt template
+        generation_config: Generation parameters sent to Gemini
+
+    Returns:
+        str: Hex SHA-256 digest identifying the request
+    """
+    payload = {
+        "title": " ".join(title.split()),
+        "notes": " ".join(notes.split()),
+        "tags": sorted({tag.strip().casefold() for tag in tags or [] if tag.strip()}),
+        "model": model_name,
+        "template_version": template_version,
+        "generation_config": generation_config
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class GenerationCache:
+    """Two-tier (memory LRU + optional SQLite) cache of generated posts."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, db_path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of posts kept in memory
+            ttl_seconds: How long an entry stays valid
+            db_path: SQLite file for the persistent tier; memory only if omitted
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+
+        self._memory: "OrderedDict[str, Tuple[float, BlogPost]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str) -> None:
+        """Open the SQLite tier and drop expired rows."""
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        with self._db_lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS generation_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "DELETE FROM generation_cache WHERE stored_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+
+    async def get(self, key: str) -> Optional[BlogPost]:
+        """
+        Look up a cached post.
+
+        Args:
+            key: Key from make_cache_key
+
+        Returns:
+            BlogPost if a fresh entry exists, otherwise None
+        """
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, post = entry
+            if now - stored_at < self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return post
+            del self._memory[key]
+
+        if self._db is not None:
+            row = await asyncio.to_thread(self._db_get, key)
+            if row is not None:
+                stored_at, value = row
+                if now - stored_at < self.ttl_seconds:
+                    post = BlogPost.model_validate_json(value)
+                    self._remember(key, stored_at, post)
+                    self.disk_hits += 1
+                    return post
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, post: BlogPost) -> None:
+        """
+        Store a generated post in every tier.
+
+        Args:
+            key: Key from make_cache_key
+            post: Generated blog post
+        """
+        stored_at = time.time()
+        self._remember(key, stored_at, post)
+
+        if self._db is not None:
+            try:
+                await asyncio.to_thread(self._db_set, key, stored_at, post.model_dump_json())
+            except Exception as e:
+                logger.warning(f"Failed to persist generation cache entry: {str(e)}")
+
+    def record_bypass(self) -> None:
+        """Count a request that skipped the cache lookup."""
+        self.bypasses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_ratio": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else None,
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "persistent": self._db is not None
+        }
+
+    def close(self) -> None:
+        """Close the SQLite tier."""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+
+    def _remember(self, key: str, stored_at: float, post: BlogPost) -> None:
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = (stored_at, post)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _db_get(self, key: str) -> Optional[Tuple[float, str]]:
+        with self._db_lock:
+            return self._db.execute(
+                "SELECT stored_at, value FROM generation_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+    def _db_set(self, key: str, stored_at: float, value: str) -> None:
+        with self._db_lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO generation_cache (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, value, stored_at)
+            )
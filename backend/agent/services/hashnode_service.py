@@ -2,22 +2,118 @@
 Hashnode service for publishing blog posts via GraphQL API.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 import httpx
 
 from ..config import settings
+from ..metrics import UPSTREAM_ERRORS, UPSTREAM_REQUESTS_IN_FLIGHT, observe_stage
 from ..models.hashnode import HashnodePublishRequest, HashnodePublishResponse
+from .idempotency_store import IdempotencyStore
+from .rate_limiter import RateLimiter
+from .retry import hashnode_retry_after, is_retryable_hashnode_error, is_retryable_publish_status, retry_async
+from .singleflight import SingleFlight
+from .swr_cache import StaleWhileRevalidateCache
+from .tag_service import TagResolver, normalize_tags, slugify
 
 logger = logging.getLogger(__name__)
 
+# Fields requested for every published post
+POST_SELECTION = """
+        post {
+            id
+            title
+            url
+            slug
+            publishedAt
+        }"""
+
+# Constant GraphQL documents; per-request data travels in ``variables``
+PUBLISH_POST_MUTATION = f"""
+mutation PublishPost($input: PublishPostInput!) {{
+    publishPost(input: $input) {{{POST_SELECTION}
+    }}
+}}
+""".strip()
+
+GET_PUBLICATION_QUERY = """
+query GetPublication($id: ObjectId!) {
+    publication(id: $id) {
+        id
+        title
+        displayTitle
+        url
+        metaDescription
+        favicon
+        isTeam
+        followersCount
+        author {
+            name
+            username
+        }
+    }
+}
+""".strip()
+
+
+@lru_cache(maxsize=None)
+def build_publish_many_mutation(count: int) -> str:
+    """
+    Build (once per size) a mutation publishing ``count`` posts.
+    
+    Each post is an aliased ``publishPost`` (p0, p1, ...) taking its
+    input from the matching ``$input0``, ``$input1``, ... variable.
+    """
+    variables = ", ".join(f"$input{index}: PublishPostInput!" for index in range(count))
+    operations = "".join(
+        f"""
+    p{index}: publishPost(input: $input{index}) {{{POST_SELECTION}
+    }}"""
+        for index in range(count)
+    )
+    return f"mutation PublishPosts({variables}) {{{operations}\n}}"
+
+
+class HashnodeGraphQLError(Exception):
+    """Hashnode answered a GraphQL request with errors."""
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all Hashnode calls."""
+    return httpx.AsyncClient(
+        http2=settings.hashnode_http2,
+        limits=httpx.Limits(
+            max_connections=settings.hashnode_max_connections,
+            max_keepalive_connections=settings.hashnode_max_keepalive_connections,
+            keepalive_expiry=settings.hashnode_keepalive_expiry
+        ),
+        timeout=httpx.Timeout(
+            settings.hashnode_read_timeout,
+            connect=settings.hashnode_connect_timeout
+        )
+    )
+
 
 class HashnodeService:
     """Service for publishing blog posts to Hashnode."""
     
-    def __init__(self):
-        """Initialize the Hashnode service."""
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        idempotency_store: Optional[IdempotencyStore] = None
+    ):
+        """
+        Initialize the Hashnode service.
+        
+        Args:
+            client: Shared HTTP client; a short-lived one is used per call if omitted
+            idempotency_store: Optional store of publish results by idempotency key
+        """
+        self.client = client
+        self.idempotency_store = idempotency_store
         self.api_url = settings.hashnode_api_url
         self.token = settings.hashnode_token
         self.publication_id = settings.hashnode_publication_id
@@ -26,73 +122,136 @@ class HashnodeService:
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
         }
+        
+        self.rate_limiter = RateLimiter(requests_per_minute=settings.hashnode_requests_per_minute)
+        
+        # Publication metadata rarely changes; serve it from memory
+        self.publication_cache: StaleWhileRevalidateCache[Dict[str, Any]] = StaleWhileRevalidateCache(
+            loader=self.fetch_publication_info,
+            ttl_seconds=settings.publication_cache_ttl_seconds,
+            max_stale_seconds=settings.publication_cache_max_stale_seconds
+        )
+        
+        # Tag IDs are looked up in bulk and reused across publishes
+        self.tag_resolver = TagResolver(
+            post_graphql=lambda payload: self._post_graphql(payload, idempotent=True),
+            ttl_seconds=settings.hashnode_tag_cache_ttl_seconds
+        )
+        
+        # Concurrent publishes with the same idempotency key share one call
+        self._idempotent_publishes: SingleFlight[HashnodePublishResponse] = SingleFlight()
     
-    async def publish_post(self, request: HashnodePublishRequest) -> HashnodePublishResponse:
+    async def publish_post(
+        self,
+        request: HashnodePublishRequest,
+        idempotency_key: Optional[str] = None
+    ) -> HashnodePublishResponse:
         """
         Publish a blog post to Hashnode.
         
+        With an idempotency key, a key that was already published successfully
+        returns the stored result without calling Hashnode. A publish already
+        in flight for the key is awaited, not repeated.
+        
         Args:
             request: The publish request containing post data
+            idempotency_key: Optional key identifying this publish
             
         Returns:
             HashnodePublishResponse: Response from Hashnode API
         """
+        if idempotency_key is None or self.idempotency_store is None:
+            return await self._publish_and_record(request)
+        
+        stored = await self.idempotency_store.get(idempotency_key)
+        if stored is not None:
+            logger.info(f"Replaying stored publish result for idempotency key: {idempotency_key}")
+            return stored.model_copy(update={"replayed": True})
+        
+        return await self._idempotent_publishes.do(
+            idempotency_key,
+            lambda: self._publish_idempotent(request, idempotency_key)
+        )
+    
+    async def _publish_idempotent(self, request: HashnodePublishRequest, idempotency_key: str) -> HashnodePublishResponse:
+        """Publish once for a key and store a successful result."""
+        # The previous holder of the key may have finished since our lookup
+        stored = await self.idempotency_store.get(idempotency_key)
+        if stored is not None:
+            return stored.model_copy(update={"replayed": True})
+        
+        response = await self._publish_and_record(request)
+        await self.idempotency_store.set(idempotency_key, response)
+        return response
+    
+    async def _publish_and_record(self, request: HashnodePublishRequest) -> HashnodePublishResponse:
+        """Publish a post, timing the stage and counting failures."""
+        with observe_stage("hashnode_publish"):
+            response = await self._publish_post(request)
+        
+        self._record_errors([response])
+        return response
+    
+    async def _publish_post(self, request: HashnodePublishRequest) -> HashnodePublishResponse:
+        """Publish a single post, converting failures into an error response."""
         try:
             logger.info(f"Publishing post to Hashnode: {request.title}")
             
-            # Prepare the GraphQL mutation
-            mutation = self._build_publish_mutation(request)
+            tag_inputs = await self.tag_resolver.publish_inputs(request.tags)
             
             # Make the API request
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json={"query": mutation},
-                    headers=self.headers,
-                    timeout=30.0
+            data = await self._post_graphql({
+                "query": PUBLISH_POST_MUTATION,
+                "variables": {"input": self._build_publish_input(request, tag_inputs)}
+            })
+            
+            # Check for GraphQL errors
+            if "errors" in data:
+                error_msg = "; ".join([error["message"] for error in data["errors"]])
+                logger.error(f"GraphQL errors: {error_msg}")
+                return HashnodePublishResponse(
+                    success=False,
+                    message=f"GraphQL errors: {error_msg}",
+                    error_code="GRAPHQL_ERROR"
                 )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Check for GraphQL errors
-                if "errors" in data:
-                    error_msg = "; ".join([error["message"] for error in data["errors"]])
-                    logger.error(f"GraphQL errors: {error_msg}")
-                    return HashnodePublishResponse(
-                        success=False,
-                        message=f"GraphQL errors: {error_msg}",
-                        error_code="GRAPHQL_ERROR"
-                    )
-                
-                # Parse successful response
-                post_data = data.get("data", {}).get("publishPost", {})
-                
-                if not post_data:
-                    return HashnodePublishResponse(
-                        success=False,
-                        message="No post data in response",
-                        error_code="EMPTY_RESPONSE"
-                    )
-                
-                post_id = post_data.get("post", {}).get("id")
-                post_url = post_data.get("post", {}).get("url")
-                
-                logger.info(f"Post published successfully: {post_url}")
-                
+            
+            # Parse successful response
+            post_data = data.get("data", {}).get("publishPost", {})
+            
+            if not post_data:
                 return HashnodePublishResponse(
-                    success=True,
-                    post_id=post_id,
-                    post_url=post_url,
-                    message="Post published successfully"
+                    success=False,
+                    message="No post data in response",
+                    error_code="EMPTY_RESPONSE"
                 )
-                
+            
+            post_id = post_data.get("post", {}).get("id")
+            post_url = post_data.get("post", {}).get("url")
+            
+            logger.info(f"Post published successfully: {post_url}")
+            
+            return HashnodePublishResponse(
+                success=True,
+                post_id=post_id,
+                post_url=post_url,
+                message="Post published successfully"
+            )
+            
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error publishing to Hashnode: {e}")
             return HashnodePublishResponse(
                 success=False,
                 message=f"HTTP error: {e.response.status_code} - {e.response.text}",
-                error_code="HTTP_ERROR"
+                error_code="HTTP_ERROR",
+                retryable=is_retryable_publish_status(e.response.status_code)
+            )
+        except httpx.TransportError as e:
+            logger.error(f"Network error publishing to Hashnode: {str(e)}")
+            return HashnodePublishResponse(
+                success=False,
+                message=f"Network error: {str(e)}",
+                error_code="NETWORK_ERROR",
+                retryable=True
             )
         except Exception as e:
             logger.error(f"Error publishing to Hashnode: {str(e)}")
@@ -102,109 +261,344 @@ class HashnodeService:
                 error_code="UNKNOWN_ERROR"
             )
     
-    def _build_publish_mutation(self, request: HashnodePublishRequest) -> str:
-        """Build the GraphQL mutation for publishing a post."""
-        
-        # Prepare tags
-        tags_str = ""
-        if request.tags:
-            # Convert tags to GraphQL array format with both name and slug
-            tag_objects = []
-            for tag in request.tags:
-                slug = self._create_tag_slug(tag)
-                tag_objects.append(f'{{name: "{self._escape_string(tag)}", slug: "{slug}"}}')
-            tags_str = f"tags: [{', '.join(tag_objects)}]"
-        
-        # Prepare cover image
-        cover_image_str = ""
-        if request.cover_image_url:
-            cover_image_str = f'coverImageOptions: {{coverImageURL: "{request.cover_image_url}"}}'
-        
-        mutation = f"""
-        mutation PublishPost {{
-            publishPost(input: {{
-                title: "{self._escape_string(request.title)}"
-                contentMarkdown: "{self._escape_string(request.content_markdown)}"
-                publicationId: "{self.publication_id}"
-                {tags_str}
-                {cover_image_str}
-                settings: {{
-                    delisted: false
-                    enableTableOfContent: true
-                    isNewsletterActivated: false
-                }}
-            }}) {{
-                post {{
-                    id
-                    title
-                    url
-                    slug
-                    publishedAt
-                }}
-            }}
-        }}
+    async def publish_many(
+        self,
+        requests: List[HashnodePublishRequest],
+        idempotency_keys: Optional[List[str]] = None
+    ) -> List[HashnodePublishResponse]:
+        """
+        Publish several blog posts, packing them into aliased mutations.
+        
+        Posts are sent in chunks of ``hashnode_publish_chunk_size``, one
+        HTTP request per chunk. GraphQL errors are mapped back to the post
+        whose alias they belong to, so partial failures are reported per post.
+        
+        With idempotency keys, posts whose key was already published
+        successfully return the stored result, posts sharing a key are
+        published once, and new successes are stored. Keys are claimed
+        before sending, so a concurrent ``publish_post`` or batch with the
+        same key waits for this one instead of publishing again, and vice versa.
+        
+        Args:
+            requests: Publish requests, in order
+            idempotency_keys: Optional key per request, in the same order
+            
+        Returns:
+            List[HashnodePublishResponse]: One response per request, in order
         """
+        responses: List[Optional[HashnodePublishResponse]] = [None] * len(requests)
         
-        return mutation.strip()
+        # Posts still to publish: (idempotency key, index of the request)
+        pending: List[Tuple[Optional[str], int]] = []
+        # Requests sharing each key; only the first is published
+        indexes_by_key: Dict[str, List[int]] = {}
+        # Keys this batch publishes; concurrent publishes of them wait for the batch
+        claims: Dict[str, "asyncio.Future[HashnodePublishResponse]"] = {}
+        # Keys another publish already has in flight
+        joined: List[str] = []
+        results: Dict[str, HashnodePublishResponse] = {}
+        
+        try:
+            for index in range(len(requests)):
+                key = idempotency_keys[index] if idempotency_keys and self.idempotency_store else None
+                if key is None:
+                    pending.append((None, index))
+                    continue
+                
+                if key in indexes_by_key:
+                    indexes_by_key[key].append(index)
+                    continue
+                indexes_by_key[key] = [index]
+                
+                claim = self._idempotent_publishes.claim(key)
+                if claim is None:
+                    joined.append(key)
+                    continue
+                claims[key] = claim
+                
+                # Checked after claiming, so a publish that finished since cannot be missed
+                stored = await self.idempotency_store.get(key)
+                if stored is not None:
+                    logger.info(f"Replaying stored publish result for idempotency key: {key}")
+                    results[key] = stored.model_copy(update={"replayed": True})
+                    continue
+                
+                pending.append((key, index))
+            
+            chunk_size = settings.hashnode_publish_chunk_size
+            published: List[HashnodePublishResponse] = []
+            
+            for offset in range(0, len(pending), chunk_size):
+                chunk = [requests[index] for _, index in pending[offset:offset + chunk_size]]
+                with observe_stage("hashnode_publish"):
+                    published.extend(await self._publish_chunk(chunk))
+            
+            self._record_errors(published)
+            
+            for (key, index), response in zip(pending, published):
+                if key is None:
+                    responses[index] = response
+                    continue
+                await self.idempotency_store.set(key, response)
+                results[key] = response
+            
+            for key, result in results.items():
+                if not claims[key].done():
+                    claims[key].set_result(result)
+        except BaseException as e:
+            for claim in claims.values():
+                if claim.done():
+                    continue
+                if isinstance(e, Exception):
+                    claim.set_exception(e)
+                else:
+                    claim.cancel()
+            raise
+        
+        # Wait for publishes of the same keys started elsewhere
+        for key in joined:
+            request = requests[indexes_by_key[key][0]]
+            results[key] = await self._idempotent_publishes.do(
+                key,
+                lambda request=request, key=key: self._publish_idempotent(request, key)
+            )
+        
+        for key, indexes in indexes_by_key.items():
+            first, *duplicates = indexes
+            responses[first] = results[key]
+            for index in duplicates:
+                responses[index] = results[key].model_copy(update={"replayed": results[key].success})
+        
+        return responses
     
-    def _create_tag_slug(self, tag_name: str) -> str:
-        """Create a URL-friendly slug from a tag name."""
-        import re
-        # Convert to lowercase, replace spaces and special chars with hyphens
-        slug = re.sub(r'[^\w\s-]', '', tag_name.lower())
-        slug = re.sub(r'[\s_-]+', '-', slug)
-        slug = slug.strip('-')
-        return slug
+    async def _publish_chunk(self, requests: List[HashnodePublishRequest]) -> List[HashnodePublishResponse]:
+        """Publish one chunk of posts in a single GraphQL request."""
+        try:
+            logger.info(f"Publishing {len(requests)} posts to Hashnode in one request")
+            
+            # One tag lookup covers every post in the chunk
+            tag_inputs = await self.tag_resolver.publish_inputs(
+                tag for request in requests for tag in request.tags or []
+            )
+            
+            data = await self._post_graphql({
+                "query": build_publish_many_mutation(len(requests)),
+                "variables": {
+                    f"input{index}": self._build_publish_input(request, tag_inputs)
+                    for index, request in enumerate(requests)
+                }
+            })
+            
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error publishing to Hashnode: {e}")
+            return [
+                HashnodePublishResponse(
+                    success=False,
+                    message=f"HTTP error: {e.response.status_code} - {e.response.text}",
+                    error_code="HTTP_ERROR",
+                    retryable=is_retryable_publish_status(e.response.status_code)
+                )
+                for _ in requests
+            ]
+        except httpx.TransportError as e:
+            logger.error(f"Network error publishing to Hashnode: {str(e)}")
+            return [
+                HashnodePublishResponse(
+                    success=False,
+                    message=f"Network error: {str(e)}",
+                    error_code="NETWORK_ERROR",
+                    retryable=True
+                )
+                for _ in requests
+            ]
+        except Exception as e:
+            logger.error(f"Error publishing to Hashnode: {str(e)}")
+            return [
+                HashnodePublishResponse(
+                    success=False,
+                    message=f"Publishing failed: {str(e)}",
+                    error_code="UNKNOWN_ERROR"
+                )
+                for _ in requests
+            ]
+        
+        # Group GraphQL errors by the alias at the root of their path
+        alias_errors: Dict[str, List[str]] = {}
+        global_errors: List[str] = []
+        for error in data.get("errors") or []:
+            path = error.get("path") or []
+            if path:
+                alias_errors.setdefault(str(path[0]), []).append(error["message"])
+            else:
+                global_errors.append(error["message"])
+        
+        # publishPost is non-null, so one failing alias nulls the whole ``data``
+        # even though the mutations executed before it were already published
+        execution_aborted = "data" in data and data["data"] is None
+        
+        results = data.get("data") or {}
+        responses = []
+        
+        for index in range(len(requests)):
+            alias = f"p{index}"
+            errors = alias_errors.get(alias, []) + global_errors
+            post = (results.get(alias) or {}).get("post") or {}
+            
+            if post:
+                logger.info(f"Post published successfully: {post.get('url')}")
+                responses.append(HashnodePublishResponse(
+                    success=True,
+                    post_id=post.get("id"),
+                    post_url=post.get("url"),
+                    message="Post published successfully"
+                ))
+            elif execution_aborted and alias not in alias_errors:
+                logger.warning(f"Outcome of {alias} unknown after another post in its batch failed")
+                responses.append(HashnodePublishResponse(
+                    success=False,
+                    message="Another post in the same request failed; this post may or may not have been published",
+                    error_code="OUTCOME_UNKNOWN"
+                ))
+            elif errors:
+                error_msg = "; ".join(errors)
+                logger.error(f"GraphQL errors for {alias}: {error_msg}")
+                responses.append(HashnodePublishResponse(
+                    success=False,
+                    message=f"GraphQL errors: {error_msg}",
+                    error_code="GRAPHQL_ERROR"
+                ))
+            else:
+                responses.append(HashnodePublishResponse(
+                    success=False,
+                    message="No post data in response",
+                    error_code="EMPTY_RESPONSE"
+                ))
+        
+        return responses
     
-    def _escape_string(self, text: str) -> str:
-        """Escape special characters for GraphQL strings."""
-        # Escape quotes and backslashes
-        return text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+    async def _post_graphql(self, payload: Dict[str, Any], idempotent: bool = False) -> Dict[str, Any]:
+        """
+        Send a rate-limited GraphQL request to Hashnode and return the decoded JSON body.
+        
+        Args:
+            payload: GraphQL query and variables
+            idempotent: Whether the request is safe to resend after an ambiguous failure
+        """
+        
+        async def attempt() -> Dict[str, Any]:
+            await self.rate_limiter.acquire()
+            
+            with UPSTREAM_REQUESTS_IN_FLIGHT.labels(upstream="hashnode").track_inprogress():
+                if self.client is not None:
+                    response = await self.client.post(self.api_url, json=payload, headers=self.headers)
+                else:
+                    async with create_http_client() as client:
+                        response = await client.post(self.api_url, json=payload, headers=self.headers)
+            
+            response.raise_for_status()
+            return response.json()
+        
+        return await retry_async(
+            attempt,
+            should_retry=lambda e: is_retryable_hashnode_error(e, idempotent),
+            retry_after=hashnode_retry_after,
+            description="Hashnode request"
+        )
+    
+    def _record_errors(self, responses: List[HashnodePublishResponse]) -> None:
+        """Count failed publish responses by error code."""
+        for response in responses:
+            if not response.success:
+                UPSTREAM_ERRORS.labels(upstream="hashnode", error_code=response.error_code or "UNKNOWN_ERROR").inc()
+    
+    def _build_publish_input(
+        self,
+        request: HashnodePublishRequest,
+        tag_inputs: Dict[str, Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Build the PublishPostInput variable for a post, given tag inputs keyed by slug."""
+        
+        publish_input: Dict[str, Any] = {
+            "title": request.title,
+            "contentMarkdown": request.content_markdown,
+            "publicationId": self.publication_id,
+            "settings": {
+                "delisted": False,
+                "enableTableOfContent": True,
+                "isNewsletterActivated": False
+            }
+        }
+        
+        # Known tags by ID, new ones by name and slug; near-duplicates are sent once
+        tags = normalize_tags(request.tags)
+        if tags:
+            publish_input["tags"] = [tag_inputs[slugify(tag)] for tag in tags]
+        
+        if request.cover_image_url:
+            publish_input["coverImageOptions"] = {"coverImageURL": request.cover_image_url}
+        
+        return publish_input
     
     async def get_publication_info(self) -> Optional[Dict[str, Any]]:
         """
-        Get information about the configured publication.
+        Get information about the configured publication from the cache.
+        
+        Stale entries are returned immediately and refreshed in the
+        background; see ``publication_cache.age()`` for the entry's age.
+        
+        Returns:
+            Dict containing publication info or None if unavailable
+        """
+        return await self.publication_cache.get()
+    
+    async def fetch_publication_info(self) -> Optional[Dict[str, Any]]:
+        """
+        Fetch information about the configured publication from Hashnode.
         
         Returns:
             Dict containing publication info or None if error
         """
         try:
-            query = f"""
-            query GetPublication {{
-                publication(id: "{self.publication_id}") {{
-                    id
-                    title
-                    displayTitle
-                    url
-                    metaDescription
-                    favicon
-                    isTeam
-                    followersCount
-                    author {{
-                        name
-                        username
-                    }}
-                }}
-            }}
-            """
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json={"query": query},
-                    headers=self.headers,
-                    timeout=30.0
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                if "errors" in data:
-                    logger.error(f"Error fetching publication info: {data['errors']}")
-                    return None
-                
-                return data.get("data", {}).get("publication")
-                
+            return await self._query_publication()
         except Exception as e:
             logger.error(f"Error fetching publication info: {str(e)}")
-            return None 
\ No newline at end of file
+            if isinstance(e, httpx.HTTPStatusError):
+                error_code = "HTTP_ERROR"
+            elif isinstance(e, HashnodeGraphQLError):
+                error_code = "GRAPHQL_ERROR"
+            else:
+                error_code = "UNKNOWN_ERROR"
+            UPSTREAM_ERRORS.labels(upstream="hashnode", error_code=error_code).inc()
+            return None
+    
+    async def probe(self) -> Optional[str]:
+        """
+        Fetch the publication to check that Hashnode is reachable.
+        
+        A successful probe also refreshes the publication cache.
+        
+        Returns:
+            The publication title
+            
+        Raises:
+            Exception: The underlying transport, HTTP or GraphQL error
+        """
+        publication = await self._query_publication()
+        self.publication_cache.set(publication)
+        return publication.get("title")
+    
+    async def _query_publication(self) -> Dict[str, Any]:
+        """Query the configured publication, raising on any failure."""
+        data = await self._post_graphql({
+            "query": GET_PUBLICATION_QUERY,
+            "variables": {"id": self.publication_id}
+        }, idempotent=True)
+        
+        if data.get("errors"):
+            raise HashnodeGraphQLError("; ".join(error.get("message", "") for error in data["errors"]))
+        
+        publication = (data.get("data") or {}).get("publication")
+        if not publication:
+            raise HashnodeGraphQLError(f"Publication {self.publication_id} not found")
+        
+        return publication
@@ -0,0 +1,125 @@
+"""
+Background prober that keeps a snapshot of upstream dependency health.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
+
+from ..models.health import DependencyHealth
+from .gemini_service import GeminiService
+from .hashnode_service import HashnodeService
+
+logger = logging.getLogger(__name__)
+
+
+class HealthProber:
+    """Probe Hashnode and Gemini on an interval and record the results."""
+
+    def __init__(
+        self,
+        gemini_service: GeminiService,
+        hashnode_service: HashnodeService,
+        interval_seconds: float,
+        timeout_seconds: float
+    ):
+        """
+        Initialize the prober.
+
+        Args:
+            gemini_service: Shared Gemini service
+            hashnode_service: Shared Hashnode service
+            interval_seconds: Time between probe rounds
+            timeout_seconds: Maximum time a single probe may take
+        """
+        self.gemini_service = gemini_service
+        self.hashnode_service = hashnode_service
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+
+        self._snapshot: Dict[str, DependencyHealth] = {
+            "hashnode": DependencyHealth(),
+            "gemini": DependencyHealth()
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start probing in the background."""
+        self._task = asyncio.create_task(self._run(), name="health-prober")
+
+    async def stop(self) -> None:
+        """Stop probing and wait for the task to exit."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def snapshot(self) -> Dict[str, DependencyHealth]:
+        """Return the latest probe result per dependency."""
+        return dict(self._snapshot)
+
+    async def probe_once(self) -> None:
+        """Run one round of probes concurrently."""
+        await asyncio.gather(
+            self._probe("hashnode", self._probe_hashnode),
+            self._probe("gemini", self._probe_gemini)
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe_once()
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _probe(self, name: str, check: Callable[[], Awaitable[Optional[str]]]) -> None:
+        """Time a single probe and store its result."""
+        previous = self._snapshot[name]
+        start_time = time.perf_counter()
+
+        try:
+            detail = await self._with_timeout(check)
+            now = datetime.now()
+            self._snapshot[name] = DependencyHealth(
+                status="connected",
+                latency_ms=round((time.perf_counter() - start_time) * 1000, 2),
+                checked_at=now,
+                last_success_at=now,
+                detail=detail
+            )
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            logger.warning(f"Health probe for {name} failed: {error}")
+            self._snapshot[name] = DependencyHealth(
+                status="error",
+                latency_ms=round((time.perf_counter() - start_time) * 1000, 2),
+                last_error=error,
+                checked_at=datetime.now(),
+                last_success_at=previous.last_success_at,
+                detail=previous.detail
+            )
+
+    async def _with_timeout(self, check: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+        """
+        Run a probe with the probe timeout.
+
+        asyncio.wait is used instead of wait_for, which on Python 3.11 can
+        swallow a stop() that lands just as the probe finishes and keep the
+        probe loop running.
+        """
+        probe = asyncio.ensure_future(check())
+        try:
+            done, _ = await asyncio.wait({probe}, timeout=self.timeout_seconds)
+        finally:
+            probe.cancel()
+
+        if not done:
+            raise asyncio.TimeoutError(f"Probe timed out after {self.timeout_seconds}s")
+        return probe.result()
+
+    async def _probe_hashnode(self) -> Optional[str]:
+        return await self.hashnode_service.probe()
+
+    async def _probe_gemini(self) -> Optional[str]:
+        await self.gemini_service.probe()
+        return self.gemini_service.model.model_name
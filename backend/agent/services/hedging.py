@@ -0,0 +1,87 @@
+"""
+Hedged requests: race a backup call against a slow primary.
+"""
+
+import asyncio
+import math
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyWindow:
+    """Rolling window of recent latencies for percentile estimates."""
+
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        """
+        Initialize an empty window.
+
+        Args:
+            size: Number of most recent samples kept
+            min_samples: Samples needed before percentiles are reported
+        """
+        self._samples: Deque[float] = deque(maxlen=size)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample."""
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the ``q`` quantile (0-1) of the window, or None if too few samples."""
+        if len(self._samples) < self.min_samples:
+            return None
+
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+
+async def hedge(
+    primary: Callable[[], Awaitable[T]],
+    backup: Callable[[], Awaitable[T]],
+    delay: float
+) -> Tuple[T, bool]:
+    """
+    Run ``primary``; if it has not finished after ``delay`` seconds, also run
+    ``backup`` and return whichever succeeds first, cancelling the other.
+
+    If one call fails while the other is still running, the other's outcome
+    is used instead.
+
+    Args:
+        primary: Coroutine function for the preferred call
+        backup: Coroutine function for the hedge call
+        delay: Seconds to wait on ``primary`` before starting ``backup``
+
+    Returns:
+        The winning result and whether it came from ``backup``
+
+    Raises:
+        Exception: The primary's error if both calls fail
+    """
+    primary_task = asyncio.create_task(primary())
+    backup_task: Optional[asyncio.Task] = None
+
+    try:
+        done, _ = await asyncio.wait({primary_task}, timeout=delay)
+        if done:
+            return primary_task.result(), False
+
+        backup_task = asyncio.create_task(backup())
+        pending = {primary_task, backup_task}
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Prefer the primary if both finished in the same iteration
+            for task in sorted(done, key=lambda t: t is not primary_task):
+                if task.exception() is None:
+                    return task.result(), task is backup_task
+
+        # Both failed; surface the primary's error
+        return primary_task.result(), False
+    finally:
+        for task in (primary_task, backup_task):
+            if task is not None and not task.done():
+                task.cancel()
@@ -0,0 +1,123 @@
+"""
+Persistent store of publish results keyed by idempotency key.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from ..models.hashnode import HashnodePublishResponse
+
+logger = logging.getLogger(__name__)
+
+
+def content_idempotency_key(title: str, content_markdown: str) -> str:
+    """
+    Derive an idempotency key from a post's title and markdown.
+
+    Args:
+        title: Post title
+        content_markdown: Post body
+
+    Returns:
+        str: Key shared by every publish of the same content
+    """
+    digest = hashlib.sha256(f"{title.strip()}\0{content_markdown.strip()}".encode("utf-8")).hexdigest()
+    return f"content:{digest}"
+
+
+class IdempotencyStore:
+    """
+    SQLite table of successful publish results with a TTL.
+
+    Only successful results are stored, so a failed publish can be retried
+    with the same key.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float):
+        """
+        Open (or create) the store.
+
+        Args:
+            db_path: SQLite file path
+            ttl_seconds: How long a stored result is replayed
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db: Optional[sqlite3.Connection] = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS idempotency_keys ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "DELETE FROM idempotency_keys WHERE stored_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+
+    async def get(self, key: str) -> Optional[HashnodePublishResponse]:
+        """
+        Return the stored result for a key, if it has not expired.
+
+        Args:
+            key: Idempotency key
+
+        Returns:
+            HashnodePublishResponse if the key was published successfully, otherwise None
+        """
+        row = await asyncio.to_thread(self._db_get, key)
+        if row is None:
+            return None
+
+        stored_at, value = row
+        if time.time() - stored_at >= self.ttl_seconds:
+            return None
+
+        return HashnodePublishResponse.model_validate_json(value)
+
+    async def set(self, key: str, response: HashnodePublishResponse) -> None:
+        """
+        Store a successful publish result.
+
+        Args:
+            key: Idempotency key
+            response: Result to replay for later requests with the key
+        """
+        if not response.success:
+            return
+
+        try:
+            await asyncio.to_thread(self._db_set, key, time.time(), response.model_dump_json())
+        except Exception as e:
+            logger.warning(f"Failed to store idempotency key: {str(e)}")
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
+            self._db = None
+
+    def _db_get(self, key: str) -> Optional[Tuple[float, str]]:
+        with self._lock:
+            return self._db.execute(
+                "SELECT stored_at, response FROM idempotency_keys WHERE key = ?", (key,)
+            ).fetchone()
+
+    def _db_set(self, key: str, stored_at: float, value: str) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO idempotency_keys (key, response, stored_at) VALUES (?, ?, ?)",
+                (key, value, stored_at)
+            )
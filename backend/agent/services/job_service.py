@@ -0,0 +1,204 @@
+"""
+In-process job queue for asynchronous generation and publishing.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional
+
+from ..models.blog import BlogRequest, BlogResponse
+from ..models.hashnode import HashnodePublishRequest
+from ..models.job import Job, JobStatus
+from ..timing import timing_context, timings_snapshot
+from .draft_store import DraftStore
+from .gemini_service import GeminiService
+from .idempotency_store import content_idempotency_key
+from .publish_outbox import PublishOutbox
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobManager:
+    """Bounded job queue served by a fixed pool of worker tasks."""
+
+    def __init__(
+        self,
+        gemini_service: GeminiService,
+        publish_outbox: PublishOutbox,
+        draft_store: DraftStore,
+        workers: int,
+        queue_size: int,
+        retention: int
+    ):
+        """
+        Initialize the job manager.
+
+        Args:
+            gemini_service: Shared Gemini service
+            publish_outbox: Outbox that publish_immediately jobs are queued in
+            draft_store: Store every generated post is saved to
+            workers: Number of worker tasks
+            queue_size: Maximum number of jobs waiting to start
+            retention: Maximum number of jobs kept for status lookups
+        """
+        self.gemini_service = gemini_service
+        self.publish_outbox = publish_outbox
+        self.draft_store = draft_store
+        self.worker_count = workers
+        self.retention = retention
+
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._workers: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start the worker tasks."""
+        for index in range(self.worker_count):
+            self._workers.append(asyncio.create_task(self._worker(), name=f"job-worker-{index}"))
+        logger.info(f"Started {self.worker_count} job workers")
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks and wait for them to exit."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def submit(self, request: BlogRequest) -> Job:
+        """
+        Queue a generation job.
+
+        Args:
+            request: Blog generation request
+
+        Returns:
+            Job: The queued job
+
+        Raises:
+            JobQueueFullError: If the queue is at capacity
+        """
+        job = Job(id=uuid.uuid4().hex, request=request)
+
+        try:
+            self._queue.put_nowait(job.id)
+        except asyncio.QueueFull:
+            raise JobQueueFullError("Job queue is full, try again later")
+
+        self._jobs[job.id] = job
+        self._evict_finished()
+
+        logger.info(f"Queued job {job.id}: {request.title}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by ID, or None if unknown or evicted."""
+        return self._jobs.get(job_id)
+
+    async def _worker(self) -> None:
+        """Take jobs off the queue and run them until cancelled."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    with timing_context():
+                        await self._run(job)
+            except Exception as e:
+                logger.error(f"Job worker error: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        """Execute a single job, recording each stage."""
+        request = job.request
+
+        job.status = JobStatus.GENERATING
+        job.timestamps.generating_at = datetime.now()
+        start_time = time.time()
+
+        try:
+            blog_post = await self.gemini_service.generate_blog_post(
+                title=request.title,
+                notes=request.notes,
+                tags=request.tags,
+                use_cache=request.use_cache,
+                optimize_for=request.optimize_for
+            )
+        except Exception as e:
+            logger.error(f"Job {job.id} failed to generate: {str(e)}")
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            job.result = BlogResponse(
+                success=False,
+                message=f"Failed to generate blog post: {str(e)}",
+                generation_time_seconds=time.time() - start_time,
+                timings=timings_snapshot()
+            )
+            job.timestamps.done_at = datetime.now()
+            return
+
+        generation_time = time.time() - start_time
+
+        draft_id = None
+        try:
+            draft_id = await self.draft_store.save(blog_post, timings_snapshot())
+        except Exception as e:
+            logger.error(f"Job {job.id} failed to save draft: {str(e)}")
+
+        publish_entry = None
+        if request.publish_immediately:
+            job.status = JobStatus.PUBLISHING
+            job.timestamps.publishing_at = datetime.now()
+
+            # Queued like /blog/generate; the outbox retries and reports the publish
+            try:
+                publish_entry = await self.publish_outbox.enqueue(
+                    HashnodePublishRequest(
+                        title=blog_post.title,
+                        content_markdown=blog_post.content,
+                        tags=blog_post.tags
+                    ),
+                    idempotency_key=content_idempotency_key(blog_post.title, blog_post.content)
+                )
+            except Exception as e:
+                logger.error(f"Job {job.id} failed to queue for publishing: {str(e)}")
+                job.error = f"Failed to queue for publishing: {str(e)}"
+
+        message = "Blog post generated successfully"
+        if publish_entry is not None:
+            message += " and published to Hashnode" if publish_entry.post_url else " and queued for publishing"
+        elif request.publish_immediately:
+            message += " but could not be queued for publishing"
+
+        job.result = BlogResponse(
+            success=True,
+            blog_post=blog_post,
+            hashnode_url=publish_entry.post_url if publish_entry else None,
+            draft_id=draft_id,
+            outbox_id=publish_entry.id if publish_entry else None,
+            publish_status=publish_entry.status.value if publish_entry else None,
+            message=message,
+            generation_time_seconds=generation_time,
+            timings=timings_snapshot()
+        )
+        job.status = JobStatus.DONE
+        job.timestamps.done_at = datetime.now()
+
+    def _evict_finished(self) -> None:
+        """Drop the oldest finished jobs once retention is exceeded."""
+        if len(self._jobs) <= self.retention:
+            return
+
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.retention:
+                break
+            if self._jobs[job_id].status in (JobStatus.DONE, JobStatus.FAILED):
+                del self._jobs[job_id]
@@ -0,0 +1,253 @@
+"""
+Long-form generation: outline the notes, draft sections concurrently, stitch.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ..config import settings
+from ..metrics import observe_stage
+from ..models.blog import BlogPost
+from .gemini_service import WRITER_PERSONA, GeminiService
+from .model_router import OUTLINE_ROUTE, ModelRoute
+
+logger = logging.getLogger(__name__)
+
+# System instruction for section, introduction and conclusion calls; the outline call has none
+WRITER_INSTRUCTION = WRITER_PERSONA
+
+
+@dataclass
+class OutlineSection:
+    """One section of a long-form outline."""
+
+    heading: str
+    points: List[str]
+
+
+class LongformService:
+    """
+    Generate long posts from notes too large for a single prompt.
+
+    A fast model turns the notes into an outline whose sections carry the
+    key points they need. Sections are then drafted concurrently, while the
+    introduction and conclusion are written from the outline, so wall time
+    is roughly one outline call plus one section call.
+    """
+
+    def __init__(self, gemini_service: GeminiService):
+        """
+        Initialize the long-form service.
+
+        Args:
+            gemini_service: Shared Gemini service used for every call
+        """
+        self.gemini_service = gemini_service
+
+    async def generate_blog_post(
+        self,
+        title: str,
+        notes: str,
+        tags: Optional[List[str]] = None,
+        optimize_for: Optional[str] = None
+    ) -> BlogPost:
+        """
+        Generate a long-form blog post.
+
+        Args:
+            title: The blog post title
+            notes: Research notes for the blog post
+            tags: Optional list of tags
+            optimize_for: Optional ``"quality"`` or ``"latency"`` hint for section drafting
+
+        Returns:
+            BlogPost: Stitched blog post
+
+        Raises:
+            Exception: If any step fails
+        """
+        try:
+            with observe_stage("longform_outline"):
+                outline = await self._outline(title, notes, tags)
+
+            logger.info(f"Drafting {len(outline)} sections for long-form post: {title}")
+
+            route = self.gemini_service.select_route(notes, tags, optimize_for)
+            semaphore = asyncio.Semaphore(settings.longform_section_concurrency)
+
+            async def draft(section: OutlineSection) -> str:
+                async with semaphore:
+                    return await self._draft_section(title, outline, section, route)
+
+            with observe_stage("longform_sections"):
+                intro, conclusion, *sections = await asyncio.gather(
+                    self.gemini_service.complete(self._intro_prompt(title, outline, tags), route, WRITER_INSTRUCTION),
+                    self.gemini_service.complete(self._conclusion_prompt(title, outline), route, WRITER_INSTRUCTION),
+                    *(draft(section) for section in outline)
+                )
+
+            content = self._stitch(title, intro, outline, sections, conclusion)
+            return self.gemini_service.build_blog_post(title, content, tags, route=route)
+
+        except Exception as e:
+            logger.error(f"Error generating long-form blog post: {str(e)}")
+            raise Exception(f"Failed to generate long-form blog post: {str(e)}")
+
+    async def _outline(self, title: str, notes: str, tags: Optional[List[str]]) -> List[OutlineSection]:
+        """Ask the outline model for sections and parse its JSON answer."""
+        route = self.gemini_service.router.routes[OUTLINE_ROUTE]
+        text = await self.gemini_service.complete(self._outline_prompt(title, notes, tags), route)
+        return parse_outline(text, settings.longform_max_sections)
+
+    async def _draft_section(
+        self,
+        title: str,
+        outline: List[OutlineSection],
+        section: OutlineSection,
+        route: ModelRoute
+    ) -> str:
+        """Draft the body of one section."""
+        text = await self.gemini_service.complete(
+            self._section_prompt(title, outline, section),
+            route,
+            WRITER_INSTRUCTION
+        )
+        return _strip_leading_heading(text)
+
+    @staticmethod
+    def _outline_prompt(title: str, notes: str, tags: Optional[List[str]]) -> str:
+        tags_section = f"\n\nTags to incorporate: {', '.join(tags)}" if tags else ""
+
+        return f"""
+You are planning a long-form technical blog post.
+
+Title: {title}
+
+Research Notes:
+{notes}{tags_section}
+
+Split the post into at most {settings.longform_max_sections} sections that together cover the notes, in reading order.
+Do not include an introduction or conclusion section; those are written separately.
+Each section will be written from its points alone, so the points must carry every detail from the notes the section needs (numbers, names, code, caveats).
+
+Respond with JSON only, in this shape:
+{{"sections": [{{"heading": "Section heading", "points": ["key point", "..."]}}]}}
+""".strip()
+
+    @staticmethod
+    def _section_prompt(title: str, outline: List[OutlineSection], section: OutlineSection) -> str:
+        headings = "\n".join(f"- {item.heading}" for item in outline)
+        points = "\n".join(f"- {point}" for point in section.points)
+
+        return f"""
+You are writing one section of the post "{title}". The full outline is:
+{headings}
+
+Section to write: {section.heading}
+
+Key points for this section:
+{points}
+
+Requirements:
+1. Write only the body of this section in Markdown - do NOT repeat the section heading
+2. Use ### sub-headings, lists and ```language code blocks where they help
+3. Cover every key point, with real examples; leave other sections' material to them
+4. Do NOT wrap your response in code blocks or add "```markdown" tags
+""".strip()
+
+    @staticmethod
+    def _intro_prompt(title: str, outline: List[OutlineSection], tags: Optional[List[str]]) -> str:
+        headings = "\n".join(f"- {item.heading}" for item in outline)
+        tags_section = f"\n\nTags to incorporate: {', '.join(tags)}" if tags else ""
+
+        return f"""
+Write the engaging introduction for the post "{title}", which covers these sections:
+{headings}{tags_section}
+
+Write one to three paragraphs of Markdown with no heading. Do NOT wrap your response in code blocks.
+""".strip()
+
+    @staticmethod
+    def _conclusion_prompt(title: str, outline: List[OutlineSection]) -> str:
+        summary = "\n".join(
+            f"- {item.heading}: {'; '.join(item.points[:3])}"
+            for item in outline
+        )
+
+        return f"""
+Write the conclusion for the post "{title}". The post covered:
+{summary}
+
+Write one to three paragraphs of Markdown with no heading that tie the sections together and leave readers with something actionable. Do NOT wrap your response in code blocks.
+""".strip()
+
+    @staticmethod
+    def _stitch(
+        title: str,
+        intro: str,
+        outline: List[OutlineSection],
+        sections: List[str],
+        conclusion: str
+    ) -> str:
+        parts = [f"# {title}", intro.strip()]
+        for section, body in zip(outline, sections):
+            parts.append(f"## {section.heading}\n\n{body.strip()}")
+        parts.append(f"## Conclusion\n\n{_strip_leading_heading(conclusion).strip()}")
+        return "\n\n".join(parts)
+
+
+def parse_outline(text: str, max_sections: int) -> List[OutlineSection]:
+    """
+    Parse the outline model's JSON answer.
+
+    Args:
+        text: Raw model output, optionally wrapped in a code fence
+        max_sections: Sections beyond this are dropped
+
+    Returns:
+        List[OutlineSection]: Outline sections in order
+
+    Raises:
+        ValueError: If the answer is not a usable outline
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rsplit("```", 1)[0]
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Outline is not valid JSON: {str(e)}")
+
+    items = data.get("sections") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        raise ValueError("Outline has no sections")
+
+    sections = []
+    for item in items:
+        if not isinstance(item, dict) or not str(item.get("heading", "")).strip():
+            continue
+        points = item.get("points") or []
+        if isinstance(points, str):
+            points = [points]
+        sections.append(OutlineSection(
+            heading=str(item["heading"]).strip(),
+            points=[str(point).strip() for point in points if str(point).strip()]
+        ))
+
+    if not sections:
+        raise ValueError("Outline has no sections")
+
+    return sections[:max_sections]
+
+
+def _strip_leading_heading(text: str) -> str:
+    """Drop a heading the model put on the first line despite instructions."""
+    text = text.strip()
+    if text.startswith("#"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+    return text.strip()
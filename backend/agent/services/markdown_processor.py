@@ -0,0 +1,221 @@
+"""
+Single-pass markdown post-processing: clean-up, summary, outline and statistics.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from ..config import settings
+from ..models.blog import HeadingEntry, PostMetadata
+
+# Summary: prose lines are collected until they pass the target, then cut to the limit
+SUMMARY_TARGET_CHARS = 150
+SUMMARY_MAX_CHARS = 200
+
+# Heading levels listed in the table of contents
+TOC_MIN_LEVEL = 2
+TOC_MAX_LEVEL = 3
+
+_WRAPPER_FENCE = re.compile(r"^(?:`{3,}|~{3,})\s*(?:markdown|md)\s*$", re.IGNORECASE)
+_FENCE = re.compile(r"^(`{3,}|~{3,})\s*([^\s`]*)")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$")
+_ANCHOR_STRIP = re.compile(r"[^\w\s-]")
+_ANCHOR_SPACES = re.compile(r"\s+")
+
+
+@dataclass
+class ProcessedMarkdown:
+    """Cleaned markdown with the summary and metadata derived from it."""
+
+    content: str
+    summary: str
+    metadata: PostMetadata
+
+
+class MarkdownProcessor:
+    """
+    Process generated markdown line by line in a single pass.
+
+    Text can be fed in arbitrary chunks as it streams in; only the current
+    partial line is buffered, so the total cost is linear in the length of
+    the document. ``finish`` returns the cleaned content along with its
+    summary, heading outline, table of contents, word count, reading time
+    and code block languages.
+
+    A ```` ```markdown ```` fence wrapping the whole document (which models
+    add despite being told not to) is removed.
+    """
+
+    def __init__(self, words_per_minute: Optional[int] = None):
+        """
+        Initialize the processor.
+
+        Args:
+            words_per_minute: Reading speed for the reading-time estimate; defaults to the configured speed
+        """
+        self.words_per_minute = words_per_minute or settings.reading_words_per_minute
+
+        self._pending: List[str] = []
+        self._lines: List[str] = []
+        self._started = False
+        self._wrapped = False
+        self._last_text_line = -1
+
+        # Open code block: its fence marker, the index of its opening line and its language
+        self._fence: Optional[str] = None
+        self._fence_line = -1
+        self._fence_language = ""
+
+        self._summary_parts: List[str] = []
+        self._summary_length = 0
+        self._words = 0
+        self._headings: List[HeadingEntry] = []
+        self._anchors: Dict[str, int] = {}
+        self._languages: Dict[str, None] = {}
+        self._code_blocks = 0
+
+    def feed(self, chunk: str) -> None:
+        """
+        Consume the next piece of the document.
+
+        Args:
+            chunk: Markdown text, split anywhere
+        """
+        self._pending.append(chunk)
+        if "\n" not in chunk:
+            return
+
+        lines = "".join(self._pending).split("\n")
+        self._pending = [lines.pop()]
+        for line in lines:
+            self._process_line(line)
+
+    def finish(self) -> ProcessedMarkdown:
+        """
+        Process any buffered text and return the result.
+
+        Returns:
+            ProcessedMarkdown: Cleaned content, summary and metadata
+        """
+        tail = "".join(self._pending)
+        self._pending = []
+        if tail:
+            self._process_line(tail)
+
+        # The closing half of a wrapper fence parses as a bare fence opening an empty block
+        if (
+            self._wrapped
+            and self._fence is not None
+            and self._fence_line == self._last_text_line
+            and not self._fence_language
+        ):
+            del self._lines[self._fence_line:]
+            self._code_blocks -= 1
+            self._fence = None
+
+        summary = " ".join(self._summary_parts)
+        if len(summary) > SUMMARY_MAX_CHARS:
+            summary = summary[:SUMMARY_MAX_CHARS - 3] + "..."
+
+        metadata = PostMetadata(
+            word_count=self._words,
+            reading_time_minutes=math.ceil(self._words / self.words_per_minute),
+            headings=self._headings,
+            table_of_contents=self._table_of_contents(),
+            code_languages=list(self._languages),
+            code_blocks=self._code_blocks
+        )
+
+        return ProcessedMarkdown(
+            content="\n".join(self._lines).strip(),
+            summary=summary,
+            metadata=metadata
+        )
+
+    def _process_line(self, line: str) -> None:
+        """Classify one line and update the running state."""
+        stripped = line.strip()
+
+        if not self._started:
+            if not stripped:
+                return
+            self._started = True
+            if _WRAPPER_FENCE.match(stripped):
+                self._wrapped = True
+                return
+
+        if stripped:
+            self._last_text_line = len(self._lines)
+        self._lines.append(line)
+
+        if self._fence is not None:
+            if stripped and len(stripped) >= len(self._fence) and stripped == self._fence[0] * len(stripped):
+                self._fence = None
+            return
+
+        fence = _FENCE.match(stripped)
+        if fence:
+            self._fence = fence.group(1)
+            self._fence_line = len(self._lines) - 1
+            self._fence_language = fence.group(2).lower()
+            self._code_blocks += 1
+            if self._fence_language:
+                self._languages.setdefault(self._fence_language)
+            return
+
+        if not stripped:
+            return
+
+        heading = _HEADING.match(stripped)
+        if heading:
+            text = heading.group(2)
+            self._headings.append(HeadingEntry(
+                level=len(heading.group(1)),
+                text=text,
+                anchor=self._anchor(text)
+            ))
+            self._words += len(text.split())
+            return
+
+        self._words += len(stripped.split())
+
+        # Like headings, "#Title" lines (no space after the hashes) stay out of the summary
+        if stripped.startswith("#"):
+            return
+
+        if self._summary_length <= SUMMARY_TARGET_CHARS:
+            self._summary_length += len(stripped) + (1 if self._summary_parts else 0)
+            self._summary_parts.append(stripped)
+
+    def _anchor(self, text: str) -> str:
+        """Build a unique URL-friendly anchor for a heading."""
+        base = _ANCHOR_SPACES.sub("-", _ANCHOR_STRIP.sub("", text.lower()).strip()) or "section"
+        count = self._anchors.get(base, 0)
+        self._anchors[base] = count + 1
+        return base if count == 0 else f"{base}-{count}"
+
+    def _table_of_contents(self) -> str:
+        """Render the section headings as a nested markdown list of links."""
+        return "\n".join(
+            f"{'  ' * (heading.level - TOC_MIN_LEVEL)}- [{heading.text}](#{heading.anchor})"
+            for heading in self._headings
+            if TOC_MIN_LEVEL <= heading.level <= TOC_MAX_LEVEL
+        )
+
+
+def process_markdown(content: str, words_per_minute: Optional[int] = None) -> ProcessedMarkdown:
+    """
+    Process a complete markdown document.
+
+    Args:
+        content: Markdown text
+        words_per_minute: Reading speed for the reading-time estimate
+
+    Returns:
+        ProcessedMarkdown: Cleaned content, summary and metadata
+    """
+    processor = MarkdownProcessor(words_per_minute)
+    processor.feed(content)
+    return processor.finish()
@@ -0,0 +1,102 @@
+"""
+Size-aware routing of generation requests between Gemini model tiers.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from ..config import settings
+
+FAST_ROUTE = "fast"
+QUALITY_ROUTE = "quality"
+# Not chosen by the router; used directly for long-form outlines
+OUTLINE_ROUTE = "outline"
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """A model and output-token budget requests can be routed to."""
+
+    name: str
+    model_name: str
+    max_output_tokens: int
+    response_mime_type: Optional[str] = None
+
+
+class ModelRouter:
+    """
+    Pick a model tier for a generation request.
+
+    Short notes with few tags go to the fast tier, everything else to the
+    quality tier. A request-level ``optimize_for`` hint overrides the size
+    heuristic.
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, ModelRoute],
+        short_notes_chars: int,
+        max_fast_tags: int,
+        enabled: bool = True
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            routes: Route table keyed by route name; must contain ``fast`` and ``quality``
+            short_notes_chars: Notes at or below this length may use the fast tier
+            max_fast_tags: Requests with more tags than this use the quality tier
+            enabled: When False, every request uses the quality tier
+        """
+        self.routes = routes
+        self.short_notes_chars = short_notes_chars
+        self.max_fast_tags = max_fast_tags
+        self.enabled = enabled
+
+    @classmethod
+    def from_settings(cls) -> "ModelRouter":
+        """Build the router from the application settings."""
+        return cls(
+            routes={
+                FAST_ROUTE: ModelRoute(
+                    name=FAST_ROUTE,
+                    model_name=settings.gemini_fast_model,
+                    max_output_tokens=settings.gemini_fast_max_output_tokens
+                ),
+                QUALITY_ROUTE: ModelRoute(
+                    name=QUALITY_ROUTE,
+                    model_name=settings.gemini_model,
+                    max_output_tokens=settings.gemini_max_output_tokens
+                ),
+                OUTLINE_ROUTE: ModelRoute(
+                    name=OUTLINE_ROUTE,
+                    model_name=settings.gemini_fast_model,
+                    max_output_tokens=settings.longform_outline_max_output_tokens,
+                    response_mime_type="application/json"
+                )
+            },
+            short_notes_chars=settings.routing_short_notes_chars,
+            max_fast_tags=settings.routing_max_fast_tags,
+            enabled=settings.routing_enabled
+        )
+
+    def route(self, notes: str, tags: Optional[List[str]] = None, optimize_for: Optional[str] = None) -> ModelRoute:
+        """
+        Choose the route for a request.
+
+        Args:
+            notes: Rough notes for the blog post
+            tags: Optional list of tags
+            optimize_for: Optional ``"quality"`` or ``"latency"`` hint
+
+        Returns:
+            ModelRoute: The chosen model and output-token budget
+        """
+        if not self.enabled or optimize_for == "quality":
+            return self.routes[QUALITY_ROUTE]
+        if optimize_for == "latency":
+            return self.routes[FAST_ROUTE]
+
+        if len(notes) <= self.short_notes_chars and len(tags or []) <= self.max_fast_tags:
+            return self.routes[FAST_ROUTE]
+        return self.routes[QUALITY_ROUTE]
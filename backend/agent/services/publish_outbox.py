@@ -0,0 +1,326 @@
+"""
+Durable SQLite outbox for Hashnode publishes, drained by background workers.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from ..metrics import observe_stage
+from ..models.hashnode import HashnodePublishRequest
+from ..models.outbox import OutboxEntry, OutboxStatus
+from .hashnode_service import HashnodeService
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = (
+    "id, status, title, attempts, last_error, post_id, post_url, "
+    "created_at, updated_at, next_attempt_at"
+)
+
+
+class PublishOutbox:
+    """
+    Queue of posts to publish, stored in SQLite so none are lost on restart.
+
+    Requests write a row and return immediately; a fixed pool of worker
+    tasks claims due rows and publishes them, retrying transient failures
+    (rate limiting, server and network errors) with jittered exponential
+    backoff until ``max_attempts`` is reached. Other failures mark the row
+    failed at once.
+    Every row carries an idempotency key, so a publish interrupted by a
+    restart is not duplicated when it is retried.
+    """
+
+    def __init__(
+        self,
+        hashnode_service: HashnodeService,
+        db_path: str,
+        workers: int,
+        max_attempts: int,
+        base_delay_seconds: float,
+        max_delay_seconds: float,
+        key_ttl_seconds: float
+    ):
+        """
+        Open (or create) the outbox.
+
+        Args:
+            hashnode_service: Shared Hashnode service
+            db_path: SQLite file path
+            workers: Number of concurrent publishing workers
+            max_attempts: Attempts before an entry is marked failed
+            base_delay_seconds: Base delay for retry backoff
+            max_delay_seconds: Upper bound for a single retry delay
+            key_ttl_seconds: How long a published entry holds its idempotency key
+        """
+        self.hashnode_service = hashnode_service
+        self.db_path = db_path
+        self.worker_count = workers
+        self.max_attempts = max_attempts
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.key_ttl_seconds = key_ttl_seconds
+
+        self._lock = threading.Lock()
+        self._wakeup = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db: Optional[sqlite3.Connection] = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS publish_outbox ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "idempotency_key TEXT NOT NULL UNIQUE, "
+                "request TEXT NOT NULL, "
+                "status TEXT NOT NULL, "
+                "title TEXT NOT NULL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, "
+                "last_error TEXT, "
+                "post_id TEXT, "
+                "post_url TEXT, "
+                "created_at REAL NOT NULL, "
+                "updated_at REAL NOT NULL, "
+                "next_attempt_at REAL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS publish_outbox_due "
+                "ON publish_outbox (status, next_attempt_at)"
+            )
+            # Finished entries are kept as long as their key, then pruned
+            self._db.execute(
+                "DELETE FROM publish_outbox WHERE status IN (?, ?) AND updated_at < ?",
+                (OutboxStatus.PUBLISHED.value, OutboxStatus.FAILED.value, time.time() - self.key_ttl_seconds)
+            )
+
+    def start(self) -> None:
+        """Requeue entries interrupted mid-publish and start the workers."""
+        with self._lock, self._db:
+            reset = self._db.execute(
+                "UPDATE publish_outbox SET status = ?, next_attempt_at = ? WHERE status = ?",
+                (OutboxStatus.PENDING.value, time.time(), OutboxStatus.PUBLISHING.value)
+            ).rowcount
+        if reset:
+            logger.info(f"Requeued {reset} interrupted outbox entries")
+
+        for index in range(self.worker_count):
+            self._workers.append(asyncio.create_task(self._worker(), name=f"outbox-worker-{index}"))
+        logger.info(f"Started {self.worker_count} outbox workers")
+
+    async def stop(self) -> None:
+        """Cancel the workers and close the database."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
+            self._db = None
+
+    async def enqueue(self, request: HashnodePublishRequest, idempotency_key: str) -> OutboxEntry:
+        """
+        Queue a post for publishing.
+
+        Enqueueing a key that is already queued or published returns the
+        existing entry; a key whose entry failed is queued again. A key
+        published more than ``key_ttl_seconds`` ago is free again, like a
+        key expiring from the idempotency store, and gets a new entry.
+
+        Args:
+            request: Post to publish
+            idempotency_key: Key identifying this publish
+
+        Returns:
+            OutboxEntry: The queued (or existing) entry
+        """
+        with observe_stage("outbox_enqueue"):
+            entry = await asyncio.to_thread(self._db_enqueue, request, idempotency_key)
+        self._wakeup.set()
+        return entry
+
+    async def get(self, entry_id: int) -> Optional[OutboxEntry]:
+        """Return an outbox entry by ID, or None if unknown."""
+        return await asyncio.to_thread(self._db_get, entry_id)
+
+    async def _worker(self) -> None:
+        """Claim and publish due entries until cancelled."""
+        while True:
+            try:
+                # Cleared before looking, so an enqueue after the lookup still wakes us
+                self._wakeup.clear()
+                claimed = await asyncio.to_thread(self._db_claim)
+                if claimed is None:
+                    await self._wait_for_work()
+                    continue
+
+                entry_id, key, request = claimed
+                await self._publish(entry_id, key, request)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Outbox worker error: {str(e)}")
+                await asyncio.sleep(1)
+
+    async def _wait_for_work(self) -> None:
+        """Sleep until something is enqueued or the next retry is due."""
+        next_due = await asyncio.to_thread(self._db_next_due)
+        timeout = 60.0 if next_due is None else max(next_due - time.time(), 0.05)
+
+        # asyncio.wait, unlike wait_for, never swallows a cancellation that
+        # races with the wakeup, which would leave stop() waiting forever
+        wakeup = asyncio.ensure_future(self._wakeup.wait())
+        try:
+            await asyncio.wait({wakeup}, timeout=timeout)
+        finally:
+            wakeup.cancel()
+
+    async def _publish(self, entry_id: int, key: str, request: HashnodePublishRequest) -> None:
+        """Publish one claimed entry and record the outcome."""
+        logger.info(f"Publishing outbox entry {entry_id}: {request.title}")
+
+        try:
+            response = await self.hashnode_service.publish_post(request, idempotency_key=key)
+            error = None if response.success else response.message
+            retryable = response.retryable
+        except Exception as e:
+            response = None
+            error = str(e)
+            retryable = True
+
+        if error is None:
+            await asyncio.to_thread(self._db_published, entry_id, response.post_id, response.post_url)
+            logger.info(f"Outbox entry {entry_id} published: {response.post_url}")
+            return
+
+        # Rejected posts (bad input, bad publication ID) would fail the same way again
+        if not retryable:
+            await asyncio.to_thread(self._db_failed, entry_id, error, None)
+            logger.error(f"Outbox entry {entry_id} failed with a non-retryable error: {error}")
+            return
+
+        attempts = await asyncio.to_thread(self._db_attempts, entry_id)
+        if attempts >= self.max_attempts:
+            await asyncio.to_thread(self._db_failed, entry_id, error, None)
+            logger.error(f"Outbox entry {entry_id} failed after {attempts} attempts: {error}")
+            return
+
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempts - 1))
+        delay = random.uniform(ceiling / 2, ceiling)
+        await asyncio.to_thread(self._db_failed, entry_id, error, time.time() + delay)
+        logger.warning(f"Outbox entry {entry_id} attempt {attempts} failed: {error}; retrying in {delay:.1f}s")
+
+    def _db_enqueue(self, request: HashnodePublishRequest, key: str) -> OutboxEntry:
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                f"SELECT {_COLUMNS} FROM publish_outbox WHERE idempotency_key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and row[1] == OutboxStatus.PUBLISHED.value and row[8] < now - self.key_ttl_seconds:
+                self._db.execute("DELETE FROM publish_outbox WHERE id = ?", (row[0],))
+                row = None
+
+            if row is None:
+                self._db.execute(
+                    "INSERT INTO publish_outbox "
+                    "(idempotency_key, request, status, title, created_at, updated_at, next_attempt_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, request.model_dump_json(), OutboxStatus.PENDING.value, request.title, now, now, now)
+                )
+            elif row[1] == OutboxStatus.FAILED.value:
+                self._db.execute(
+                    "UPDATE publish_outbox SET status = ?, attempts = 0, updated_at = ?, next_attempt_at = ? "
+                    "WHERE idempotency_key = ?",
+                    (OutboxStatus.PENDING.value, now, now, key)
+                )
+            else:
+                return _to_entry(row)
+
+            return _to_entry(self._db.execute(
+                f"SELECT {_COLUMNS} FROM publish_outbox WHERE idempotency_key = ?", (key,)
+            ).fetchone())
+
+    def _db_get(self, entry_id: int) -> Optional[OutboxEntry]:
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_COLUMNS} FROM publish_outbox WHERE id = ?", (entry_id,)
+            ).fetchone()
+        return _to_entry(row) if row is not None else None
+
+    def _db_claim(self) -> Optional[Tuple[int, str, HashnodePublishRequest]]:
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT id, idempotency_key, request FROM publish_outbox "
+                "WHERE status = ? AND next_attempt_at <= ? ORDER BY next_attempt_at LIMIT 1",
+                (OutboxStatus.PENDING.value, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._db.execute(
+                "UPDATE publish_outbox SET status = ?, attempts = attempts + 1, updated_at = ?, "
+                "next_attempt_at = NULL WHERE id = ?",
+                (OutboxStatus.PUBLISHING.value, now, row[0])
+            )
+        return row[0], row[1], HashnodePublishRequest.model_validate_json(row[2])
+
+    def _db_next_due(self) -> Optional[float]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM publish_outbox WHERE status = ?",
+                (OutboxStatus.PENDING.value,)
+            ).fetchone()
+        return row[0]
+
+    def _db_attempts(self, entry_id: int) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT attempts FROM publish_outbox WHERE id = ?", (entry_id,)
+            ).fetchone()[0]
+
+    def _db_published(self, entry_id: int, post_id: Optional[str], post_url: Optional[str]) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE publish_outbox SET status = ?, post_id = ?, post_url = ?, last_error = NULL, "
+                "updated_at = ? WHERE id = ?",
+                (OutboxStatus.PUBLISHED.value, post_id, post_url, time.time(), entry_id)
+            )
+
+    def _db_failed(self, entry_id: int, error: str, next_attempt_at: Optional[float]) -> None:
+        status = OutboxStatus.FAILED if next_attempt_at is None else OutboxStatus.PENDING
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE publish_outbox SET status = ?, last_error = ?, updated_at = ?, next_attempt_at = ? "
+                "WHERE id = ?",
+                (status.value, error, time.time(), next_attempt_at, entry_id)
+            )
+
+
+def _to_entry(row: tuple) -> OutboxEntry:
+    """Convert a publish_outbox row (in _COLUMNS order) to an OutboxEntry."""
+    entry_id, status, title, attempts, last_error, post_id, post_url, created_at, updated_at, next_attempt_at = row
+    return OutboxEntry(
+        id=entry_id,
+        status=OutboxStatus(status),
+        title=title,
+        attempts=attempts,
+        last_error=last_error,
+        post_id=post_id,
+        post_url=post_url,
+        created_at=datetime.fromtimestamp(created_at),
+        updated_at=datetime.fromtimestamp(updated_at),
+        next_attempt_at=datetime.fromtimestamp(next_attempt_at) if next_attempt_at is not None else None
+    )
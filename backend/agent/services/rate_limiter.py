@@ -0,0 +1,79 @@
+"""
+Token-bucket rate limiting for outbound API calls.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a fixed rate.
+
+    Callers that ask for more tokens than are available wait until the
+    bucket has refilled instead of being rejected. Waiters are served in
+    arrival order.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute
+            capacity: Maximum burst size; defaults to one minute of tokens
+        """
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Take ``amount`` tokens, waiting for them if necessary.
+
+        Requests larger than the bucket capacity are clamped to it so they
+        can still proceed once the bucket is full.
+        """
+        amount = min(amount, self.capacity)
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate_per_second)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Per-upstream limiter on requests per minute and, optionally, tokens per minute."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum request rate
+            tokens_per_minute: Maximum model token rate, if the upstream meters tokens
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until one request (and ``tokens`` model tokens) may be sent.
+
+        Args:
+            tokens: Estimated model tokens the request will consume
+        """
+        await self.requests.acquire()
+        if self.tokens is not None and tokens:
+            await self.tokens.acquire(tokens)
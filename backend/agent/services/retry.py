@@ -0,0 +1,154 @@
+"""
+Retry with jittered exponential backoff for upstream calls.
+"""
+
+import asyncio
+import logging
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+from google.api_core import exceptions as google_exceptions
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Gemini errors that mean the request was not served and may be resent
+RETRYABLE_GEMINI_ERRORS = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+)
+
+
+async def retry_async(
+    operation: Callable[[], Awaitable[T]],
+    should_retry: Callable[[Exception], bool],
+    retry_after: Callable[[Exception], Optional[float]],
+    description: str,
+    max_attempts: Optional[int] = None
+) -> T:
+    """
+    Run ``operation``, retrying failures that ``should_retry`` accepts.
+
+    Delays use full-jitter exponential backoff bounded by
+    ``retry_max_delay_seconds``; a server-provided Retry-After hint
+    overrides the computed delay.
+
+    Args:
+        operation: Coroutine function performing one attempt
+        should_retry: Whether an exception is safe to retry
+        retry_after: Extract a server-requested delay from an exception
+        description: Name used in log messages
+        max_attempts: Total attempts; defaults to ``retry_max_attempts``
+
+    Returns:
+        The operation's result
+
+    Raises:
+        Exception: The last error once attempts are exhausted or it is not retryable
+    """
+    attempts = max_attempts or settings.retry_max_attempts
+    attempt = 1
+
+    while True:
+        try:
+            return await operation()
+        except Exception as e:
+            if attempt >= attempts or not should_retry(e):
+                raise
+
+            delay = retry_after(e)
+            if delay is None:
+                ceiling = min(settings.retry_max_delay_seconds, settings.retry_base_delay_seconds * 2 ** (attempt - 1))
+                delay = random.uniform(0, ceiling)
+
+            logger.warning(
+                f"{description} failed (attempt {attempt}/{attempts}): {str(e) or type(e).__name__}; "
+                f"retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def is_retryable_gemini_error(exc: Exception) -> bool:
+    """Gemini generation has no side effects, so any transient error may be retried."""
+    return isinstance(exc, RETRYABLE_GEMINI_ERRORS)
+
+
+def gemini_retry_after(exc: Exception) -> Optional[float]:
+    """Read the server-requested delay from a Gemini error, if present."""
+    response = getattr(exc, "response", None)
+    if response is not None and getattr(response, "headers", None):
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is not None:
+            return delay
+
+    # gRPC errors carry google.rpc.RetryInfo in their details
+    for detail in getattr(exc, "details", None) or []:
+        retry_delay = getattr(detail, "retry_delay", None)
+        if retry_delay is not None:
+            return min(retry_delay.seconds + retry_delay.nanos / 1e9, settings.retry_max_delay_seconds)
+
+    return None
+
+
+def is_retryable_hashnode_error(exc: Exception, idempotent: bool) -> bool:
+    """
+    Decide whether a failed Hashnode request may be resent.
+
+    Rate limiting (429) and unavailability (503) mean the request was not
+    processed, and connection failures mean it was never sent, so those are
+    always safe. Other gateway errors and read timeouts are only retried for
+    idempotent queries, since a mutation may already have been applied.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        if status_code in (429, 503):
+            return True
+        return idempotent and status_code in (500, 502, 504)
+
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+
+    return idempotent and isinstance(exc, (httpx.ReadTimeout, httpx.RemoteProtocolError))
+
+
+def is_retryable_publish_status(status_code: int) -> bool:
+    """
+    Decide whether a publish that failed with this HTTP status may be tried again later.
+
+    Rate limiting and server errors are transient; other statuses (bad
+    token, invalid input) fail the same way every time.
+    """
+    return status_code == 429 or status_code >= 500
+
+
+def hashnode_retry_after(exc: Exception) -> Optional[float]:
+    """Read the Retry-After header from a Hashnode error response, if present."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return parse_retry_after(exc.response.headers.get("Retry-After"))
+    return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date), capped at the max delay."""
+    if not value:
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+
+    return min(max(delay, 0.0), settings.retry_max_delay_seconds)
@@ -0,0 +1,96 @@
+"""
+Single-flight coalescing of identical in-flight async calls.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """An in-flight call and the number of callers awaiting it."""
+
+    def __init__(self, task: "asyncio.Future[T]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Run at most one call per key at a time; concurrent callers share it.
+
+    The call runs in its own task, so a cancelled caller does not cancel
+    it for the others. It is cancelled only once every caller has gone
+    away. Results and exceptions are delivered to every caller.
+    """
+
+    def __init__(self):
+        """Initialize an empty call table."""
+        self._calls: Dict[str, _Call[T]] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn`` for ``key``, or join the call already running for it.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function started if no call is in flight
+
+        Returns:
+            The shared call's result
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        call = self._calls.get(key)
+
+        if call is None:
+            call = _Call(asyncio.create_task(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self.leaders += 1
+        else:
+            self.followers += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def claim(self, key: str) -> "Optional[asyncio.Future[T]]":
+        """
+        Take ``key`` for a result the caller will deliver itself.
+
+        Calls to ``do`` for the key wait on the returned future instead of
+        starting their own call. The claimant counts as a waiter, so the
+        future stays pending until the caller resolves it.
+
+        Args:
+            key: Identity of the call
+
+        Returns:
+            The future to resolve, or None if a call is already in flight for the key
+        """
+        if key in self._calls:
+            return None
+
+        call = _Call(asyncio.get_running_loop().create_future())
+        call.waiters = 1
+        self._calls[key] = call
+        call.task.add_done_callback(lambda _: self._forget(key, call))
+        self.leaders += 1
+        return call.task
+
+    def in_flight(self) -> int:
+        """Return the number of distinct calls currently running."""
+        return len(self._calls)
+
+    def _forget(self, key: str, call: "_Call[T]") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
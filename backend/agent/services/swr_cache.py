@@ -0,0 +1,88 @@
+"""
+Single-value async cache with stale-while-revalidate semantics.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """
+    Cache one value produced by an async loader.
+
+    Fresh values are returned as-is. Stale values (older than the TTL but
+    within the stale window) are returned immediately while a refresh runs
+    in the background. Missing or expired values are loaded inline. At most
+    one load runs at a time; concurrent callers share it.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[Optional[T]]],
+        ttl_seconds: float,
+        max_stale_seconds: float
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            loader: Coroutine function producing the value, or None on failure
+            ttl_seconds: Age after which a value is refreshed
+            max_stale_seconds: Extra age during which a stale value may still be served
+        """
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+
+        self._value: Optional[T] = None
+        self._loaded_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def age(self) -> Optional[float]:
+        """Return the age of the cached value in seconds, or None if empty."""
+        if self._loaded_at is None:
+            return None
+        return time.monotonic() - self._loaded_at
+
+    async def get(self) -> Optional[T]:
+        """Return the cached value, refreshing it as needed."""
+        age = self.age()
+
+        if age is not None and age < self.ttl_seconds:
+            return self._value
+
+        if age is not None and age < self.ttl_seconds + self.max_stale_seconds:
+            self._start_refresh()
+            return self._value
+
+        await asyncio.shield(self._start_refresh())
+        return self._value
+
+    def set(self, value: T) -> None:
+        """Store a value loaded elsewhere as fresh."""
+        self._value = value
+        self._loaded_at = time.monotonic()
+
+    def _start_refresh(self) -> asyncio.Task:
+        """Start a refresh unless one is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        return self._refresh_task
+
+    async def _refresh(self) -> None:
+        """Load a new value, keeping the old one if loading fails."""
+        try:
+            value = await self.loader()
+        except Exception as e:
+            logger.error(f"Cache refresh failed: {str(e)}")
+            return
+
+        if value is not None:
+            self._value = value
+            self._loaded_at = time.monotonic()
@@ -0,0 +1,192 @@
+"""
+Tag normalization and cached resolution of Hashnode tag IDs.
+"""
+
+import logging
+import re
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..metrics import observe_stage
+from ..models.hashnode import HashnodeTag
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+_NON_SLUG_CHARS = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS = re.compile(r"[\s_-]+")
+_WHITESPACE = re.compile(r"\s+")
+
+TAG_SELECTION = """ {
+        id
+        name
+        slug
+    }"""
+
+
+@lru_cache(maxsize=4096)
+def slugify(tag_name: str) -> str:
+    """
+    Create a URL-friendly slug from a tag name.
+
+    Args:
+        tag_name: Tag as written by the user or the model
+
+    Returns:
+        str: Lowercase slug with runs of spaces, underscores and hyphens collapsed to one hyphen
+    """
+    slug = _NON_SLUG_CHARS.sub("", tag_name.lower())
+    slug = _SLUG_SEPARATORS.sub("-", slug)
+    return slug.strip("-")
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """
+    Tidy a tag list and drop near-duplicates.
+
+    Tags are stripped and inner whitespace collapsed. Tags with the same
+    slug (``Python``, ``python `` and ``PYTHON``) are kept once, in the
+    spelling that appears first; tags with an empty slug are dropped.
+
+    Args:
+        tags: Tags in their original order
+
+    Returns:
+        List[str]: Distinct tags in their original order
+    """
+    seen = set()
+    normalized = []
+
+    for tag in tags or []:
+        name = _WHITESPACE.sub(" ", tag).strip()
+        slug = slugify(name)
+        if not slug or slug in seen:
+            continue
+        seen.add(slug)
+        normalized.append(name)
+
+    return normalized
+
+
+@lru_cache(maxsize=None)
+def build_tag_lookup_query(count: int) -> str:
+    """
+    Build (once per size) a query looking up ``count`` tags by slug.
+
+    Each lookup is an aliased ``tag`` field (t0, t1, ...) taking its slug
+    from the matching ``$slug0``, ``$slug1``, ... variable.
+    """
+    variables = ", ".join(f"$slug{index}: String!" for index in range(count))
+    fields = "".join(f"\n    t{index}: tag(slug: $slug{index}){TAG_SELECTION}" for index in range(count))
+    return f"query LookupTags({variables}) {{{fields}\n}}"
+
+
+class TagResolver:
+    """
+    Resolve tag names to existing Hashnode tags, caching results with a TTL.
+
+    Every slug not already cached is looked up in one aliased GraphQL
+    query. Unknown tags are cached too, so a new tag costs one lookup per
+    TTL; they are published by name and slug and Hashnode creates them.
+    Concurrent lookups of the same slugs share a single request.
+    """
+
+    def __init__(
+        self,
+        post_graphql: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+        ttl_seconds: float
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            post_graphql: Coroutine function sending an idempotent GraphQL request
+            ttl_seconds: How long a lookup result is reused
+        """
+        self.post_graphql = post_graphql
+        self.ttl_seconds = ttl_seconds
+
+        self._cache: Dict[str, Tuple[float, Optional[HashnodeTag]]] = {}
+        self._lookups: SingleFlight[Dict[str, Optional[HashnodeTag]]] = SingleFlight()
+
+    async def publish_inputs(self, tags: Optional[Iterable[str]]) -> Dict[str, Dict[str, str]]:
+        """
+        Build ``PublishPostTagInput`` values for a set of tags.
+
+        Known tags are referenced by ID; others by name and slug. If the
+        lookup fails, every tag falls back to name and slug.
+
+        Args:
+            tags: Tags of one or more posts
+
+        Returns:
+            Dict mapping each tag's slug to its publish input
+        """
+        names = {slugify(name): name for name in normalize_tags(tags)}
+        if not names:
+            return {}
+
+        resolved = await self.resolve(list(names))
+
+        return {
+            slug: {"id": tag.id} if tag is not None else {"name": names[slug], "slug": slug}
+            for slug, tag in resolved.items()
+        }
+
+    async def resolve(self, slugs: List[str]) -> Dict[str, Optional[HashnodeTag]]:
+        """
+        Look up tags by slug, using cached results where fresh.
+
+        Args:
+            slugs: Tag slugs
+
+        Returns:
+            Dict mapping each slug to its Hashnode tag, or None if it does not exist or could not be looked up
+        """
+        now = time.monotonic()
+        resolved: Dict[str, Optional[HashnodeTag]] = {}
+        missing = []
+
+        for slug in slugs:
+            cached = self._cache.get(slug)
+            if cached is not None and now - cached[0] < self.ttl_seconds:
+                resolved[slug] = cached[1]
+            else:
+                missing.append(slug)
+
+        if missing:
+            missing.sort()
+            try:
+                resolved.update(await self._lookups.do(
+                    " ".join(missing),
+                    lambda: self._lookup(missing)
+                ))
+            except Exception as e:
+                logger.warning(f"Tag lookup failed, publishing tags by name: {str(e)}")
+                resolved.update({slug: None for slug in missing})
+
+        return resolved
+
+    async def _lookup(self, slugs: List[str]) -> Dict[str, Optional[HashnodeTag]]:
+        """Fetch tags from Hashnode in one aliased query and cache the results."""
+        with observe_stage("hashnode_tag_lookup"):
+            data = await self.post_graphql({
+                "query": build_tag_lookup_query(len(slugs)),
+                "variables": {f"slug{index}": slug for index, slug in enumerate(slugs)}
+            })
+
+        if data.get("errors"):
+            raise Exception("; ".join(error["message"] for error in data["errors"]))
+
+        results = data.get("data") or {}
+        loaded_at = time.monotonic()
+        found: Dict[str, Optional[HashnodeTag]] = {}
+
+        for index, slug in enumerate(slugs):
+            tag = results.get(f"t{index}")
+            found[slug] = HashnodeTag(**tag) if tag else None
+            self._cache[slug] = (loaded_at, found[slug])
+
+        logger.info(f"Resolved {sum(1 for tag in found.values() if tag)} of {len(slugs)} tags on Hashnode")
+        return found
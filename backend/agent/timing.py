@@ -0,0 +1,71 @@
+"""
+Per-request stage timing for MCP Blog Server.
+
+Each request gets a RequestTimings object stored in a context variable;
+pipeline stages record their duration into it (see ``metrics.observe_stage``)
+and it is reported back through the ``Server-Timing`` header and the
+``timings`` field of responses.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+
+class RequestTimings:
+    """Accumulated stage durations for one request."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Add ``seconds`` to a stage; repeated stages accumulate."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def mark(self, stage: str) -> None:
+        """Record the time elapsed since the request started as a stage."""
+        self.record(stage, time.perf_counter() - self.started_at)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return stage durations in milliseconds."""
+        return {stage: round(seconds * 1000, 2) for stage, seconds in self.stages.items()}
+
+    def server_timing_header(self) -> str:
+        """Render stages (plus the total so far) as a Server-Timing header value."""
+        entries = [f"{stage};dur={duration}" for stage, duration in self.as_dict().items()]
+        entries.append(f"total;dur={round((time.perf_counter() - self.started_at) * 1000, 2)}")
+        return ", ".join(entries)
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Return the timings of the request being handled, if any."""
+    return _current_timings.get()
+
+
+def timings_snapshot() -> Optional[Dict[str, float]]:
+    """Return the current request's stage durations in milliseconds, if any."""
+    timings = _current_timings.get()
+    return timings.as_dict() if timings is not None else None
+
+
+def mark_stage(stage: str) -> None:
+    """Record the time since the current request started as ``stage``."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.mark(stage)
+
+
+@contextmanager
+def timing_context() -> Iterator[RequestTimings]:
+    """Collect stage timings for the enclosed block in a fresh RequestTimings."""
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
@@ -0,0 +1,13 @@
+"""
+Offline benchmarks for MCP Blog Server.
+
+Run from the backend directory, e.g. ``python -m benchmarks.markdown_processor``.
+Nothing here calls Gemini or Hashnode, so placeholder credentials are set
+when real ones are not in the environment.
+"""
+
+import os
+
+os.environ.setdefault("GEMINI_API_KEY", "benchmark_gemini_key")
+os.environ.setdefault("HASHNODE_TOKEN", "benchmark_hashnode_token")
+os.environ.setdefault("HASHNODE_PUBLICATION_ID", "benchmark_publication_id")
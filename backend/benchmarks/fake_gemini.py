@@ -0,0 +1,221 @@
+"""
+Local stand-in for Gemini model clients.
+
+``FakeGeminiModel`` implements the parts of ``genai.GenerativeModel`` that
+GeminiService uses (``generate_content_async`` with and without streaming,
+and ``count_tokens_async``). It sleeps for a latency drawn from a
+configurable distribution, returns synthetic markdown and can inject the
+same errors the real API raises. Pass ``FakeGeminiFactory`` to
+``GeminiService(model_factory=...)``.
+"""
+
+import asyncio
+import math
+import random
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, List, Optional
+
+from google.api_core import exceptions as google_exceptions
+
+# Errors injected at --gemini-error-rate; all of them are retried by GeminiService
+INJECTED_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+)
+
+PARAGRAPH = (
+    "Caching is the art of being wrong quickly. Every layer promises to make "
+    "the hot path faster and every layer has its own opinion about freshness. "
+)
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """
+    Parse a latency distribution into a sampler returning seconds.
+
+    Supported forms:
+        ``0.8``                    constant
+        ``uniform:LOW:HIGH``       uniform between LOW and HIGH
+        ``lognormal:MEDIAN:SIGMA`` log-normal with the given median (long right tail)
+        ``exponential:MEAN``       exponential with the given mean
+
+    Args:
+        spec: Distribution spec
+
+    Returns:
+        Callable producing one latency sample per call
+
+    Raises:
+        ValueError: If the spec is not recognised
+    """
+    kind, _, params = spec.partition(":")
+    try:
+        if not params:
+            value = float(kind)
+            return lambda: value
+
+        values = [float(value) for value in params.split(":")]
+        if kind == "uniform" and len(values) == 2:
+            low, high = values
+            return lambda: random.uniform(low, high)
+        if kind == "lognormal" and len(values) == 2:
+            mu, sigma = math.log(values[0]), values[1]
+            return lambda: random.lognormvariate(mu, sigma)
+        if kind == "exponential" and len(values) == 1:
+            rate = 1 / values[0]
+            return lambda: random.expovariate(rate)
+    except (ValueError, ZeroDivisionError):
+        pass
+
+    raise ValueError(f"Unrecognised latency distribution: {spec}")
+
+
+@dataclass
+class FakeUsage:
+    """Token counts shaped like Gemini's usage metadata."""
+
+    prompt_token_count: int
+    candidates_token_count: int
+
+
+@dataclass
+class FakeChunk:
+    """One streamed piece of a response."""
+
+    text: str
+
+
+@dataclass
+class FakeTokenCount:
+    """Result of ``count_tokens_async``."""
+
+    total_tokens: int
+
+
+class FakeResponse:
+    """Complete (non-streamed) response."""
+
+    def __init__(self, text: str, usage: FakeUsage):
+        self.text = text
+        self.usage_metadata = usage
+
+
+class FakeStream:
+    """Streamed response: chunks arrive spread over the sampled latency."""
+
+    def __init__(self, chunks: List[str], latency: float, first_chunk_fraction: float, usage: FakeUsage):
+        self.chunks = chunks
+        self.latency = latency
+        self.first_chunk_fraction = first_chunk_fraction
+        self.usage_metadata = usage
+
+    async def __aiter__(self) -> AsyncIterator[FakeChunk]:
+        first_delay = self.latency * self.first_chunk_fraction
+        gap = (self.latency - first_delay) / max(len(self.chunks) - 1, 1)
+
+        for index, text in enumerate(self.chunks):
+            await asyncio.sleep(first_delay if index == 0 else gap)
+            yield FakeChunk(text=text)
+
+
+class FakeGeminiModel:
+    """A model client that answers locally after a simulated delay."""
+
+    def __init__(
+        self,
+        model_name: str,
+        system_instruction: Optional[str],
+        latency: Callable[[], float],
+        error_rate: float,
+        output_words: int,
+        stream_chunks: int,
+        first_chunk_fraction: float
+    ):
+        self.model_name = model_name if model_name.startswith("models/") else f"models/{model_name}"
+        self.system_instruction = system_instruction
+        self.latency = latency
+        self.error_rate = error_rate
+        self.output_words = output_words
+        self.stream_chunks = stream_chunks
+        self.first_chunk_fraction = first_chunk_fraction
+
+    async def generate_content_async(self, prompt, generation_config=None, safety_settings=None, stream=False):
+        latency = max(self.latency(), 0.0)
+        text = self._render(prompt)
+        usage = FakeUsage(
+            prompt_token_count=(len(prompt) + len(self.system_instruction or "")) // 4,
+            candidates_token_count=len(text) // 4
+        )
+
+        if random.random() < self.error_rate:
+            # Failures take a while too, as they do upstream
+            await asyncio.sleep(latency * random.random())
+            raise random.choice(INJECTED_ERRORS)("Injected by the benchmark Gemini fake")
+
+        if stream:
+            size = math.ceil(len(text) / self.stream_chunks)
+            chunks = [text[offset:offset + size] for offset in range(0, len(text), size)]
+            return FakeStream(chunks, latency, self.first_chunk_fraction, usage)
+
+        await asyncio.sleep(latency)
+        return FakeResponse(text, usage)
+
+    async def count_tokens_async(self, contents) -> FakeTokenCount:
+        return FakeTokenCount(total_tokens=len(str(contents)) // 4)
+
+    def _render(self, prompt: str) -> str:
+        """Produce a markdown post of roughly ``output_words`` words."""
+        title = "Benchmark Post"
+        for line in prompt.splitlines():
+            if line.startswith("Title:"):
+                title = line[len("Title:"):].strip() or title
+                break
+
+        paragraphs = max(self.output_words // len(PARAGRAPH.split()), 1)
+        sections = [f"# {title}", PARAGRAPH * 2]
+        for index in range(paragraphs):
+            if index % 4 == 0:
+                sections.append(f"## Part {index // 4 + 1}")
+            sections.append(PARAGRAPH)
+        sections.append("```python\ndef get(key):\n    return cache.get(key) or load(key)\n```")
+        return "\n\n".join(sections)
+
+
+class FakeGeminiFactory:
+    """``model_factory`` for GeminiService that builds FakeGeminiModel clients."""
+
+    def __init__(
+        self,
+        latency: str = "lognormal:0.8:0.4",
+        error_rate: float = 0.0,
+        output_words: int = 800,
+        stream_chunks: int = 40,
+        first_chunk_fraction: float = 0.2
+    ):
+        """
+        Configure the fake.
+
+        Args:
+            latency: Latency distribution spec (see ``parse_latency``)
+            error_rate: Fraction of calls that raise a retryable Gemini error
+            output_words: Approximate words per generated post
+            stream_chunks: Chunks per streamed response
+            first_chunk_fraction: Share of the latency spent before the first streamed chunk
+        """
+        self.latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.output_words = output_words
+        self.stream_chunks = stream_chunks
+        self.first_chunk_fraction = first_chunk_fraction
+
+    def __call__(self, model_name: str, system_instruction: Optional[str] = None) -> FakeGeminiModel:
+        return FakeGeminiModel(
+            model_name,
+            system_instruction,
+            latency=self.latency,
+            error_rate=self.error_rate,
+            output_words=self.output_words,
+            stream_chunks=self.stream_chunks,
+            first_chunk_fraction=self.first_chunk_fraction
+        )
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Hashnode GraphQL API.
+
+Answers the operations HashnodeService sends: ``publishPost`` (single or
+aliased p0, p1, ... in one request), ``publication`` and aliased ``tag``
+lookups. Responses are delayed by a configurable latency distribution and
+a share of them can fail with HTTP 503 or a GraphQL error. ``GET /stats``
+reports how many of each operation were served.
+
+Usage:
+    python -m benchmarks.fake_hashnode [--port 8101] [--latency lognormal:0.15:0.5] [--error-rate 0.0]
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import re
+from collections import Counter
+from typing import Any, Dict
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from .fake_gemini import parse_latency
+
+_ALIAS = re.compile(r"\b(p\d+|t\d+)\s*:")
+
+# Tags the fake already "knows"; anything else resolves to null, like a new tag
+KNOWN_TAGS = {"python", "fastapi", "performance", "caching", "testing"}
+
+
+def create_app(latency: str = "lognormal:0.15:0.5", error_rate: float = 0.0) -> FastAPI:
+    """
+    Build the fake GraphQL server.
+
+    Args:
+        latency: Latency distribution spec (see ``fake_gemini.parse_latency``)
+        error_rate: Fraction of requests that fail
+
+    Returns:
+        FastAPI: Application serving ``POST /`` and ``GET /stats``
+    """
+    app = FastAPI(title="Fake Hashnode GraphQL API")
+    sample_latency = parse_latency(latency)
+    post_ids = itertools.count(1)
+    stats: Counter = Counter()
+
+    def post(title: str) -> Dict[str, Any]:
+        post_id = f"fake-{next(post_ids)}"
+        return {
+            "post": {
+                "id": post_id,
+                "title": title,
+                "url": f"https://fake.hashnode.dev/{post_id}",
+                "slug": post_id,
+                "publishedAt": "2024-01-01T00:00:00.000Z"
+            }
+        }
+
+    @app.post("/")
+    async def graphql(request: Request) -> JSONResponse:
+        payload = await request.json()
+        query: str = payload.get("query", "")
+        variables: Dict[str, Any] = payload.get("variables") or {}
+
+        await asyncio.sleep(max(sample_latency(), 0.0))
+
+        if random.random() < error_rate:
+            stats["errors"] += 1
+            if random.random() < 0.5:
+                return JSONResponse({"message": "Injected by the benchmark Hashnode fake"}, status_code=503)
+            return JSONResponse({"errors": [{"message": "Injected by the benchmark Hashnode fake"}]})
+
+        if "publishPost" in query:
+            aliases = [alias for alias in _ALIAS.findall(query) if alias.startswith("p")]
+            if aliases:
+                data = {alias: post(variables[f"input{alias[1:]}"]["title"]) for alias in aliases}
+            else:
+                data = {"publishPost": post(variables["input"]["title"])}
+            stats["posts_published"] += len(data)
+            stats["publish_requests"] += 1
+            return JSONResponse({"data": data})
+
+        if "publication(" in query:
+            stats["publication_queries"] += 1
+            return JSONResponse({"data": {"publication": {
+                "id": variables.get("id", "fake-publication"),
+                "title": "Fake Publication",
+                "displayTitle": "Fake Publication",
+                "url": "https://fake.hashnode.dev",
+                "metaDescription": "Benchmark stand-in",
+                "favicon": None,
+                "isTeam": False,
+                "followersCount": 0,
+                "author": {"name": "Benchmark", "username": "benchmark"}
+            }}})
+
+        if "tag(" in query:
+            stats["tag_lookups"] += 1
+            data = {}
+            for alias in _ALIAS.findall(query):
+                slug = variables.get(f"slug{alias[1:]}")
+                data[alias] = {"id": f"tag-{slug}", "name": slug, "slug": slug} if slug in KNOWN_TAGS else None
+            return JSONResponse({"data": data})
+
+        stats["unknown_operations"] += 1
+        return JSONResponse({"errors": [{"message": "Operation not supported by the fake"}]})
+
+    @app.get("/stats")
+    async def get_stats() -> Dict[str, int]:
+        return dict(stats)
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8101)
+    parser.add_argument("--latency", default="lognormal:0.15:0.5", help="Latency distribution spec")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.latency, args.error_rate), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Offline load test for the blog API.
+
+Starts the fake Hashnode server and the app under ``benchmarks.serve`` (with
+fake Gemini models) as subprocesses, then drives ``/blog/generate``,
+``/blog/publish`` and ``/blog/generate-and-publish`` at a target request
+rate. Requests are issued on a fixed schedule (open loop), and latency is
+measured from each request's scheduled start, so a server that falls
+behind shows up in the percentiles instead of silently lowering the rate.
+``--concurrency`` caps requests in flight from the driver.
+
+Reports throughput, p50/p95/p99 latency and errors per endpoint, plus the
+server's event-loop lag over the run. Every request uses a unique title,
+so generation caches and publish idempotency never short-circuit it.
+
+Usage:
+    python -m benchmarks.load_test [--rps 50] [--concurrency 200] [--duration 30]
+                                   [--endpoints generate,publish,generate-and-publish]
+                                   [--gemini-latency lognormal:0.8:0.4] [--hashnode-latency lognormal:0.15:0.5]
+    python -m benchmarks.load_test --target http://127.0.0.1:8100   # against an already running benchmarks.serve
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+NOTES = (
+    "Why event loops stall: blocking calls in async handlers, CPU-heavy JSON, "
+    "sync database drivers. How to find them: loop lag monitors, py-spy. "
+    "How to fix them: to_thread, streaming, smaller payloads."
+)
+
+CONTENT = "# Load Test Post\n\n" + "\n\n".join(
+    f"## Section {index}\n\nSome words about section {index}, repeated to give the body weight. " * 3
+    for index in range(8)
+)
+
+TAGS = ["python", "performance", "load-testing"]
+
+
+@dataclass
+class EndpointStats:
+    """Outcomes of every request sent to one endpoint."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def percentile(self, q: float) -> float:
+        ordered = sorted(self.latencies)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)] if ordered else 0.0
+
+
+def generate_request(index: int) -> Dict:
+    return {"title": f"Load test post {index}", "notes": NOTES, "tags": TAGS}
+
+
+def publish_request(index: int) -> Dict:
+    return {"title": f"Load test post {index}", "content": CONTENT, "tags": TAGS}
+
+
+ENDPOINTS: Dict[str, tuple] = {
+    "generate": ("/blog/generate", generate_request),
+    "publish": ("/blog/publish", publish_request),
+    "generate-and-publish": ("/blog/generate-and-publish", generate_request),
+}
+
+
+def error_kind(response: httpx.Response) -> Optional[str]:
+    """Classify a response as an error, or None if it succeeded."""
+    if response.status_code >= 400:
+        return f"HTTP {response.status_code}"
+    try:
+        if response.json().get("success") is False:
+            return "success=false"
+    except ValueError:
+        return "invalid JSON"
+    return None
+
+
+async def send(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    path: str,
+    body: Dict,
+    scheduled_at: float,
+    stats: EndpointStats
+) -> None:
+    async with semaphore:
+        try:
+            response = await client.post(path, json=body)
+            kind = error_kind(response)
+        except httpx.HTTPError as e:
+            kind = type(e).__name__
+
+    stats.latencies.append(time.perf_counter() - scheduled_at)
+    if kind is not None:
+        stats.errors[kind] += 1
+
+
+async def drive(args: argparse.Namespace, base_url: str) -> None:
+    endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in endpoints if name not in ENDPOINTS]
+    if unknown:
+        raise SystemExit(f"Unknown endpoints: {', '.join(unknown)} (choose from {', '.join(ENDPOINTS)})")
+
+    stats = {name: EndpointStats() for name in endpoints}
+    semaphore = asyncio.Semaphore(args.concurrency)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    total = int(args.rps * args.duration)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        await client.get("/bench/loop-lag", params={"reset": True})
+
+        print(f"Sending {total} requests at {args.rps:g} req/s to {', '.join(endpoints)} (concurrency {args.concurrency})")
+        tasks = []
+        started = time.perf_counter()
+        for index, name in zip(range(total), itertools.cycle(endpoints)):
+            scheduled_at = started + index / args.rps
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            path, build_body = ENDPOINTS[name]
+            tasks.append(asyncio.create_task(send(client, semaphore, path, build_body(index), scheduled_at, stats[name])))
+
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+        loop_lag = (await client.get("/bench/loop-lag")).json()
+
+    report(stats, elapsed, loop_lag)
+
+
+def report(stats: Dict[str, EndpointStats], elapsed: float, loop_lag: Dict[str, float]) -> None:
+    print()
+    print(f"{'endpoint':<22} {'requests':>8} {'errors':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, endpoint in stats.items():
+        count = len(endpoint.latencies)
+        print(
+            f"{name:<22} {count:>8} {sum(endpoint.errors.values()):>7} {count / elapsed:>8.1f} "
+            f"{endpoint.percentile(0.50) * 1000:>9.1f} {endpoint.percentile(0.95) * 1000:>9.1f} "
+            f"{endpoint.percentile(0.99) * 1000:>9.1f} {endpoint.percentile(1.0) * 1000:>9.1f}"
+        )
+
+    for name, endpoint in stats.items():
+        for kind, count in sorted(endpoint.errors.items()):
+            print(f"  {name}: {count} x {kind}")
+
+    print()
+    if loop_lag.get("samples"):
+        print(
+            f"Server event-loop lag: p50 {loop_lag['p50_ms']:.1f} ms, p95 {loop_lag['p95_ms']:.1f} ms, "
+            f"p99 {loop_lag['p99_ms']:.1f} ms, max {loop_lag['max_ms']:.1f} ms ({loop_lag['samples']} samples)"
+        )
+    else:
+        print("Server event-loop lag: no samples")
+
+
+def start_process(module: str, arguments: List[str]) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-m", module, *arguments], cwd=BACKEND_DIR)
+
+
+async def wait_until_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while True:
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    raise SystemExit(f"Timed out waiting for {url}")
+                await asyncio.sleep(0.2)
+
+
+async def run(args: argparse.Namespace) -> None:
+    if args.target:
+        await drive(args, args.target)
+        return
+
+    hashnode_url = f"http://127.0.0.1:{args.hashnode_port}/"
+    base_url = f"http://127.0.0.1:{args.port}"
+    processes = [
+        start_process("benchmarks.fake_hashnode", [
+            "--port", str(args.hashnode_port),
+            "--latency", args.hashnode_latency,
+            "--error-rate", str(args.hashnode_error_rate)
+        ]),
+        start_process("benchmarks.serve", [
+            "--port", str(args.port),
+            "--hashnode-url", hashnode_url,
+            "--gemini-latency", args.gemini_latency,
+            "--gemini-error-rate", str(args.gemini_error_rate),
+            "--gemini-max-concurrency", str(args.gemini_max_concurrency),
+            "--loop", args.loop
+        ]),
+    ]
+
+    try:
+        await wait_until_ready(f"{hashnode_url}stats")
+        await wait_until_ready(f"{base_url}/bench/loop-lag")
+        await drive(args, base_url)
+
+        async with httpx.AsyncClient() as client:
+            print(f"Fake Hashnode served: {(await client.get(f'{hashnode_url}stats')).json()}")
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rps", type=float, default=50.0, help="Target request rate across all endpoints")
+    parser.add_argument("--concurrency", type=int, default=200, help="Maximum requests in flight from the driver")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    parser.add_argument("--endpoints", default="generate,publish,generate-and-publish", help="Comma-separated endpoints to mix")
+    parser.add_argument("--target", help="Base URL of an already running benchmarks.serve; skips starting the fakes")
+    parser.add_argument("--port", type=int, default=8100, help="Port for the app under test")
+    parser.add_argument("--hashnode-port", type=int, default=8101, help="Port for the fake Hashnode server")
+    parser.add_argument("--gemini-latency", default="lognormal:0.8:0.4", help="Fake Gemini latency distribution")
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0, help="Fraction of fake Gemini calls that fail")
+    parser.add_argument("--gemini-max-concurrency", type=int, default=64, help="GEMINI_MAX_CONCURRENCY for the app")
+    parser.add_argument("--hashnode-latency", default="lognormal:0.15:0.5", help="Fake Hashnode latency distribution")
+    parser.add_argument("--hashnode-error-rate", type=float, default=0.0, help="Fraction of fake Hashnode requests that fail")
+    parser.add_argument("--loop", default="auto", choices=["auto", "asyncio", "uvloop"], help="Server event loop implementation")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the single-pass markdown processor.
+
+Processes synthetic posts of doubling size, both as one string and as a
+stream of small chunks, and reports the time per KiB. Linear scaling shows
+up as a flat per-KiB column (a ratio near 1.0 between the largest and
+smallest document).
+
+Usage:
+    python -m benchmarks.markdown_processor [--sizes 1,2,4,...] [--chunk-size 24] [--repeat 5]
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from agent.services.markdown_processor import MarkdownProcessor, process_markdown
+
+SECTION = """## Section {index}: Why the cache lied
+
+Every engineer has a story about a cache that served stale data at the worst
+possible moment. This one involves a TTL of zero, a retry loop and a pager.
+
+```python
+def get(key):
+    return cache.get(key) or load(key)
+```
+
+- First, measure before you optimize
+- Second, measure again after
+
+"""
+
+
+def build_document(sections: int) -> str:
+    """Build a post with ``sections`` sections, wrapped in a stray markdown fence."""
+    body = "".join(SECTION.format(index=index) for index in range(sections))
+    return f"```markdown\n# Benchmark Post\n\nIntro paragraph.\n\n{body}```\n"
+
+
+def process_whole(document: str, chunk_size: int) -> None:
+    process_markdown(document)
+
+
+def process_streamed(document: str, chunk_size: int) -> None:
+    processor = MarkdownProcessor()
+    for offset in range(0, len(document), chunk_size):
+        processor.feed(document[offset:offset + chunk_size])
+    processor.finish()
+
+
+def best_time(fn: Callable[[str, int], None], document: str, chunk_size: int, repeat: int) -> float:
+    """Return the fastest of ``repeat`` runs in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(document, chunk_size)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(sizes: List[int], chunk_size: int, repeat: int) -> None:
+    modes = [("whole", process_whole), ("streamed", process_streamed)]
+
+    print(f"{'sections':>8} {'KiB':>8} " + " ".join(f"{name + ' ms':>12} {name + ' us/KiB':>16}" for name, _ in modes))
+
+    per_kib = {name: [] for name, _ in modes}
+    for sections in sizes:
+        document = build_document(sections)
+        kib = len(document.encode("utf-8")) / 1024
+
+        columns = []
+        for name, fn in modes:
+            elapsed = best_time(fn, document, chunk_size, repeat)
+            per_kib[name].append(elapsed * 1e6 / kib)
+            columns.append(f"{elapsed * 1000:>12.2f} {per_kib[name][-1]:>16.1f}")
+
+        print(f"{sections:>8} {kib:>8.1f} " + " ".join(columns))
+
+    print()
+    for name, values in per_kib.items():
+        print(f"{name}: largest/smallest time per KiB = {values[-1] / values[0]:.2f} (1.0 = linear)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="16,32,64,128,256,512,1024", help="Comma-separated section counts")
+    parser.add_argument("--chunk-size", type=int, default=24, help="Characters per streamed chunk")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the fastest is reported")
+    args = parser.parse_args()
+
+    run([int(size) for size in args.sizes.split(",")], args.chunk_size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
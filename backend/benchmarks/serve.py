@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Run the real application against local Gemini and Hashnode stand-ins.
+
+The app is served by uvicorn with ``GeminiService`` swapped for one whose
+model clients are ``FakeGeminiModel`` (through ``app.dependency_overrides``,
+installed before startup so background jobs and the prober use it too)
+and with Hashnode pointed at ``--hashnode-url`` (see ``fake_hashnode``).
+Upstream quotas are lifted and the generation cache is off, so every
+request exercises the full pipeline. An event-loop lag monitor runs in the
+server's loop and is exposed at ``GET /bench/loop-lag`` (``?reset=true``
+clears it).
+
+Usage:
+    python -m benchmarks.serve [--port 8100] [--hashnode-url http://127.0.0.1:8101/]
+                               [--gemini-latency lognormal:0.8:0.4] [--gemini-error-rate 0.0]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List
+
+import uvicorn
+
+from .fake_gemini import FakeGeminiFactory
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes a task that sleeps for a fixed interval."""
+
+    def __init__(self, interval_seconds: float = 0.01):
+        self.interval_seconds = interval_seconds
+        self.samples: List[float] = []
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval_seconds)
+            self.samples.append(max(loop.time() - start - self.interval_seconds, 0.0))
+
+    def snapshot(self, reset: bool = False) -> Dict[str, float]:
+        """Return lag percentiles in milliseconds, optionally starting a new window."""
+        samples = sorted(self.samples)
+        if reset:
+            self.samples = []
+        if not samples:
+            return {"samples": 0}
+
+        def percentile(q: float) -> float:
+            return samples[min(int(q * len(samples)), len(samples) - 1)] * 1000
+
+        return {
+            "samples": len(samples),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": samples[-1] * 1000
+        }
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """Point the app at the fakes and lift quotas, unless the environment already says otherwise."""
+    defaults = {
+        "HASHNODE_API_URL": args.hashnode_url,
+        "DATA_DIR": tempfile.mkdtemp(prefix="blog-bench-"),
+        "GEMINI_REQUESTS_PER_MINUTE": "1000000",
+        "GEMINI_TOKENS_PER_MINUTE": "1000000000",
+        "GEMINI_MAX_CONCURRENCY": str(args.gemini_max_concurrency),
+        "HASHNODE_REQUESTS_PER_MINUTE": "1000000",
+        "GENERATION_CACHE_ENABLED": "false",
+    }
+    for name, value in defaults.items():
+        os.environ.setdefault(name, value)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    # Imported late so the environment above is what settings are loaded from
+    from agent.dependencies import get_gemini_service
+    from agent.services.gemini_service import GeminiService
+    from main import app
+
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    fake_service = GeminiService(model_factory=FakeGeminiFactory(
+        latency=args.gemini_latency,
+        error_rate=args.gemini_error_rate,
+        output_words=args.gemini_output_words
+    ))
+    app.dependency_overrides[get_gemini_service] = lambda: fake_service
+
+    monitor = LoopLagMonitor()
+
+    async def loop_lag(reset: bool = False) -> Dict[str, Any]:
+        return monitor.snapshot(reset)
+
+    app.add_api_route("/bench/loop-lag", loop_lag, methods=["GET"], include_in_schema=False)
+
+    config = uvicorn.Config(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+    server = uvicorn.Server(config)
+
+    monitor_task = asyncio.create_task(monitor.run())
+    try:
+        await server.serve()
+    finally:
+        monitor_task.cancel()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--hashnode-url", default="http://127.0.0.1:8101/", help="Fake Hashnode GraphQL endpoint")
+    parser.add_argument("--gemini-latency", default="lognormal:0.8:0.4", help="Latency distribution spec")
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0, help="Fraction of Gemini calls that fail")
+    parser.add_argument("--gemini-output-words", type=int, default=800, help="Approximate words per generated post")
+    parser.add_argument("--gemini-max-concurrency", type=int, default=64, help="GEMINI_MAX_CONCURRENCY for the app")
+    parser.add_argument("--loop", default="auto", choices=["auto", "asyncio", "uvloop"], help="Event loop implementation")
+    parser.add_argument("--verbose", action="store_true", help="Keep the app's INFO logging")
+    args = parser.parse_args()
+
+    configure_environment(args)
+    uvicorn.Config(None, loop=args.loop).setup_event_loop()
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    main()
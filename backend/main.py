@@ -3,6 +3,7 @@ Main FastAPI application for MCP Blog Server.
 """
 
 import logging
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -10,7 +11,19 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from agent.config import settings
-from agent.routes import blog_router, health_router
+from agent.dependencies import get_gemini_service, get_hashnode_service, resolve_startup_dependency
+from agent.metrics import TimedJSONResponse
+from agent.middleware import MetricsMiddleware, ServerTimingMiddleware
+from agent.routes import blog_router, health_router, metrics_router
+from agent.services.draft_store import DraftStore
+from agent.services.gemini_service import GeminiService
+from agent.services.generation_cache import GenerationCache
+from agent.services.hashnode_service import HashnodeService, create_http_client
+from agent.services.health_prober import HealthProber
+from agent.services.idempotency_store import IdempotencyStore
+from agent.services.job_service import JobManager
+from agent.services.longform_service import LongformService
+from agent.services.publish_outbox import PublishOutbox
 
 # Configure logging
 logging.basicConfig(
@@ -29,10 +42,76 @@ async def lifespan(app: FastAPI):
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Gemini model: {settings.gemini_model}")
     
+    # Build long-lived services once and share them across requests
+    app.state.http_client = create_http_client()
+    app.state.generation_cache = None
+    if settings.generation_cache_enabled:
+        app.state.generation_cache = GenerationCache(
+            max_entries=settings.generation_cache_max_entries,
+            ttl_seconds=settings.generation_cache_ttl_seconds,
+            db_path=(
+                os.path.join(settings.data_dir, "generation_cache.db")
+                if settings.generation_cache_persistent else None
+            )
+        )
+    app.state.gemini_service = GeminiService(cache=app.state.generation_cache)
+    app.state.idempotency_store = IdempotencyStore(
+        db_path=os.path.join(settings.data_dir, "idempotency.db"),
+        ttl_seconds=settings.idempotency_ttl_seconds
+    )
+    app.state.hashnode_service = HashnodeService(
+        client=app.state.http_client,
+        idempotency_store=app.state.idempotency_store
+    )
+    
+    # Background components honour overrides of the providers installed before startup
+    gemini_service = resolve_startup_dependency(app, get_gemini_service, app.state.gemini_service)
+    hashnode_service = resolve_startup_dependency(app, get_hashnode_service, app.state.hashnode_service)
+    
+    app.state.longform_service = LongformService(gemini_service=gemini_service)
+    app.state.draft_store = DraftStore(db_path=os.path.join(settings.data_dir, "drafts.db"))
+    
+    app.state.publish_outbox = PublishOutbox(
+        hashnode_service=hashnode_service,
+        db_path=os.path.join(settings.data_dir, "publish_outbox.db"),
+        workers=settings.outbox_workers,
+        max_attempts=settings.outbox_max_attempts,
+        base_delay_seconds=settings.outbox_base_delay_seconds,
+        max_delay_seconds=settings.outbox_max_delay_seconds,
+        key_ttl_seconds=settings.idempotency_ttl_seconds
+    )
+    app.state.publish_outbox.start()
+    
+    app.state.job_manager = JobManager(
+        gemini_service=gemini_service,
+        publish_outbox=app.state.publish_outbox,
+        draft_store=app.state.draft_store,
+        workers=settings.job_workers,
+        queue_size=settings.job_queue_size,
+        retention=settings.job_retention
+    )
+    app.state.job_manager.start()
+    
+    app.state.health_prober = HealthProber(
+        gemini_service=gemini_service,
+        hashnode_service=hashnode_service,
+        interval_seconds=settings.health_probe_interval_seconds,
+        timeout_seconds=settings.health_probe_timeout_seconds
+    )
+    app.state.health_prober.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down MCP Blog Server")
+    await app.state.health_prober.stop()
+    await app.state.job_manager.stop()
+    await app.state.publish_outbox.stop()
+    await app.state.http_client.aclose()
+    app.state.idempotency_store.close()
+    app.state.draft_store.close()
+    if app.state.generation_cache is not None:
+        app.state.generation_cache.close()
 
 
 # Create FastAPI app
@@ -42,6 +121,7 @@ app = FastAPI(
     description="A FastAPI application for generating and publishing blog posts using Gemini AI and Hashnode",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=TimedJSONResponse,
     lifespan=lifespan
 )
 
@@ -52,11 +132,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 # Include routers
 app.include_router(health_router)
 app.include_router(blog_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
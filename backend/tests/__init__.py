@@ -0,0 +1,13 @@
+"""
+Unit tests for MCP Blog Server.
+
+Run from the backend directory with ``python -m unittest discover -s tests -t .``.
+Nothing here calls Gemini or Hashnode, so placeholder credentials are set
+when real ones are not in the environment.
+"""
+
+import os
+
+os.environ.setdefault("GEMINI_API_KEY", "test_gemini_key")
+os.environ.setdefault("HASHNODE_TOKEN", "test_hashnode_token")
+os.environ.setdefault("HASHNODE_PUBLICATION_ID", "test_publication_id")
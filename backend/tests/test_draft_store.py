@@ -0,0 +1,117 @@
+"""
+Tests for the draft store and its search index.
+"""
+
+import os
+import tempfile
+import unittest
+
+from agent.models.blog import BlogPost
+from agent.services.draft_store import DraftStore, _fts_query
+
+
+class FtsQueryTest(unittest.TestCase):
+
+    def test_words_become_quoted_prefix_terms(self):
+        self.assertEqual(_fts_query("fast api"), '"fast"* "api"*')
+
+    def test_operators_and_quotes_are_ignored(self):
+        self.assertEqual(_fts_query('"python" OR (rust*) -go'), '"python"* "OR"* "rust"* "go"*')
+
+    def test_query_without_words_matches_nothing(self):
+        self.assertEqual(_fts_query('"* -'), '""')
+
+
+class DraftStoreTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.db_path = os.path.join(directory.name, "drafts.db")
+        self.store = DraftStore(self.db_path)
+        self.addCleanup(self.store.close)
+
+    async def save(self, title: str, content: str = "Body", **fields) -> int:
+        return await self.store.save(BlogPost(title=title, content=content, **fields))
+
+    async def test_saved_draft_round_trips(self):
+        draft_id = await self.store.save(
+            BlogPost(title="Round trip", content="# Round trip", tags=["python"], summary="Short", route="fast"),
+            timings={"gemini": 12.5}
+        )
+
+        draft = await self.store.get(draft_id)
+
+        self.assertEqual(draft.title, "Round trip")
+        self.assertEqual(draft.content, "# Round trip")
+        self.assertEqual(draft.tags, ["python"])
+        self.assertEqual(draft.summary, "Short")
+        self.assertEqual(draft.route, "fast")
+        self.assertEqual(draft.timings, {"gemini": 12.5})
+        self.assertIsNone(await self.store.get(draft_id + 100))
+
+    async def test_same_title_and_content_is_stored_once(self):
+        first = await self.save("Same", "Same body")
+        second = await self.save("Same", "Same body")
+        different = await self.save("Same", "Other body")
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, different)
+
+    async def test_keyset_pagination_walks_newest_first(self):
+        ids = [await self.save(f"Post {index}") for index in range(5)]
+
+        pages = []
+        cursor = None
+        while True:
+            drafts, cursor = await self.store.list(limit=2, before=cursor)
+            pages.append([draft.id for draft in drafts])
+            if cursor is None:
+                break
+
+        self.assertEqual(pages, [[ids[4], ids[3]], [ids[2], ids[1]], [ids[0]]])
+
+    async def test_exact_final_page_has_no_cursor(self):
+        for index in range(2):
+            await self.save(f"Post {index}")
+
+        drafts, cursor = await self.store.list(limit=2)
+
+        self.assertEqual(len(drafts), 2)
+        self.assertIsNone(cursor)
+
+    async def test_search_matches_every_term_as_prefix(self):
+        fastapi = await self.save("Building APIs", "Using FastAPI with pydantic", tags=["python"])
+        await self.save("Rust services", "Using axum", tags=["rust"])
+        await self.save("Fast tests", "Speeding up pytest")
+
+        drafts, _ = await self.store.list(limit=10, query="fast api")
+        self.assertEqual([draft.id for draft in drafts], [fastapi])
+
+        drafts, _ = await self.store.list(limit=10, query="python")
+        self.assertEqual([draft.id for draft in drafts], [fastapi])
+
+    async def test_search_paginates_and_survives_fts_syntax(self):
+        matching = [await self.save(f"Python tips {index}") for index in range(3)]
+        await self.save("Unrelated")
+
+        drafts, cursor = await self.store.list(limit=2, query="python")
+        rest, last_cursor = await self.store.list(limit=2, before=cursor, query="python")
+
+        self.assertEqual([draft.id for draft in drafts + rest], matching[::-1])
+        self.assertIsNone(last_cursor)
+        self.assertEqual(await self.store.list(limit=10, query='"unbalanced AND ('), ([], None))
+
+    async def test_drafts_survive_reopen(self):
+        draft_id = await self.save("Persistent")
+        self.store.close()
+
+        reopened = DraftStore(self.db_path)
+        self.addCleanup(reopened.close)
+        drafts, _ = await reopened.list(limit=10, query="persistent")
+
+        self.assertEqual([draft.id for draft in drafts], [draft_id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Tests for the content-addressed generation cache.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+from agent.models.blog import BlogPost
+from agent.services.gemini_service import GeminiService
+from agent.services.generation_cache import GenerationCache, make_cache_key
+from benchmarks.fake_gemini import FakeGeminiFactory
+
+
+def cache_key(title: str = "Caching", notes: str = "Some notes", tags=None, **overrides) -> str:
+    arguments = {
+        "title": title,
+        "notes": notes,
+        "tags": tags,
+        "model_name": "gemini-2.0-flash",
+        "template_version": "2",
+        "generation_config": {"temperature": 0.7}
+    }
+    arguments.update(overrides)
+    return make_cache_key(**arguments)
+
+
+def blog_post(title: str = "Caching") -> BlogPost:
+    return BlogPost(title=title, content=f"# {title}\n\nBody", tags=["python"], summary="Body")
+
+
+class MakeCacheKeyTest(unittest.TestCase):
+
+    def test_whitespace_and_tag_order_do_not_change_the_key(self):
+        self.assertEqual(
+            cache_key(title="  Caching  in  Python", notes="Some\n  notes", tags=["Python", "caching", "python"]),
+            cache_key(title="Caching in Python", notes="Some notes", tags=["caching", "PYTHON"])
+        )
+
+    def test_model_template_and_config_change_the_key(self):
+        base = cache_key()
+        self.assertNotEqual(base, cache_key(model_name="gemini-1.5-pro"))
+        self.assertNotEqual(base, cache_key(template_version="3"))
+        self.assertNotEqual(base, cache_key(generation_config={"temperature": 0.2}))
+        self.assertNotEqual(base, cache_key(notes="Other notes"))
+
+
+class GenerationCacheTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="generation-cache-test-")
+        self.db_path = os.path.join(self.data_dir, "generation_cache.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    async def test_memory_hit_and_miss_are_counted(self):
+        cache = GenerationCache(max_entries=10, ttl_seconds=60)
+
+        self.assertIsNone(await cache.get("key"))
+        await cache.set("key", blog_post())
+        self.assertEqual((await cache.get("key")).title, "Caching")
+
+        stats = cache.stats()
+        self.assertEqual((stats["memory_hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache = GenerationCache(max_entries=2, ttl_seconds=60)
+        await cache.set("a", blog_post("A"))
+        await cache.set("b", blog_post("B"))
+        await cache.get("a")
+        await cache.set("c", blog_post("C"))
+
+        self.assertIsNotNone(await cache.get("a"))
+        self.assertIsNone(await cache.get("b"))
+        self.assertIsNotNone(await cache.get("c"))
+
+    async def test_entries_expire_after_ttl(self):
+        cache = GenerationCache(max_entries=10, ttl_seconds=0.05)
+        await cache.set("key", blog_post())
+        await asyncio.sleep(0.06)
+
+        self.assertIsNone(await cache.get("key"))
+        self.assertEqual(cache.stats()["memory_entries"], 0)
+
+    async def test_persistent_tier_survives_a_new_instance(self):
+        cache = GenerationCache(max_entries=10, ttl_seconds=60, db_path=self.db_path)
+        await cache.set("key", blog_post())
+        cache.close()
+
+        reopened = GenerationCache(max_entries=10, ttl_seconds=60, db_path=self.db_path)
+        try:
+            self.assertEqual((await reopened.get("key")).title, "Caching")
+            self.assertEqual(reopened.stats()["disk_hits"], 1)
+
+            # Promoted to memory: the next lookup does not touch the disk
+            await reopened.get("key")
+            self.assertEqual(reopened.stats()["memory_hits"], 1)
+        finally:
+            reopened.close()
+
+    async def test_expired_rows_are_dropped_when_reopened(self):
+        cache = GenerationCache(max_entries=10, ttl_seconds=0.05, db_path=self.db_path)
+        await cache.set("key", blog_post())
+        cache.close()
+        await asyncio.sleep(0.06)
+
+        reopened = GenerationCache(max_entries=10, ttl_seconds=0.05, db_path=self.db_path)
+        try:
+            self.assertIsNone(await reopened.get("key"))
+        finally:
+            reopened.close()
+
+
+class CachedGenerationTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_hit_reuses_content_with_fresh_created_at(self):
+        calls = 0
+        factory = FakeGeminiFactory(latency="0")
+
+        def counting_factory(*args, **kwargs):
+            model = factory(*args, **kwargs)
+            generate = model.generate_content_async
+
+            async def counted(*call_args, **call_kwargs):
+                nonlocal calls
+                calls += 1
+                return await generate(*call_args, **call_kwargs)
+
+            model.generate_content_async = counted
+            return model
+
+        service = GeminiService(cache=GenerationCache(max_entries=10, ttl_seconds=60), model_factory=counting_factory)
+        notes = "Notes about caching " * 5
+
+        first = await service.generate_blog_post("Caching", notes)
+        await asyncio.sleep(0.01)
+        second = await service.generate_blog_post(" Caching ", notes)
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(second.content, first.content)
+        self.assertGreater(second.created_at, first.created_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Tests for hedged requests.
+"""
+
+import asyncio
+import unittest
+
+from agent.services.hedging import LatencyWindow, hedge
+
+
+class HedgeTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fast_primary_does_not_start_backup(self):
+        backup_started = False
+
+        async def primary():
+            return "primary"
+
+        async def backup():
+            nonlocal backup_started
+            backup_started = True
+            return "backup"
+
+        self.assertEqual(await hedge(primary, backup, delay=0.5), ("primary", False))
+        self.assertFalse(backup_started)
+
+    async def test_backup_wins_and_slow_primary_is_cancelled(self):
+        primary_cancelled = asyncio.Event()
+
+        async def primary():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+
+        async def backup():
+            return "backup"
+
+        self.assertEqual(await hedge(primary, backup, delay=0.01), ("backup", True))
+        await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+
+    async def test_primary_wins_and_backup_is_cancelled(self):
+        backup_cancelled = asyncio.Event()
+
+        async def primary():
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        async def backup():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                backup_cancelled.set()
+                raise
+
+        self.assertEqual(await hedge(primary, backup, delay=0.01), ("primary", False))
+        await asyncio.wait_for(backup_cancelled.wait(), timeout=1)
+
+    async def test_failed_backup_falls_back_to_primary(self):
+        async def primary():
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        async def backup():
+            raise RuntimeError("backup failed")
+
+        self.assertEqual(await hedge(primary, backup, delay=0.01), ("primary", False))
+
+    async def test_both_failing_raises_primary_error(self):
+        async def primary():
+            await asyncio.sleep(0.05)
+            raise ValueError("primary failed")
+
+        async def backup():
+            raise RuntimeError("backup failed")
+
+        with self.assertRaisesRegex(ValueError, "primary failed"):
+            await hedge(primary, backup, delay=0.01)
+
+    async def test_caller_cancellation_cancels_both_calls(self):
+        cancelled = []
+
+        def slow(name):
+            async def call():
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+            return call
+
+        task = asyncio.create_task(hedge(slow("primary"), slow("backup"), delay=0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        self.assertEqual(sorted(cancelled), ["backup", "primary"])
+
+
+class LatencyWindowTest(unittest.TestCase):
+
+    def test_percentile_needs_min_samples(self):
+        window = LatencyWindow(size=10, min_samples=3)
+        window.record(1.0)
+        window.record(2.0)
+        self.assertIsNone(window.percentile(0.5))
+
+        window.record(3.0)
+        self.assertEqual(window.percentile(0.5), 2.0)
+        self.assertEqual(window.percentile(1.0), 3.0)
+
+    def test_window_keeps_most_recent_samples(self):
+        window = LatencyWindow(size=3, min_samples=1)
+        for seconds in (10.0, 1.0, 2.0, 3.0):
+            window.record(seconds)
+        self.assertEqual(window.percentile(1.0), 3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Tests for idempotent publishing.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from typing import Dict, List
+
+import httpx
+
+from agent.models.hashnode import HashnodePublishRequest, HashnodePublishResponse
+from agent.services.hashnode_service import HashnodeService
+from agent.services.idempotency_store import IdempotencyStore, content_idempotency_key
+
+PUBLISHED = HashnodePublishResponse(
+    success=True,
+    post_id="id-1",
+    post_url="https://example.hashnode.dev/post",
+    message="Post published successfully"
+)
+
+
+def published(alias: str) -> Dict:
+    return {"post": {"id": f"id-{alias}", "url": f"https://example.hashnode.dev/{alias}"}}
+
+
+class ContentIdempotencyKeyTest(unittest.TestCase):
+
+    def test_key_ignores_surrounding_whitespace(self):
+        self.assertEqual(content_idempotency_key(" Title ", "Body\n"), content_idempotency_key("Title", "Body"))
+
+    def test_key_changes_with_content(self):
+        self.assertNotEqual(content_idempotency_key("Title", "Body"), content_idempotency_key("Title", "Other body"))
+
+
+class IdempotencyStoreTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.db_path = os.path.join(directory.name, "idempotency.sqlite3")
+
+    def open_store(self, ttl_seconds: float = 60) -> IdempotencyStore:
+        store = IdempotencyStore(self.db_path, ttl_seconds=ttl_seconds)
+        self.addCleanup(store.close)
+        return store
+
+    async def test_successful_result_survives_reopen(self):
+        store = self.open_store()
+        await store.set("key", PUBLISHED)
+        store.close()
+
+        self.assertEqual(await self.open_store().get("key"), PUBLISHED)
+
+    async def test_failed_result_is_not_stored(self):
+        store = self.open_store()
+        await store.set("key", HashnodePublishResponse(success=False, message="boom", error_code="HTTP_ERROR"))
+
+        self.assertIsNone(await store.get("key"))
+
+    async def test_expired_result_is_not_replayed_and_is_pruned_on_open(self):
+        store = self.open_store(ttl_seconds=0)
+        await store.set("key", PUBLISHED)
+
+        self.assertIsNone(await store.get("key"))
+
+        store.close()
+        self.assertIsNone(self.open_store(ttl_seconds=0)._db_get("key"))
+
+
+class IdempotentPublishTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        store = IdempotencyStore(os.path.join(directory.name, "idempotency.sqlite3"), ttl_seconds=60)
+        self.addCleanup(store.close)
+
+        self.requests: List[Dict] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            self.requests.append(payload)
+            await self.release.wait()
+            if "input" in payload["variables"]:
+                return httpx.Response(200, json={"data": {"publishPost": published("single")}})
+            return httpx.Response(200, json={"data": {
+                f"p{index}": published(f"p{index}") for index in range(len(payload["variables"]))
+            }})
+
+        self.service = HashnodeService(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            idempotency_store=store
+        )
+        self.addAsyncCleanup(self.service.client.aclose)
+        self.request = HashnodePublishRequest(title="Post", content_markdown="# Body")
+
+    async def test_published_key_is_replayed(self):
+        first = await self.service.publish_post(self.request, idempotency_key="key")
+        second = await self.service.publish_post(self.request, idempotency_key="key")
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertFalse(first.replayed)
+        self.assertTrue(second.replayed)
+        self.assertEqual(second.post_id, first.post_id)
+
+    async def test_concurrent_publishes_share_one_call(self):
+        self.release.clear()
+        calls = [asyncio.create_task(self.service.publish_post(self.request, idempotency_key="key")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        self.release.set()
+
+        responses = await asyncio.gather(*calls)
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual({response.post_id for response in responses}, {"id-single"})
+
+    async def test_batch_waits_for_publish_in_flight(self):
+        self.release.clear()
+        single = asyncio.create_task(self.service.publish_post(self.request, idempotency_key="key"))
+        await asyncio.sleep(0.01)
+        batch = asyncio.create_task(self.service.publish_many(
+            [self.request, HashnodePublishRequest(title="Other", content_markdown="# Body")],
+            idempotency_keys=["key", "other"]
+        ))
+        await asyncio.sleep(0.01)
+        self.release.set()
+
+        single_response = await single
+        batch_responses = await batch
+
+        # One single publish, and a batch carrying only the other post
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(len(self.requests[1]["variables"]), 1)
+        self.assertEqual(batch_responses[0].post_id, single_response.post_id)
+        self.assertTrue(batch_responses[1].success)
+
+    async def test_publish_waits_for_batch_in_flight(self):
+        self.release.clear()
+        batch = asyncio.create_task(self.service.publish_many([self.request], idempotency_keys=["key"]))
+        await asyncio.sleep(0.01)
+        single = asyncio.create_task(self.service.publish_post(self.request, idempotency_key="key"))
+        await asyncio.sleep(0.01)
+        self.release.set()
+
+        batch_responses = await batch
+        single_response = await single
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(single_response.post_id, batch_responses[0].post_id)
+
+    async def test_concurrent_batches_publish_a_key_once(self):
+        self.release.clear()
+        batches = [
+            asyncio.create_task(self.service.publish_many([self.request], idempotency_keys=["key"]))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        self.release.set()
+
+        first, second = await asyncio.gather(*batches)
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(first[0].post_id, second[0].post_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
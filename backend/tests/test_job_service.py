@@ -0,0 +1,124 @@
+"""
+Tests for background generation jobs.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Optional
+
+from agent.models.blog import BlogPost, BlogRequest
+from agent.models.hashnode import HashnodePublishRequest
+from agent.models.job import Job, JobStatus
+from agent.models.outbox import OutboxStatus
+from agent.services.draft_store import DraftStore
+from agent.services.idempotency_store import content_idempotency_key
+from agent.services.job_service import JobManager
+from agent.services.publish_outbox import PublishOutbox
+
+
+class FakeGeminiService:
+    """Returns a fixed post, or raises if ``error`` is set."""
+
+    def __init__(self, error: Optional[Exception] = None):
+        self.error = error
+
+    async def generate_blog_post(self, title, notes, tags=None, use_cache=True, optimize_for=None):
+        if self.error is not None:
+            raise self.error
+        return BlogPost(title=title, content=f"# {title}\n\n{notes}", tags=tags)
+
+
+class BrokenOutbox:
+    """Fails every enqueue."""
+
+    async def enqueue(self, request, idempotency_key):
+        raise OSError("disk full")
+
+
+class JobManagerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="job-test-")
+        self.addCleanup(shutil.rmtree, self.data_dir, True)
+        self.draft_store = DraftStore(os.path.join(self.data_dir, "drafts.db"))
+        self.addCleanup(self.draft_store.close)
+        # Workers are not started, so queued publishes stay pending
+        self.outbox = PublishOutbox(
+            hashnode_service=None,
+            db_path=os.path.join(self.data_dir, "publish_outbox.db"),
+            workers=1,
+            max_attempts=3,
+            base_delay_seconds=0.02,
+            max_delay_seconds=0.05,
+            key_ttl_seconds=60
+        )
+        self.addAsyncCleanup(self.outbox.stop)
+
+    async def run_job(self, request: BlogRequest, gemini_service=None, publish_outbox=None) -> Job:
+        manager = JobManager(
+            gemini_service=gemini_service or FakeGeminiService(),
+            publish_outbox=publish_outbox or self.outbox,
+            draft_store=self.draft_store,
+            workers=1,
+            queue_size=10,
+            retention=10
+        )
+        manager.start()
+        self.addAsyncCleanup(manager.stop)
+
+        job = manager.submit(request)
+        for _ in range(200):
+            if job.status in (JobStatus.DONE, JobStatus.FAILED):
+                return job
+            await asyncio.sleep(0.01)
+        self.fail(f"Job never finished; last seen {job.status.value}")
+
+    async def test_publish_immediately_queues_in_outbox(self):
+        job = await self.run_job(BlogRequest(title="Jobs", notes="Some notes", publish_immediately=True))
+
+        self.assertEqual(job.status, JobStatus.DONE)
+        self.assertIsNotNone(job.result.outbox_id)
+        self.assertEqual(job.result.publish_status, OutboxStatus.PENDING.value)
+        self.assertIn("queued for publishing", job.result.message)
+
+        # Keyed by content, so queueing the same post again finds the job's entry
+        blog_post = job.result.blog_post
+        entry = await self.outbox.enqueue(
+            HashnodePublishRequest(title=blog_post.title, content_markdown=blog_post.content),
+            idempotency_key=content_idempotency_key(blog_post.title, blog_post.content)
+        )
+        self.assertEqual(entry.id, job.result.outbox_id)
+
+    async def test_job_without_publish_does_not_touch_outbox(self):
+        job = await self.run_job(BlogRequest(title="Jobs", notes="Some notes"))
+
+        self.assertEqual(job.status, JobStatus.DONE)
+        self.assertIsNone(job.result.outbox_id)
+        self.assertIsNotNone(job.result.draft_id)
+
+    async def test_failed_enqueue_is_reported(self):
+        job = await self.run_job(
+            BlogRequest(title="Jobs", notes="Some notes", publish_immediately=True),
+            publish_outbox=BrokenOutbox()
+        )
+
+        self.assertIsNone(job.result.outbox_id)
+        self.assertIn("could not be queued", job.result.message)
+        self.assertIn("disk full", job.error)
+
+    async def test_generation_failure_fails_job(self):
+        job = await self.run_job(
+            BlogRequest(title="Jobs", notes="Some notes"),
+            gemini_service=FakeGeminiService(error=RuntimeError("quota exceeded"))
+        )
+
+        self.assertEqual(job.status, JobStatus.FAILED)
+        self.assertFalse(job.result.success)
+        self.assertIn("quota exceeded", job.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
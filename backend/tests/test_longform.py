@@ -0,0 +1,65 @@
+"""
+Tests for long-form outline parsing and stitching.
+"""
+
+import json
+import unittest
+
+from agent.services.longform_service import LongformService, OutlineSection, parse_outline
+
+
+class ParseOutlineTest(unittest.TestCase):
+
+    def test_parses_sections_object(self):
+        text = json.dumps({"sections": [
+            {"heading": " Setup ", "points": ["install", " configure "]},
+            {"heading": "Usage", "points": "run it"}
+        ]})
+
+        self.assertEqual(parse_outline(text, max_sections=5), [
+            OutlineSection(heading="Setup", points=["install", "configure"]),
+            OutlineSection(heading="Usage", points=["run it"])
+        ])
+
+    def test_accepts_bare_list_inside_code_fence(self):
+        text = '```json\n[{"heading": "Setup", "points": []}]\n```'
+
+        self.assertEqual(parse_outline(text, max_sections=5), [OutlineSection(heading="Setup", points=[])])
+
+    def test_skips_items_without_heading_and_blank_points(self):
+        text = json.dumps([{"heading": "  "}, "not a section", {"heading": "Kept", "points": ["", "a"]}])
+
+        self.assertEqual(parse_outline(text, max_sections=5), [OutlineSection(heading="Kept", points=["a"])])
+
+    def test_truncates_to_max_sections(self):
+        text = json.dumps([{"heading": f"Section {i}"} for i in range(6)])
+
+        self.assertEqual([s.heading for s in parse_outline(text, max_sections=3)], ["Section 0", "Section 1", "Section 2"])
+
+    def test_rejects_unusable_outlines(self):
+        for text in ("not json", json.dumps({"title": "x"}), json.dumps([]), json.dumps([{"points": ["a"]}])):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_outline(text, max_sections=5)
+
+
+class StitchTest(unittest.TestCase):
+
+    def test_stitches_sections_under_their_headings(self):
+        outline = [OutlineSection(heading="Setup", points=[]), OutlineSection(heading="Usage", points=[])]
+
+        content = LongformService._stitch(
+            "My Post",
+            "Intro text.\n",
+            outline,
+            ["Setup body.", "\nUsage body."],
+            "## Wrapping up\nConclusion text."
+        )
+
+        self.assertEqual(content, (
+            "# My Post\n\nIntro text.\n\n## Setup\n\nSetup body.\n\n"
+            "## Usage\n\nUsage body.\n\n## Conclusion\n\nConclusion text."
+        ))
+
+
+if __name__ == "__main__":
+    unittest.main()
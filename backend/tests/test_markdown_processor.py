@@ -0,0 +1,124 @@
+"""
+Tests for single-pass markdown processing.
+"""
+
+import unittest
+
+from agent.services.markdown_processor import SUMMARY_MAX_CHARS, MarkdownProcessor, process_markdown
+
+DOCUMENT = """# Getting Started with FastAPI
+
+FastAPI is a modern web framework for building APIs with Python.
+It is fast to write and fast to run.
+
+## Installation
+
+Install it with pip:
+
+```bash
+pip install fastapi
+# not a heading
+```
+
+## Your First App
+
+### Routes
+
+```python
+from fastapi import FastAPI
+```
+
+### Routes
+
+~~~
+plain block
+~~~
+
+#### Deep dive
+
+```bash
+uvicorn main:app
+```
+"""
+
+
+class MarkdownProcessorTest(unittest.TestCase):
+
+    def test_headings_and_anchors(self):
+        headings = process_markdown(DOCUMENT).metadata.headings
+
+        self.assertEqual(
+            [(heading.level, heading.text, heading.anchor) for heading in headings],
+            [
+                (1, "Getting Started with FastAPI", "getting-started-with-fastapi"),
+                (2, "Installation", "installation"),
+                (2, "Your First App", "your-first-app"),
+                (3, "Routes", "routes"),
+                (3, "Routes", "routes-1"),
+                (4, "Deep dive", "deep-dive")
+            ]
+        )
+
+    def test_table_of_contents_lists_level_two_and_three(self):
+        self.assertEqual(process_markdown(DOCUMENT).metadata.table_of_contents, (
+            "- [Installation](#installation)\n"
+            "- [Your First App](#your-first-app)\n"
+            "  - [Routes](#routes)\n"
+            "  - [Routes](#routes-1)"
+        ))
+
+    def test_code_blocks_and_languages(self):
+        metadata = process_markdown(DOCUMENT).metadata
+
+        self.assertEqual(metadata.code_blocks, 4)
+        self.assertEqual(metadata.code_languages, ["bash", "python"])
+
+    def test_code_is_not_counted_as_words(self):
+        result = process_markdown("## Two words\n\n```python\nprint('many words in code here')\n```\nthree more words")
+
+        self.assertEqual(result.metadata.word_count, 5)
+        self.assertEqual(result.metadata.reading_time_minutes, 1)
+
+    def test_reading_time_rounds_up(self):
+        self.assertEqual(process_markdown("word " * 201, words_per_minute=200).metadata.reading_time_minutes, 2)
+
+    def test_summary_skips_headings_and_code(self):
+        self.assertEqual(
+            process_markdown(DOCUMENT).summary,
+            "FastAPI is a modern web framework for building APIs with Python. "
+            "It is fast to write and fast to run. Install it with pip:"
+        )
+
+    def test_summary_skips_title_without_space(self):
+        self.assertEqual(process_markdown("#Title\n\nFirst paragraph.").summary, "First paragraph.")
+
+    def test_long_summary_is_truncated(self):
+        summary = process_markdown("word " * 100).summary
+
+        self.assertEqual(len(summary), SUMMARY_MAX_CHARS)
+        self.assertTrue(summary.endswith("..."))
+
+    def test_wrapper_fence_is_removed(self):
+        for wrapped in (f"```markdown\n{DOCUMENT}```", f"\n~~~md\n{DOCUMENT}~~~\n"):
+            with self.subTest(wrapped=wrapped[:8]):
+                self.assertEqual(process_markdown(wrapped).content, DOCUMENT.strip())
+                self.assertEqual(process_markdown(wrapped).metadata, process_markdown(DOCUMENT).metadata)
+
+    def test_content_ending_in_code_block_is_kept(self):
+        self.assertEqual(process_markdown(DOCUMENT).content, DOCUMENT.strip())
+
+    def test_streamed_chunks_match_whole_document(self):
+        whole = process_markdown(f"```markdown\n{DOCUMENT}```")
+
+        for size in (1, 3, 17):
+            processor = MarkdownProcessor()
+            text = f"```markdown\n{DOCUMENT}```"
+            for start in range(0, len(text), size):
+                processor.feed(text[start:start + size])
+
+            with self.subTest(size=size):
+                self.assertEqual(processor.finish(), whole)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Tests for size-aware model routing.
+"""
+
+import unittest
+from unittest import mock
+
+from agent.services.model_router import (
+    FAST_ROUTE,
+    OUTLINE_ROUTE,
+    QUALITY_ROUTE,
+    ModelRoute,
+    ModelRouter,
+)
+
+
+def make_router(enabled: bool = True) -> ModelRouter:
+    return ModelRouter(
+        routes={
+            FAST_ROUTE: ModelRoute(name=FAST_ROUTE, model_name="fast-model", max_output_tokens=100),
+            QUALITY_ROUTE: ModelRoute(name=QUALITY_ROUTE, model_name="quality-model", max_output_tokens=1000)
+        },
+        short_notes_chars=20,
+        max_fast_tags=2,
+        enabled=enabled
+    )
+
+
+class ModelRouterTest(unittest.TestCase):
+
+    def test_short_notes_with_few_tags_use_fast_tier(self):
+        self.assertEqual(make_router().route("x" * 20, ["a", "b"]).name, FAST_ROUTE)
+        self.assertEqual(make_router().route("short notes").name, FAST_ROUTE)
+
+    def test_long_notes_use_quality_tier(self):
+        self.assertEqual(make_router().route("x" * 21).name, QUALITY_ROUTE)
+
+    def test_many_tags_use_quality_tier(self):
+        self.assertEqual(make_router().route("short", ["a", "b", "c"]).name, QUALITY_ROUTE)
+
+    def test_optimize_for_overrides_size_heuristic(self):
+        router = make_router()
+        self.assertEqual(router.route("short", optimize_for="quality").name, QUALITY_ROUTE)
+        self.assertEqual(router.route("x" * 500, ["a", "b", "c"], optimize_for="latency").name, FAST_ROUTE)
+
+    def test_disabled_router_always_uses_quality_tier(self):
+        router = make_router(enabled=False)
+        self.assertEqual(router.route("short").name, QUALITY_ROUTE)
+        self.assertEqual(router.route("short", optimize_for="latency").name, QUALITY_ROUTE)
+
+    def test_from_settings(self):
+        with mock.patch("agent.services.model_router.settings.routing_enabled", False):
+            router = ModelRouter.from_settings()
+
+        self.assertFalse(router.enabled)
+        self.assertEqual(router.routes[OUTLINE_ROUTE].response_mime_type, "application/json")
+        self.assertEqual(set(router.routes), {FAST_ROUTE, QUALITY_ROUTE, OUTLINE_ROUTE})
+
+
+if __name__ == "__main__":
+    unittest.main()
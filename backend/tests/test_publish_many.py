@@ -0,0 +1,127 @@
+"""
+Tests for batched publishing through aliased publishPost mutations.
+"""
+
+import json
+import unittest
+from typing import Callable, Dict, List
+from unittest import mock
+
+import httpx
+
+from agent.models.hashnode import HashnodePublishRequest
+from agent.services.hashnode_service import HashnodeService, build_publish_many_mutation
+
+
+def published(alias: str) -> Dict:
+    return {"post": {"id": f"id-{alias}", "url": f"https://example.hashnode.dev/{alias}"}}
+
+
+def publish_requests(count: int) -> List[HashnodePublishRequest]:
+    return [HashnodePublishRequest(title=f"Post {index}", content_markdown="# Body") for index in range(count)]
+
+
+class PublishManyTest(unittest.IsolatedAsyncioTestCase):
+
+    def make_service(self, respond: Callable[[Dict], httpx.Response]) -> HashnodeService:
+        self.requests: List[Dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            self.requests.append(payload)
+            return respond(payload)
+
+        service = HashnodeService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        self.addAsyncCleanup(service.client.aclose)
+        return service
+
+    async def test_each_post_gets_its_own_result(self):
+        service = self.make_service(lambda payload: httpx.Response(200, json={"data": {
+            f"p{index}": published(f"p{index}") for index in range(len(payload["variables"]))
+        }}))
+
+        responses = await service.publish_many(publish_requests(3))
+
+        self.assertEqual([response.post_id for response in responses], ["id-p0", "id-p1", "id-p2"])
+        self.assertTrue(all(response.success for response in responses))
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.requests[0]["query"], build_publish_many_mutation(3))
+
+    async def test_posts_are_sent_in_chunks(self):
+        service = self.make_service(lambda payload: httpx.Response(200, json={"data": {
+            f"p{index}": published(f"p{index}") for index in range(len(payload["variables"]))
+        }}))
+
+        with mock.patch("agent.services.hashnode_service.settings.hashnode_publish_chunk_size", 2):
+            responses = await service.publish_many(publish_requests(5))
+
+        self.assertEqual([len(request["variables"]) for request in self.requests], [2, 2, 1])
+        self.assertEqual(len(responses), 5)
+        self.assertTrue(all(response.success for response in responses))
+
+    async def test_alias_errors_are_mapped_to_their_post(self):
+        # Nullable payloads: the other aliases still return data
+        service = self.make_service(lambda payload: httpx.Response(200, json={
+            "data": {"p0": published("p0"), "p1": None, "p2": published("p2")},
+            "errors": [{"message": "Invalid tag", "path": ["p1"]}]
+        }))
+
+        responses = await service.publish_many(publish_requests(3))
+
+        self.assertEqual([response.success for response in responses], [True, False, True])
+        self.assertEqual(responses[1].error_code, "GRAPHQL_ERROR")
+        self.assertIn("Invalid tag", responses[1].message)
+
+    async def test_null_data_reports_other_posts_as_outcome_unknown(self):
+        # publishPost is non-null, so one failing alias nulls the whole response
+        service = self.make_service(lambda payload: httpx.Response(200, json={
+            "data": None,
+            "errors": [{"message": "Invalid tag", "path": ["p1", "post"]}]
+        }))
+
+        responses = await service.publish_many(publish_requests(3))
+
+        self.assertEqual(
+            [response.error_code for response in responses],
+            ["OUTCOME_UNKNOWN", "GRAPHQL_ERROR", "OUTCOME_UNKNOWN"]
+        )
+        self.assertFalse(any(response.success for response in responses))
+
+    async def test_request_errors_fail_every_post(self):
+        # Rejected before execution: no data key at all, so nothing was published
+        service = self.make_service(lambda payload: httpx.Response(200, json={
+            "errors": [{"message": "Variable $input0 is invalid"}]
+        }))
+
+        responses = await service.publish_many(publish_requests(2))
+
+        self.assertEqual([response.error_code for response in responses], ["GRAPHQL_ERROR", "GRAPHQL_ERROR"])
+
+    async def test_http_error_fails_every_post_in_the_chunk(self):
+        service = self.make_service(lambda payload: httpx.Response(400, json={"message": "Bad request"}))
+
+        responses = await service.publish_many(publish_requests(2))
+
+        self.assertEqual([response.error_code for response in responses], ["HTTP_ERROR", "HTTP_ERROR"])
+        self.assertFalse(any(response.retryable for response in responses))
+
+    async def test_server_and_network_errors_are_retryable(self):
+        def unreachable(payload: Dict) -> httpx.Response:
+            raise httpx.ConnectError("connection refused")
+
+        for respond, error_code in (
+            (lambda payload: httpx.Response(500, json={"message": "Internal error"}), "HTTP_ERROR"),
+            (unreachable, "NETWORK_ERROR")
+        ):
+            service = self.make_service(respond)
+
+            with mock.patch("agent.services.retry.settings.retry_max_attempts", 1):
+                responses = await service.publish_many(publish_requests(2))
+
+            with self.subTest(error_code=error_code):
+                self.assertEqual([response.error_code for response in responses], [error_code, error_code])
+                self.assertTrue(all(response.retryable for response in responses))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+Tests for the durable publish outbox.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from typing import List, Optional
+
+from agent.models.hashnode import HashnodePublishRequest, HashnodePublishResponse
+from agent.models.outbox import OutboxStatus
+from agent.services.publish_outbox import PublishOutbox
+
+
+class FakeHashnodeService:
+    """Records publish calls and answers from a list of outcomes (the last one repeats)."""
+
+    def __init__(self, outcomes: Optional[List[bool]] = None, retryable: bool = True):
+        self.outcomes = outcomes or [True]
+        self.retryable = retryable
+        self.calls: List[str] = []
+        self.block: Optional[asyncio.Event] = None
+        self.started = asyncio.Event()
+
+    async def publish_post(self, request: HashnodePublishRequest, idempotency_key: Optional[str] = None):
+        self.calls.append(idempotency_key)
+        self.started.set()
+        if self.block is not None:
+            await self.block.wait()
+
+        success = self.outcomes[min(len(self.calls), len(self.outcomes)) - 1]
+        if success:
+            return HashnodePublishResponse(
+                success=True,
+                post_id=f"post-{len(self.calls)}",
+                post_url=f"https://example.hashnode.dev/post-{len(self.calls)}",
+                message="Post published successfully"
+            )
+        if self.retryable:
+            return HashnodePublishResponse(
+                success=False,
+                message="upstream unavailable",
+                error_code="HTTP_ERROR",
+                retryable=True
+            )
+        return HashnodePublishResponse(success=False, message="invalid publication", error_code="GRAPHQL_ERROR")
+
+
+def publish_request(title: str = "Outbox test") -> HashnodePublishRequest:
+    return HashnodePublishRequest(title=title, content_markdown="# Body", tags=["python"])
+
+
+class PublishOutboxTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="outbox-test-")
+        self.db_path = os.path.join(self.data_dir, "publish_outbox.db")
+        self.outboxes: List[PublishOutbox] = []
+
+    async def asyncTearDown(self):
+        for outbox in self.outboxes:
+            await outbox.stop()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def make_outbox(
+        self,
+        service: FakeHashnodeService,
+        max_attempts: int = 3,
+        key_ttl_seconds: float = 60
+    ) -> PublishOutbox:
+        outbox = PublishOutbox(
+            hashnode_service=service,
+            db_path=self.db_path,
+            workers=2,
+            max_attempts=max_attempts,
+            base_delay_seconds=0.02,
+            max_delay_seconds=0.05,
+            key_ttl_seconds=key_ttl_seconds
+        )
+        self.outboxes.append(outbox)
+        return outbox
+
+    async def wait_for_status(self, outbox: PublishOutbox, entry_id: int, status: OutboxStatus):
+        for _ in range(200):
+            entry = await outbox.get(entry_id)
+            if entry.status == status:
+                return entry
+            await asyncio.sleep(0.01)
+        self.fail(f"Entry {entry_id} never reached {status.value}; last seen {entry.status.value}")
+
+    async def test_enqueued_entry_is_published(self):
+        service = FakeHashnodeService()
+        outbox = self.make_outbox(service)
+        outbox.start()
+
+        entry = await outbox.enqueue(publish_request(), "key-1")
+        published = await self.wait_for_status(outbox, entry.id, OutboxStatus.PUBLISHED)
+
+        self.assertEqual(published.post_id, "post-1")
+        self.assertEqual(published.attempts, 1)
+        self.assertEqual(service.calls, ["key-1"])
+
+    async def test_enqueueing_same_key_returns_existing_entry(self):
+        outbox = self.make_outbox(FakeHashnodeService())
+
+        first = await outbox.enqueue(publish_request(), "key-1")
+        second = await outbox.enqueue(publish_request(), "key-1")
+
+        self.assertEqual(first.id, second.id)
+
+    async def test_failures_are_retried_with_backoff(self):
+        service = FakeHashnodeService(outcomes=[False, False, True])
+        outbox = self.make_outbox(service)
+        outbox.start()
+
+        entry = await outbox.enqueue(publish_request(), "key-1")
+        published = await self.wait_for_status(outbox, entry.id, OutboxStatus.PUBLISHED)
+
+        self.assertEqual(published.attempts, 3)
+        self.assertIsNone(published.last_error)
+        # Every attempt reuses the entry's idempotency key
+        self.assertEqual(service.calls, ["key-1"] * 3)
+
+    async def test_entry_fails_after_max_attempts_and_can_be_requeued(self):
+        service = FakeHashnodeService(outcomes=[False, False, True])
+        outbox = self.make_outbox(service, max_attempts=2)
+        outbox.start()
+
+        entry = await outbox.enqueue(publish_request(), "key-1")
+        failed = await self.wait_for_status(outbox, entry.id, OutboxStatus.FAILED)
+        self.assertEqual(failed.attempts, 2)
+        self.assertEqual(failed.last_error, "upstream unavailable")
+
+        requeued = await outbox.enqueue(publish_request(), "key-1")
+        self.assertEqual(requeued.id, entry.id)
+        self.assertEqual(requeued.attempts, 0)
+        await self.wait_for_status(outbox, entry.id, OutboxStatus.PUBLISHED)
+
+    async def test_non_retryable_failure_fails_on_first_attempt(self):
+        service = FakeHashnodeService(outcomes=[False, True], retryable=False)
+        outbox = self.make_outbox(service)
+        outbox.start()
+
+        entry = await outbox.enqueue(publish_request(), "key-1")
+        failed = await self.wait_for_status(outbox, entry.id, OutboxStatus.FAILED)
+
+        self.assertEqual(failed.attempts, 1)
+        self.assertEqual(failed.last_error, "invalid publication")
+        self.assertIsNone(failed.next_attempt_at)
+        self.assertEqual(service.calls, ["key-1"])
+
+    async def test_expired_key_is_published_again_and_old_entries_are_pruned(self):
+        service = FakeHashnodeService()
+        outbox = self.make_outbox(service, key_ttl_seconds=0)
+        outbox.start()
+
+        first = await outbox.enqueue(publish_request(), "key-1")
+        await self.wait_for_status(outbox, first.id, OutboxStatus.PUBLISHED)
+
+        second = await outbox.enqueue(publish_request(), "key-1")
+        self.assertNotEqual(second.id, first.id)
+        await self.wait_for_status(outbox, second.id, OutboxStatus.PUBLISHED)
+        self.assertEqual(service.calls, ["key-1"] * 2)
+
+        await outbox.stop()
+        reopened = self.make_outbox(service, key_ttl_seconds=0)
+        self.assertIsNone(await reopened.get(second.id))
+
+    async def test_entry_interrupted_mid_publish_is_requeued_on_restart(self):
+        stuck = FakeHashnodeService()
+        stuck.block = asyncio.Event()
+        outbox = self.make_outbox(stuck)
+        outbox.start()
+
+        entry = await outbox.enqueue(publish_request(), "key-1")
+        await asyncio.wait_for(stuck.started.wait(), timeout=1)
+        self.assertEqual((await outbox.get(entry.id)).status, OutboxStatus.PUBLISHING)
+
+        # Simulate a shutdown while the publish is in flight
+        await outbox.stop()
+        self.outboxes.remove(outbox)
+
+        service = FakeHashnodeService()
+        restarted = self.make_outbox(service)
+        restarted.start()
+
+        published = await self.wait_for_status(restarted, entry.id, OutboxStatus.PUBLISHED)
+        self.assertEqual(published.attempts, 2)
+        self.assertEqual(service.calls, ["key-1"])
+
+    async def test_each_entry_is_claimed_by_one_worker(self):
+        service = FakeHashnodeService()
+        outbox = self.make_outbox(service)
+        outbox.start()
+
+        entries = [await outbox.enqueue(publish_request(f"Post {index}"), f"key-{index}") for index in range(10)]
+        for entry in entries:
+            await self.wait_for_status(outbox, entry.id, OutboxStatus.PUBLISHED)
+
+        self.assertEqual(sorted(service.calls), sorted(f"key-{index}" for index in range(10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests for token-bucket rate limiting.
+"""
+
+import asyncio
+import time
+import unittest
+
+from agent.services.rate_limiter import RateLimiter, TokenBucket
+
+
+class TokenBucketTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_burst_up_to_capacity_does_not_wait(self):
+        bucket = TokenBucket(rate_per_minute=60, capacity=5)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    async def test_waiters_are_paced_at_the_refill_rate(self):
+        # 20 tokens per second, no burst: four extra acquires take about 0.2s
+        bucket = TokenBucket(rate_per_minute=1200, capacity=1)
+        await bucket.acquire()
+
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.18)
+        self.assertLess(elapsed, 0.5)
+
+    async def test_waiters_are_served_in_arrival_order(self):
+        bucket = TokenBucket(rate_per_minute=1200, capacity=1)
+        await bucket.acquire()
+        order = []
+
+        async def take(index):
+            await bucket.acquire()
+            order.append(index)
+
+        tasks = []
+        for index in range(5):
+            tasks.append(asyncio.create_task(take(index)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(order, list(range(5)))
+
+    async def test_oversized_request_is_clamped_to_capacity(self):
+        bucket = TokenBucket(rate_per_minute=6000, capacity=10)
+        await asyncio.wait_for(bucket.acquire(1000), timeout=1)
+
+
+class RateLimiterTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_token_budget_is_enforced_separately(self):
+        # 10 tokens per second: once a minute's budget is spent, 5 more take about half a second
+        limiter = RateLimiter(requests_per_minute=60000, tokens_per_minute=600)
+
+        await limiter.acquire(tokens=600)
+        start = time.monotonic()
+        await limiter.acquire(tokens=5)
+        self.assertGreaterEqual(time.monotonic() - start, 0.45)
+
+    async def test_requests_without_token_budget_skip_token_bucket(self):
+        limiter = RateLimiter(requests_per_minute=60000)
+        self.assertIsNone(limiter.tokens)
+        await asyncio.wait_for(limiter.acquire(tokens=10 ** 9), timeout=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
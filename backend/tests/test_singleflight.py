@@ -0,0 +1,125 @@
+"""
+Tests for SingleFlight call coalescing.
+"""
+
+import asyncio
+import unittest
+
+from agent.services.singleflight import SingleFlight
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        waiters = [asyncio.create_task(flight.do("key", fn)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*waiters), ["result"] * 5)
+        self.assertEqual(calls, 1)
+        self.assertEqual((flight.leaders, flight.followers), (1, 4))
+        self.assertEqual(flight.in_flight(), 0)
+
+    async def test_follower_survives_leader_cancellation(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fn():
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(flight.do("key", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", fn))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await follower, "result")
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+
+    async def test_call_is_cancelled_once_every_caller_leaves(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fn():
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.create_task(flight.do("key", fn)) for _ in range(2)]
+        await started.wait()
+
+        callers[0].cancel()
+        await asyncio.sleep(0)
+        self.assertFalse(cancelled.is_set())
+
+        callers[1].cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        self.assertEqual(flight.in_flight(), 0)
+
+    async def test_exception_reaches_every_caller_and_key_is_released(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise ValueError("boom")
+
+        callers = [asyncio.create_task(flight.do("key", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+        async def succeeding():
+            return "retried"
+
+        self.assertEqual(await flight.do("key", succeeding), "retried")
+        self.assertEqual(flight.leaders, 2)
+
+
+    async def test_claimed_key_is_shared_with_do_callers(self):
+        flight = SingleFlight()
+        claim = flight.claim("key")
+
+        async def unexpected():
+            raise AssertionError("a claimed key must not start a call")
+
+        self.assertIsNone(flight.claim("key"))
+        follower = asyncio.create_task(flight.do("key", unexpected))
+        cancelled_follower = asyncio.create_task(flight.do("key", unexpected))
+        await asyncio.sleep(0)
+
+        # A follower leaving does not cancel a claim its claimant still owes
+        cancelled_follower.cancel()
+        await asyncio.sleep(0)
+        self.assertFalse(claim.done())
+
+        claim.set_result("claimed")
+        self.assertEqual(await follower, "claimed")
+        self.assertEqual(flight.in_flight(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
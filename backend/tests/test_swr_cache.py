@@ -0,0 +1,94 @@
+"""
+Tests for the stale-while-revalidate cache.
+"""
+
+import asyncio
+import unittest
+
+from agent.services.swr_cache import StaleWhileRevalidateCache
+
+
+class CountingLoader:
+    """Loader returning an increasing version, optionally failing or blocking."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return {"version": self.calls}
+
+
+class StaleWhileRevalidateCacheTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fresh_value_is_served_without_reloading(self):
+        loader = CountingLoader()
+        cache = StaleWhileRevalidateCache(loader, ttl_seconds=60, max_stale_seconds=60)
+
+        self.assertEqual(await cache.get(), {"version": 1})
+        self.assertEqual(await cache.get(), {"version": 1})
+        self.assertEqual(loader.calls, 1)
+
+    async def test_concurrent_cold_gets_share_one_load(self):
+        loader = CountingLoader()
+        loader.release.clear()
+        cache = StaleWhileRevalidateCache(loader, ttl_seconds=60, max_stale_seconds=60)
+
+        gets = [asyncio.create_task(cache.get()) for _ in range(5)]
+        await asyncio.sleep(0)
+        loader.release.set()
+
+        self.assertEqual(await asyncio.gather(*gets), [{"version": 1}] * 5)
+        self.assertEqual(loader.calls, 1)
+
+    async def test_stale_value_is_served_while_refreshing_in_background(self):
+        loader = CountingLoader()
+        cache = StaleWhileRevalidateCache(loader, ttl_seconds=0.02, max_stale_seconds=60)
+        await cache.get()
+        await asyncio.sleep(0.03)
+
+        loader.release.clear()
+        self.assertEqual(await cache.get(), {"version": 1})
+        await asyncio.sleep(0)
+        self.assertEqual(loader.calls, 2)
+
+        loader.release.set()
+        await asyncio.sleep(0.01)
+        self.assertEqual(await cache.get(), {"version": 2})
+
+    async def test_expired_value_is_reloaded_inline(self):
+        loader = CountingLoader()
+        cache = StaleWhileRevalidateCache(loader, ttl_seconds=0.01, max_stale_seconds=0.01)
+        await cache.get()
+        await asyncio.sleep(0.03)
+
+        self.assertEqual(await cache.get(), {"version": 2})
+
+    async def test_failed_refresh_keeps_previous_value(self):
+        loader = CountingLoader()
+        cache = StaleWhileRevalidateCache(loader, ttl_seconds=0.01, max_stale_seconds=0.01)
+        await cache.get()
+        await asyncio.sleep(0.03)
+
+        loader.fail = True
+        self.assertEqual(await cache.get(), {"version": 1})
+
+    async def test_set_stores_a_fresh_value(self):
+        loader = CountingLoader()
+        cache = StaleWhileRevalidateCache(loader, ttl_seconds=60, max_stale_seconds=60)
+
+        cache.set({"version": "probe"})
+
+        self.assertEqual(await cache.get(), {"version": "probe"})
+        self.assertEqual(loader.calls, 0)
+        self.assertLess(cache.age(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
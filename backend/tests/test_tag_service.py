@@ -0,0 +1,146 @@
+"""
+Tests for tag normalization and cached tag resolution.
+"""
+
+import asyncio
+import unittest
+from typing import Any, Dict, List
+
+from agent.services.tag_service import TagResolver, build_tag_lookup_query, normalize_tags, slugify
+
+KNOWN_TAGS = {
+    "python": {"id": "tag-python", "name": "Python", "slug": "python"},
+    "web-development": {"id": "tag-web", "name": "Web Development", "slug": "web-development"}
+}
+
+
+class FakeGraphQL:
+    """Answers tag lookups from KNOWN_TAGS and records every request."""
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.fail = False
+
+    async def __call__(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        self.requests.append(payload)
+        await self.release.wait()
+        if self.fail:
+            raise ConnectionError("Hashnode unreachable")
+        return {"data": {
+            f"t{name[len('slug'):]}": KNOWN_TAGS.get(slug)
+            for name, slug in payload["variables"].items()
+        }}
+
+
+class SlugifyTest(unittest.TestCase):
+
+    def test_slugify(self):
+        self.assertEqual(slugify("Python"), "python")
+        self.assertEqual(slugify("  Web   Development "), "web-development")
+        self.assertEqual(slugify("machine_learning"), "machine-learning")
+        self.assertEqual(slugify("C++ & Rust!"), "c-rust")
+        self.assertEqual(slugify("--node--js--"), "node-js")
+        self.assertEqual(slugify("!!!"), "")
+
+
+class NormalizeTagsTest(unittest.TestCase):
+
+    def test_keeps_first_spelling_of_each_slug(self):
+        self.assertEqual(
+            normalize_tags(["Python", "python ", "PYTHON", "Web  Development", "web-development"]),
+            ["Python", "Web Development"]
+        )
+
+    def test_drops_tags_without_slug(self):
+        self.assertEqual(normalize_tags(["", "   ", "!!!", "go"]), ["go"])
+
+    def test_none_is_empty(self):
+        self.assertEqual(normalize_tags(None), [])
+
+
+class BuildTagLookupQueryTest(unittest.TestCase):
+
+    def test_one_aliased_field_per_slug(self):
+        query = build_tag_lookup_query(2)
+
+        self.assertIn("query LookupTags($slug0: String!, $slug1: String!)", query)
+        self.assertIn("t0: tag(slug: $slug0)", query)
+        self.assertIn("t1: tag(slug: $slug1)", query)
+
+
+class TagResolverTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.graphql = FakeGraphQL()
+        self.resolver = TagResolver(post_graphql=self.graphql, ttl_seconds=60)
+
+    async def test_known_tags_by_id_and_new_tags_by_name(self):
+        inputs = await self.resolver.publish_inputs(["Python", "python", "Brand New Tag"])
+
+        self.assertEqual(inputs, {
+            "python": {"id": "tag-python"},
+            "brand-new-tag": {"name": "Brand New Tag", "slug": "brand-new-tag"}
+        })
+        self.assertEqual(len(self.graphql.requests), 1)
+
+    async def test_results_are_cached_including_unknown_tags(self):
+        await self.resolver.publish_inputs(["python", "brand-new"])
+        await self.resolver.publish_inputs(["Python", "Brand New"])
+
+        self.assertEqual(len(self.graphql.requests), 1)
+
+    async def test_only_uncached_slugs_are_looked_up(self):
+        await self.resolver.resolve(["python"])
+        resolved = await self.resolver.resolve(["python", "web-development"])
+
+        self.assertEqual(resolved["web-development"].id, "tag-web")
+        self.assertEqual(self.graphql.requests[1]["variables"], {"slug0": "web-development"})
+
+    async def test_expired_results_are_looked_up_again(self):
+        resolver = TagResolver(post_graphql=self.graphql, ttl_seconds=0)
+
+        await resolver.resolve(["python"])
+        await resolver.resolve(["python"])
+
+        self.assertEqual(len(self.graphql.requests), 2)
+
+    async def test_concurrent_lookups_share_one_request(self):
+        self.graphql.release.clear()
+        lookups = [asyncio.create_task(self.resolver.resolve(["web-development", "python"])) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.graphql.release.set()
+
+        results = await asyncio.gather(*lookups)
+
+        self.assertEqual(len(self.graphql.requests), 1)
+        self.assertTrue(all(result["python"].id == "tag-python" for result in results))
+
+    async def test_failed_lookup_falls_back_to_names_and_is_not_cached(self):
+        self.graphql.fail = True
+        with self.assertLogs("agent.services.tag_service", level="WARNING"):
+            inputs = await self.resolver.publish_inputs(["Python"])
+        self.assertEqual(inputs, {"python": {"name": "Python", "slug": "python"}})
+
+        self.graphql.fail = False
+        inputs = await self.resolver.publish_inputs(["Python"])
+        self.assertEqual(inputs, {"python": {"id": "tag-python"}})
+
+    async def test_graphql_errors_fall_back_to_names(self):
+        async def rejecting(payload: Dict[str, Any]) -> Dict[str, Any]:
+            return {"errors": [{"message": "Rate limited"}]}
+
+        resolver = TagResolver(post_graphql=rejecting, ttl_seconds=60)
+
+        with self.assertLogs("agent.services.tag_service", level="WARNING"):
+            self.assertEqual(await resolver.resolve(["python"]), {"python": None})
+
+    async def test_no_tags_makes_no_request(self):
+        self.assertEqual(await self.resolver.publish_inputs([]), {})
+        self.assertEqual(await self.resolver.publish_inputs(None), {})
+        self.assertEqual(self.graphql.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
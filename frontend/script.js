@@ -129,7 +129,7 @@ async function handleGenerateSubmit(event) {
     showLoading('Generating blog post with AI...');
     
     try {
-        const response = await fetch(`${API_BASE_URL}/blog/generate`, {
+        const response = await fetch(`${API_BASE_URL}/blog/generate/stream`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -141,15 +141,32 @@ async function handleGenerateSubmit(event) {
             }),
         });
         
-        const data = await response.json();
+        if (!response.ok) {
+            throw new Error(`Server returned ${response.status}`);
+        }
+        
+        let content = '';
+        let data = null;
+        
+        await readEventStream(response, (eventName, payload) => {
+            if (eventName === 'chunk') {
+                // Hide the overlay as soon as the first chunk arrives
+                hideLoading();
+                content += payload.text;
+                displayStreamingPreview(title, content);
+            } else {
+                data = payload;
+            }
+        });
         
         hideLoading();
         
-        if (data.success) {
+        if (data && data.success) {
             displayGenerateResult(data);
             showMessage(document.getElementById('generate'), 'success', 'Blog post generated successfully!');
         } else {
-            showMessage(document.getElementById('generate'), 'error', `Generation failed: ${data.message}`);
+            const message = data ? data.message : 'Stream ended unexpectedly';
+            showMessage(document.getElementById('generate'), 'error', `Generation failed: ${message}`);
         }
         
     } catch (error) {
@@ -158,6 +175,40 @@ async function handleGenerateSubmit(event) {
     }
 }
 
+// Read a Server-Sent Events response body, calling onEvent(name, data) per event
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        
+        buffer += decoder.decode(value, { stream: true });
+        
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const frame = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            
+            let eventName = 'message';
+            let dataLines = [];
+            frame.split('\n').forEach(line => {
+                if (line.startsWith('event: ')) {
+                    eventName = line.slice(7);
+                } else if (line.startsWith('data: ')) {
+                    dataLines.push(line.slice(6));
+                }
+            });
+            
+            if (dataLines.length > 0) {
+                onEvent(eventName, JSON.parse(dataLines.join('\n')));
+            }
+        }
+    }
+}
+
 async function handlePublishSubmit(event) {
     event.preventDefault();
     
@@ -232,7 +283,7 @@ async function handleComboSubmit(event) {
         
         if (data.success) {
             displayComboResult(data);
-            showMessage(document.getElementById('combo'), 'success', 'Blog post generated and published successfully!');
+            showMessage(document.getElementById('combo'), 'success', data.message);
             event.target.reset(); // Clear the form
         } else {
             showMessage(document.getElementById('combo'), 'error', `Process failed: ${data.message}`);
@@ -260,6 +311,7 @@ function displayGenerateResult(data) {
             <p><strong>Title:</strong> ${blogPost.title}</p>
             <p><strong>Tags:</strong> ${formatTags(blogPost.tags) || 'None'}</p>
             <p><strong>Generation Time:</strong> ${data.generation_time_seconds?.toFixed(2)}s</p>
+            ${blogPost.metadata ? `<p><strong>Length:</strong> ${blogPost.metadata.word_count} words, ${blogPost.metadata.reading_time_minutes} min read</p>` : ''}
             ${blogPost.summary ? `<p><strong>Summary:</strong> ${blogPost.summary}</p>` : ''}
         </div>
         <div class="content-preview">
@@ -282,6 +334,25 @@ function displayGenerateResult(data) {
     resultCard.style.display = 'block';
 }
 
+function displayStreamingPreview(title, content) {
+    const resultCard = document.getElementById('generateResult');
+    const preview = document.getElementById('generatePreview');
+    
+    preview.innerHTML = `
+        <div class="blog-info">
+            <h4>Blog Post Details</h4>
+            <p><strong>Title:</strong> ${title}</p>
+            <p><em>Generating...</em></p>
+        </div>
+        <div class="content-preview">
+            <h4>Content Preview</h4>
+            <div class="blog-preview">${markdownToHtml(content)}</div>
+        </div>
+    `;
+    
+    resultCard.style.display = 'block';
+}
+
 function displayPublishResult(data) {
     const resultCard = document.getElementById('publishResult');
     const preview = document.getElementById('publishPreview');
@@ -314,7 +385,7 @@ function displayComboResult(data) {
     preview.innerHTML = `
         <div class="message success">
             <i class="fas fa-rocket"></i>
-            <span>Blog post generated and published successfully!</span>
+            <span>${data.message}</span>
         </div>
         <div class="combo-details">
             <h4>Generated Content</h4>
@@ -322,20 +393,7 @@ function displayComboResult(data) {
             <p><strong>Tags:</strong> ${formatTags(blogPost.tags) || 'None'}</p>
             <p><strong>Generation Time:</strong> ${data.generation_time_seconds?.toFixed(2)}s</p>
             
-            ${data.hashnode_url ? `
-                <h4 style="margin-top: 20px;">Publication Details</h4>
-                <p><strong>Published URL:</strong> <a href="${data.hashnode_url}" target="_blank" class="link">${data.hashnode_url}</a></p>
-                <div style="margin-top: 15px;">
-                    <a href="${data.hashnode_url}" target="_blank" class="btn btn-accent">
-                        <i class="fas fa-external-link-alt"></i> View Published Post
-                    </a>
-                </div>
-            ` : `
-                <div class="message error" style="margin-top: 20px;">
-                    <i class="fas fa-exclamation-triangle"></i>
-                    <span>Blog post was generated but publishing failed. Check the logs for details.</span>
-                </div>
-            `}
+            <div id="comboPublication">${publicationDetails(data.hashnode_url, data.publish_status)}</div>
             
             <div class="content-preview" style="margin-top: 20px;">
                 <h4>Content Preview</h4>
@@ -345,6 +403,65 @@ function displayComboResult(data) {
     `;
     
     resultCard.style.display = 'block';
+    
+    if (!data.hashnode_url && data.outbox_id) {
+        pollOutbox(data.outbox_id);
+    }
+}
+
+function publicationDetails(url, status, error) {
+    if (url) {
+        return `
+            <h4 style="margin-top: 20px;">Publication Details</h4>
+            <p><strong>Published URL:</strong> <a href="${url}" target="_blank" class="link">${url}</a></p>
+            <div style="margin-top: 15px;">
+                <a href="${url}" target="_blank" class="btn btn-accent">
+                    <i class="fas fa-external-link-alt"></i> View Published Post
+                </a>
+            </div>
+        `;
+    }
+    
+    if (status === 'pending' || status === 'publishing') {
+        return `
+            <div class="message info" style="margin-top: 20px;">
+                <i class="fas fa-spinner fa-spin"></i>
+                <span>Queued for publishing (${status})...</span>
+            </div>
+        `;
+    }
+    
+    return `
+        <div class="message error" style="margin-top: 20px;">
+            <i class="fas fa-exclamation-triangle"></i>
+            <span>Blog post was generated but publishing failed${error ? `: ${error}` : '. Check the logs for details.'}</span>
+        </div>
+    `;
+}
+
+// Poll the publish outbox until a queued post is published or gives up
+async function pollOutbox(outboxId) {
+    const container = document.getElementById('comboPublication');
+    
+    while (container.isConnected) {
+        await new Promise(resolve => setTimeout(resolve, 2000));
+        
+        try {
+            const response = await fetch(`${API_BASE_URL}/blog/outbox/${outboxId}`);
+            if (!response.ok) {
+                continue;
+            }
+            
+            const entry = await response.json();
+            container.innerHTML = publicationDetails(entry.post_url, entry.status, entry.last_error);
+            
+            if (entry.status === 'published' || entry.status === 'failed') {
+                return;
+            }
+        } catch (error) {
+            console.error('Outbox poll failed:', error);
+        }
+    }
 }
 
 // Utility function to copy generated content to publish form